@@ -0,0 +1,20 @@
+"""
+Headless benchmark suite for the storage and rendering hot paths.
+
+Runs without a Flet client: UI builders get a ``StubPage`` that records the
+controls and update calls, and every run uses synthetic task sets in a
+temporary data directory (``data/`` is never touched).
+
+Usage::
+
+    python -m benchmarks                                  # all cases, 100/1k/10k/100k tasks
+    python -m benchmarks --sizes 100,1000 --only storage  # subset
+    python -m benchmarks -o results.json                  # machine-readable results
+    python -m benchmarks --baseline results.json --threshold 0.2
+
+With ``--baseline`` the run exits with status 1 if any case is slower than
+the baseline by more than the threshold (a fraction: 0.2 = 20%).
+
+``ui.build_task_list`` builds every card (it is not virtualized): at 100k
+tasks one sample takes about a minute and several GB of memory.
+"""
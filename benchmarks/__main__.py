@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Run from anywhere: the app's packages live next to this directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.run import main  # noqa: E402
+
+sys.exit(main())
@@ -0,0 +1,312 @@
+"""
+Benchmark cases. Each case takes the task-set size and a ``measure`` function
+and returns its samples (seconds per operation).
+
+``measure(fn, setup=None, ops=1)`` times ``fn()`` (or ``fn(setup())`` when a
+setup is given, with the setup untimed) several times and divides each
+sample by ``ops``, for cases that time a batch of small operations.
+"""
+import itertools
+import os
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fixtures import make_tasks, write_store
+from benchmarks.stub import StubPage, StubPubSub
+from core import storage, transfer, utils
+from core.store import reset_task_store
+from ui.task_list import build_task_list
+from ui.theme import LiveTheme, THEME_KEYS
+from ui.tasks import build_task_section
+
+# Operations per sample for the per-call cases (mutations, card rendering)
+BATCH_OPS = 100
+
+Measure = Callable[..., List[float]]
+
+CASES: Dict[str, Callable[[int, Measure], List[float]]] = {}
+
+
+def case(name: str):
+    """Register a benchmark case under ``name``."""
+    def register(fn):
+        CASES[name] = fn
+        return fn
+    return register
+
+
+def _noop(*args: Any) -> None:
+    pass
+
+
+def _fresh_tasks(tasks: List[Dict[str, Any]]) -> Callable[[], storage.TaskList]:
+    """Setup that resets the store to ``tasks`` and loads it, with no write pending."""
+    def setup():
+        write_store(tasks)
+        return storage.load_tasks()
+    return setup
+
+
+def _new_store() -> None:
+    """Start the next section from an empty shared store, as in a fresh process."""
+    reset_task_store()
+    StubPubSub.reset()
+
+
+def _mount_section(page: StubPage):
+    """Build the Tasks section and add it to ``page``; the stub loads the tasks synchronously on mount."""
+    input_container, task_list_container, _, handlers = build_task_section(page, LiveTheme("light_blue"))
+    page.add(input_container, task_list_container)
+    return handlers
+
+
+def _build_section(size: int):
+    """Build and mount the Tasks section on a stub page; return its handler dict."""
+    write_store(make_tasks(size))
+    _new_store()
+    return _mount_section(StubPage())
+
+
+# --- core/storage -----------------------------------------------------------
+
+@case("storage.load_json")
+def load_json(size: int, measure: Measure) -> List[float]:
+    tasks = make_tasks(size)
+    return measure(lambda _: storage.load_tasks(), setup=lambda: write_store(tasks))
+
+
+@case("storage.load_cached")
+def load_cached(size: int, measure: Measure) -> List[float]:
+    write_store(make_tasks(size))
+    storage.load_tasks()  # writes the cache
+    return measure(storage.load_tasks)
+
+
+@case("storage.load_stream")
+def load_stream(size: int, measure: Measure) -> List[float]:
+    tasks = make_tasks(size)
+
+    def run(_):
+        for _ in storage.load_tasks_incrementally(storage.TaskList()):
+            pass
+
+    return measure(run, setup=lambda: write_store(tasks))
+
+
+@case("storage.load_first_batch")
+def load_first_batch(size: int, measure: Measure) -> List[float]:
+    tasks = make_tasks(size)
+
+    def setup():
+        write_store(tasks)
+        return storage.load_tasks_incrementally(storage.TaskList())
+
+    # Time until the first screenful is in the list (the abandoned generator is closed)
+    return measure(next, setup=setup)
+
+
+@case("storage.save")
+def save(size: int, measure: Measure) -> List[float]:
+    tasks = _fresh_tasks(make_tasks(size))()
+
+    def run():
+        storage.save_tasks(tasks)
+        storage.flush_tasks()
+
+    return measure(run)
+
+
+@case("storage.add_task")
+def add_task(size: int, measure: Measure) -> List[float]:
+    def run(tasks):
+        for i in range(BATCH_OPS):
+            storage.add_task(tasks, f"Benchmark {i}", mata_kuliah="Data Sains", deadline="2025-06-01")
+
+    return measure(run, setup=_fresh_tasks(make_tasks(size)), ops=BATCH_OPS)
+
+
+@case("storage.toggle_task")
+def toggle_task(size: int, measure: Measure) -> List[float]:
+    tasks = _fresh_tasks(make_tasks(size))()
+    ids = list(itertools.islice((t["id"] for t in tasks), BATCH_OPS))
+
+    def run():
+        for task_id in itertools.islice(itertools.cycle(ids), BATCH_OPS):
+            storage.toggle_task(tasks, task_id)
+        storage.flush_tasks()
+
+    # Flushing is part of the sample so the journal never outgrows one batch
+    return measure(run, ops=BATCH_OPS)
+
+
+@case("storage.update_task")
+def update_task(size: int, measure: Measure) -> List[float]:
+    tasks = _fresh_tasks(make_tasks(size))()
+    ids = list(itertools.islice((t["id"] for t in tasks), BATCH_OPS))
+
+    def run():
+        for i, task_id in enumerate(itertools.islice(itertools.cycle(ids), BATCH_OPS)):
+            storage.update_task(tasks, task_id, title=f"Renamed {i}")
+        storage.flush_tasks()
+
+    return measure(run, ops=BATCH_OPS)
+
+
+@case("storage.delete_task")
+def delete_task(size: int, measure: Measure) -> List[float]:
+    ops = min(BATCH_OPS, size)
+
+    def run(tasks):
+        for task_id in [t["id"] for t in itertools.islice(tasks, ops)]:
+            storage.delete_task(tasks, task_id)
+
+    return measure(run, setup=_fresh_tasks(make_tasks(size)), ops=ops)
+
+
+# --- core/transfer ----------------------------------------------------------
+
+def _import(size: int, measure: Measure, fmt: str) -> List[float]:
+    """Time importing a ``size``-task ``fmt`` file into an empty store, through to the write."""
+    path = os.path.join(storage.DATA_DIR, f"import.{fmt}")
+    transfer.export_tasks(path, storage.TaskList(make_tasks(size)))
+
+    def run(tasks):
+        transfer.import_tasks(path, tasks, workers=1)
+        storage.flush_tasks()
+
+    return measure(run, setup=_fresh_tasks([]))
+
+
+def _export(size: int, measure: Measure, fmt: str) -> List[float]:
+    tasks = storage.TaskList(make_tasks(size))
+    path = os.path.join(storage.DATA_DIR, f"export.{fmt}")
+    return measure(lambda: transfer.export_tasks(path, tasks))
+
+
+@case("transfer.import[csv]")
+def import_csv(size: int, measure: Measure) -> List[float]:
+    return _import(size, measure, "csv")
+
+
+@case("transfer.import[jsonl]")
+def import_jsonl(size: int, measure: Measure) -> List[float]:
+    return _import(size, measure, "jsonl")
+
+
+@case("transfer.import[ics]")
+def import_ics(size: int, measure: Measure) -> List[float]:
+    return _import(size, measure, "ics")
+
+
+@case("transfer.export[csv]")
+def export_csv(size: int, measure: Measure) -> List[float]:
+    return _export(size, measure, "csv")
+
+
+@case("transfer.export[ics]")
+def export_ics(size: int, measure: Measure) -> List[float]:
+    return _export(size, measure, "ics")
+
+
+# --- ui/tasks and ui/task_list ----------------------------------------------
+
+@case("ui.build_task_section")
+def task_section(size: int, measure: Measure) -> List[float]:
+    # First session, up to the placeholder list: should not grow with the store
+    write_store(make_tasks(size))
+    return measure(lambda _: build_task_section(StubPage(), LiveTheme("light_blue")), setup=_new_store)
+
+
+@case("ui.load_task_section")
+def load_task_section(size: int, measure: Measure) -> List[float]:
+    # Build, mount and load every task (the worker runs inline on the stub)
+    tasks = make_tasks(size)
+
+    def setup():
+        write_store(tasks)
+        _new_store()
+
+    return measure(lambda _: _mount_section(StubPage()), setup=setup)
+
+
+@case("ui.join_task_section")
+def join_task_section(size: int, measure: Measure) -> List[float]:
+    # Another session opening the app: renders the loaded shared store, no disk I/O
+    _build_section(size)
+    return measure(lambda: _mount_section(StubPage()))
+
+
+def _view_switch(size: int, measure: Measure, view: str) -> List[float]:
+    """Time ``build_task_ui`` right after switching the view selector to ``view``."""
+    handlers = _build_section(size)
+    dropdown = handlers["view_dropdown"]
+    other = "By Subject" if view == "By Deadline" else "By Deadline"
+
+    def setup():
+        dropdown.value = other
+        handlers["build_task_ui"]()
+        dropdown.value = view
+
+    return measure(lambda _: handlers["build_task_ui"](), setup=setup)
+
+
+@case("ui.build_task_ui[deadline]")
+def build_ui_deadline(size: int, measure: Measure) -> List[float]:
+    return _view_switch(size, measure, "By Deadline")
+
+
+@case("ui.build_task_ui[subject]")
+def build_ui_subject(size: int, measure: Measure) -> List[float]:
+    return _view_switch(size, measure, "By Subject")
+
+
+@case("ui.render_task_card")
+def render_task_card(size: int, measure: Measure) -> List[float]:
+    handlers = _build_section(size)
+    render = handlers["render_task_card"]
+    sample = list(itertools.islice(handlers["tasks"], BATCH_OPS))
+
+    def run():
+        for task in sample:
+            render(task)
+
+    return measure(run, ops=len(sample))
+
+
+@case("ui.build_task_list")
+def task_list(size: int, measure: Measure) -> List[float]:
+    tasks = make_tasks(size)
+    return measure(lambda: build_task_list(tasks, _noop, _noop, _noop))
+
+
+# --- core/utils -------------------------------------------------------------
+
+@case("utils.format_date")
+def format_date(size: int, measure: Measure) -> List[float]:
+    deadlines = [t["deadline"] for t in make_tasks(size)]
+    return measure(lambda: [utils.format_date(d) for d in deadlines])
+
+
+@case("utils.deadline_status")
+def deadline_status(size: int, measure: Measure) -> List[float]:
+    deadlines = [t["deadline"] for t in make_tasks(size)]
+    return measure(lambda: [utils.deadline_status(d) for d in deadlines])
+
+
+@case("utils.classify_deadlines")
+def classify_deadlines(size: int, measure: Measure) -> List[float]:
+    deadlines = [t["deadline"] for t in make_tasks(size)]
+    return measure(lambda: utils.classify_deadlines(deadlines))
+
+
+# --- main -------------------------------------------------------------------
+
+@case("main.apply_theme")
+def apply_theme(size: int, measure: Measure) -> List[float]:
+    import main
+
+    write_store(make_tasks(size))
+    _new_store()
+    page = StubPage()
+    main.main(page)
+    keys = itertools.cycle(THEME_KEYS[1:] + THEME_KEYS[:1])
+    return measure(lambda: page.apply_theme(next(keys)))
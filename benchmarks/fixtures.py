@@ -0,0 +1,52 @@
+"""Synthetic task sets and an isolated data directory for benchmark runs."""
+import json
+import os
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+from core import sessions, storage
+from ui.tasks import SUBJECT_OPTIONS
+
+
+def make_tasks(n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """``n`` tasks shaped like data/tasks.json, with deadlines spread around today."""
+    rng = random.Random(seed)
+    today = date.today()
+    tasks = []
+    for i in range(n):
+        if rng.random() < 0.1:
+            deadline = "No deadline"
+        else:
+            deadline = (today + timedelta(days=rng.randint(-60, 120))).isoformat()
+        tasks.append({
+            "id": f"bench-{i:07d}",
+            "title": f"Task {i} {rng.choice(['laporan', 'tugas', 'kuis', 'praktikum', 'review'])}",
+            "mata_kuliah": rng.choice(SUBJECT_OPTIONS + [""]),
+            "deadline": deadline,
+            "deskripsi": "catatan " * rng.randint(0, 12),
+            "done": rng.random() < 0.3,
+        })
+    return tasks
+
+
+def use_data_dir(path: str) -> None:
+    """Point storage and the session log at ``path`` instead of data/."""
+    storage.DATA_DIR = path
+    storage.DATA_FILE = os.path.join(path, "tasks.json")
+    storage.JOURNAL_FILE = os.path.join(path, "tasks.journal")
+    storage.CACHE_FILE = os.path.join(path, "tasks.cache")
+    storage.LOCK_FILE = os.path.join(path, "tasks.lock")
+    sessions.SESSIONS_FILE = os.path.join(path, "sessions.jsonl")
+    sessions.STATS_FILE = os.path.join(path, "sessions_stats.json")
+
+
+def write_store(tasks: List[Dict[str, Any]]) -> None:
+    """Replace the task store with ``tasks`` (snapshot only: no journal, no cache)."""
+    storage.flush_tasks()
+    storage.ensure_data_dir()
+    for path in (storage.JOURNAL_FILE, storage.CACHE_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+    with open(storage.DATA_FILE, "w", encoding="utf-8") as f:
+        json.dump(tasks, f, ensure_ascii=False, indent=2)
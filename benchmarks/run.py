@@ -0,0 +1,143 @@
+"""Benchmark runner: times the cases, writes JSON results and checks them against a baseline."""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+DEFAULT_REPEAT = 5
+# Stop repeating a case once its samples add up to this many seconds (at least one sample is taken)
+DEFAULT_BUDGET = 3.0
+DEFAULT_THRESHOLD = 0.25
+# Differences below this are timer noise, never regressions (milliseconds)
+NOISE_FLOOR_MS = 0.05
+
+
+def make_measure(repeat: int, budget: float) -> Callable[..., List[float]]:
+    """Build the ``measure`` function handed to the cases (see benchmarks.cases)."""
+
+    def measure(fn: Callable[..., Any], setup: Optional[Callable[[], Any]] = None, ops: int = 1) -> List[float]:
+        samples: List[float] = []
+        spent = 0.0
+        while len(samples) < repeat and (not samples or spent < budget):
+            arg = setup() if setup is not None else None
+            start = time.perf_counter()
+            fn(arg) if setup is not None else fn()
+            elapsed = time.perf_counter() - start
+            spent += elapsed
+            samples.append(elapsed / max(ops, 1))
+        return samples
+
+    return measure
+
+
+def run(sizes: List[int], pattern: str = "*", repeat: int = DEFAULT_REPEAT, budget: float = DEFAULT_BUDGET) -> Dict[str, Any]:
+    """
+    Run every case matching ``pattern`` at each size in a temporary data directory.
+
+    Returns:
+        dict with "meta" (environment) and "results": one entry per case and
+        size with min_ms, median_ms and the number of samples.
+    """
+    from benchmarks.fixtures import use_data_dir
+    from benchmarks.cases import CASES
+    from core import sessions, storage
+
+    measure = make_measure(repeat, budget)
+    results = []
+    data_dir = tempfile.mkdtemp(prefix="productivity-bench-")
+    saved = storage.DATA_DIR
+    try:
+        use_data_dir(data_dir)
+        for size in sizes:
+            for name, fn in CASES.items():
+                if not fnmatch.fnmatch(name, pattern) and pattern not in name:
+                    continue
+                samples = [s * 1000 for s in fn(size, measure)]
+                storage.flush_tasks()
+                entry = {
+                    "name": name,
+                    "size": size,
+                    "min_ms": round(min(samples), 4),
+                    "median_ms": round(statistics.median(samples), 4),
+                    "samples": len(samples),
+                }
+                results.append(entry)
+                print(f"{name:<28} {size:>7}  min {entry['min_ms']:>10.3f} ms  median {entry['median_ms']:>10.3f} ms  ({len(samples)}x)", flush=True)
+    finally:
+        storage.flush_tasks()
+        sessions.flush_sessions()
+        use_data_dir(saved)
+        shutil.rmtree(data_dir, ignore_errors=True)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": int(time.time()),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Cases that got slower than the baseline by more than ``threshold`` (a fraction).
+
+    Compares the fastest sample of each case/size present in both runs.
+    """
+    previous = {(r["name"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in current["results"]:
+        old = previous.get((r["name"], r["size"]))
+        if old is None:
+            continue
+        limit = old["min_ms"] * (1 + threshold)
+        if r["min_ms"] > limit and r["min_ms"] - old["min_ms"] > NOISE_FLOOR_MS:
+            regressions.append(
+                f"{r['name']} @ {r['size']}: {old['min_ms']:.3f} ms -> {r['min_ms']:.3f} ms "
+                f"(+{(r['min_ms'] / old['min_ms'] - 1) * 100:.0f}%, limit +{threshold * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Headless storage and rendering benchmarks.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma-separated task counts")
+    parser.add_argument("--only", default="*", help="run cases matching this glob or substring (e.g. 'storage.*')")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="samples per case")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="max seconds of samples per case")
+    parser.add_argument("-o", "--output", help="write JSON results to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown vs the baseline as a fraction (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    current = run(sizes, args.only, args.repeat, args.budget)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        if not os.path.exists(args.baseline):
+            print(f"Baseline {args.baseline} not found", file=sys.stderr)
+            return 2
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print("\nRegressions:", file=sys.stderr)
+            for line in regressions:
+                print("  " + line, file=sys.stderr)
+            return 1
+        print(f"\nNo regressions beyond {args.threshold * 100:.0f}%")
+    return 0
@@ -0,0 +1,92 @@
+"""Stub Flet page for running the UI builders without a client."""
+import itertools
+from typing import Any, Callable, Dict, List
+
+import flet as ft
+
+_session_ids = itertools.count(1)
+
+
+def count_controls(control: ft.Control) -> int:
+    """Number of controls in the subtree rooted at ``control``."""
+    count, stack = 0, [control]
+    while stack:
+        c = stack.pop()
+        count += 1
+        stack.extend(c._get_children())
+    return count
+
+
+class StubPubSub:
+    """
+    Stand-in for ``page.pubsub``: messages go synchronously to the handlers of
+    every subscribed stub page (Flet's hub is likewise shared by all sessions).
+    """
+
+    _handlers: Dict[str, Dict[str, Callable[[str, Any], None]]] = {}  # topic -> session id -> handler
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop every subscription (pages from earlier cases stop receiving)."""
+        cls._handlers.clear()
+
+    def subscribe_topic(self, topic: str, handler: Callable[[str, Any], None]) -> None:
+        self._handlers.setdefault(topic, {})[self.session_id] = handler
+
+    def unsubscribe_all(self) -> None:
+        for handlers in self._handlers.values():
+            handlers.pop(self.session_id, None)
+
+    def send_all_on_topic(self, topic: str, message: Any) -> None:
+        for handler in list(self._handlers.get(topic, {}).values()):
+            handler(topic, message)
+
+    def send_others_on_topic(self, topic: str, message: Any) -> None:
+        for session_id, handler in list(self._handlers.get(topic, {}).items()):
+            if session_id != self.session_id:
+                handler(topic, message)
+
+
+class StubPage:
+    """
+    Stand-in for ``ft.Page``: records added controls and update calls.
+
+    ``updates`` holds one entry per ``update()`` call with the number of
+    controls it would have sent (the whole page for a bare ``update()``).
+    """
+
+    def __init__(self):
+        self.overlay: List[ft.Control] = []
+        self.controls: List[ft.Control] = []
+        self.updates: List[int] = []
+        self.session_id = f"benchmark-{next(_session_ids)}"
+        self.pubsub = StubPubSub(self.session_id)
+
+    def add(self, *controls: ft.Control) -> None:
+        self.controls.extend(controls)
+        # Like Flet, tell every new control it is mounted (sections start loading there)
+        stack = list(controls)
+        while stack:
+            control = stack.pop()
+            control.did_mount()
+            stack.extend(control._get_children())
+
+    def clean(self) -> None:
+        self.controls.clear()
+
+    def update(self, *controls: ft.Control) -> None:
+        roots = controls or self.controls
+        self.updates.append(sum(count_controls(c) for c in roots))
+
+    def open(self, control: ft.Control) -> None:
+        self.overlay.append(control)
+
+    def run_task(self, handler: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        # No event loop: async work (timers, debounced search) is not exercised
+        pass
+
+    def run_thread(self, handler: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        handler(*args, **kwargs)
@@ -0,0 +1,301 @@
+"""
+Incrementally maintained task indexes.
+
+Indexes are attached to a ``TaskList`` with ``add_index`` and are kept up to
+date by its ``append``/``update``/``remove`` methods, so views can read a
+ready-made grouping instead of regrouping every task on each render.
+
+An index implements ``extend(entries)`` (bulk load of ``(task, seq)`` pairs
+in seq order), ``add(task, seq)``, ``update(task, seq)`` and
+``remove(task, seq)``; ``seq`` is the task's position in insertion order.
+``update`` gets the task's new record (``TaskList.update`` replaces records
+instead of changing them in place). ``reorder(entries)`` is called with
+every ``(task, seq)`` pair after ``TaskList.reorder`` renumbered them.
+"""
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_MISSING = object()
+
+# Members per chunk of a group's member list; a change copies one chunk
+CHUNK_SIZE = 256
+
+
+class Members(Sequence):
+    """
+    Immutable member list of one group, stored in chunks of up to CHUNK_SIZE.
+
+    ``replace``/``insert``/``delete`` return a new list that shares every
+    chunk but the one they touch, so a change costs O(CHUNK_SIZE + n /
+    CHUNK_SIZE) while readers keep the old list unchanged; indexing bisects
+    the chunk starts.
+    """
+
+    __slots__ = ("_chunks", "_starts", "_len")
+
+    def __init__(self, chunks: Tuple[tuple, ...] = (), starts: Tuple[int, ...] = (), length: int = 0):
+        self._chunks = chunks  # member tuples
+        self._starts = starts  # position of each chunk's first member
+        self._len = length
+
+    @classmethod
+    def of(cls, tasks: Iterable[Dict[str, Any]]) -> "Members":
+        """Members holding ``tasks`` in order."""
+        return cls().extend(tasks)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("member index out of range")
+        c = bisect_right(self._starts, index) - 1
+        return self._chunks[c][index - self._starts[c]]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (Members, list, tuple)):
+            return self._len == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Members({list(self)!r})"
+
+    def _chunk_at(self, pos: int) -> int:
+        return max(bisect_right(self._starts, pos) - 1, 0)
+
+    def _splice(self, c: int, count: int, pieces: Tuple[tuple, ...], delta: int) -> "Members":
+        """Replace ``count`` chunks from chunk ``c`` with ``pieces``."""
+        chunks = self._chunks[:c] + pieces + self._chunks[c + count:]
+        starts = list(self._starts[:c])
+        pos = self._starts[c] if c < len(self._starts) else self._len
+        for chunk in chunks[c:]:
+            starts.append(pos)
+            pos += len(chunk)
+        return Members(chunks, tuple(starts), self._len + delta)
+
+    def replace(self, pos: int, task: Dict[str, Any]) -> "Members":
+        """Copy with the member at ``pos`` replaced by ``task``."""
+        c = self._chunk_at(pos)
+        chunk = list(self._chunks[c])
+        chunk[pos - self._starts[c]] = task
+        return Members(self._chunks[:c] + (tuple(chunk),) + self._chunks[c + 1:], self._starts, self._len)
+
+    def insert(self, pos: int, task: Dict[str, Any]) -> "Members":
+        """Copy with ``task`` inserted before position ``pos``."""
+        if not self._chunks:
+            return Members(((task,),), (0,), 1)
+        c = self._chunk_at(pos)
+        chunk = list(self._chunks[c])
+        chunk.insert(pos - self._starts[c], task)
+        if len(chunk) > CHUNK_SIZE:
+            half = len(chunk) // 2
+            pieces = (tuple(chunk[:half]), tuple(chunk[half:]))
+        else:
+            pieces = (tuple(chunk),)
+        return self._splice(c, 1, pieces, 1)
+
+    def delete(self, pos: int) -> "Members":
+        """Copy without the member at ``pos``."""
+        c = self._chunk_at(pos)
+        chunk = self._chunks[c]
+        offset = pos - self._starts[c]
+        rest = chunk[:offset] + chunk[offset + 1:]
+        # Fold a small remainder into the next chunk so chunks stay well filled
+        if c + 1 < len(self._chunks) and len(rest) + len(self._chunks[c + 1]) <= CHUNK_SIZE // 2:
+            return self._splice(c, 2, (rest + self._chunks[c + 1],), -1)
+        return self._splice(c, 1, (rest,) if rest else (), -1)
+
+    def extend(self, tasks: Iterable[Dict[str, Any]]) -> "Members":
+        """Copy with ``tasks`` appended (only the last chunk is rebuilt)."""
+        tail = self._chunks[-1] if self._chunks else ()
+        items = tail + tuple(tasks)
+        if len(items) == len(tail):
+            return self
+        pieces = tuple(items[i:i + CHUNK_SIZE] for i in range(0, len(items), CHUNK_SIZE))
+        c = len(self._chunks) - 1 if self._chunks else 0
+        return self._splice(c, 1 if self._chunks else 0, pieces, len(items) - len(tail))
+
+
+_EMPTY = Members()
+
+
+class GroupIndex:
+    """
+    Tasks grouped by a key, with groups and group members kept in order.
+
+    Groups are ordered by ``sort_key(key)`` and members by insertion order.
+    Adding, moving or removing a task costs O(log n) searches plus a copy of
+    one chunk of its group's ``Members``; nothing else is copied.
+
+    Member lists are immutable and a change only bumps ``version``; the
+    next ``groups()`` call publishes the new grouping (O(groups), once per
+    version) under the index's lock. So ``groups()`` may be read from other
+    threads while the task list changes: a reader keeps the consistent
+    grouping it got.
+    """
+
+    def __init__(self, key_fn: Callable[[Dict[str, Any]], Any], sort_key: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize index.
+
+        Args:
+            key_fn: returns the group key of a task
+            sort_key: orders group keys (defaults to the key itself)
+        """
+        self.key_fn = key_fn
+        self.sort_key = sort_key or (lambda key: key)
+        self.version = 0  # bumped whenever groups or members change
+        self._keys: List[Any] = []  # group keys in display order
+        self._key_order: List[Any] = []  # sort_key of each entry in _keys
+        self._seqs: Dict[Any, List[int]] = {}  # key -> member seqs (sorted)
+        self._members: Dict[Any, Members] = {}  # key -> member tasks
+        self._key_of: Dict[Any, Any] = {}  # task id -> current key
+        self._view: List[Tuple[Any, Members]] = []  # published (key, members) pairs
+        self._view_version = 0  # version the published view shows
+        self._lock = threading.Lock()  # held by writers and while publishing
+
+    def __len__(self) -> int:
+        return len(self._key_of)
+
+    def _publish(self) -> None:
+        """Mark the grouping changed; ``groups()`` publishes it on the next read."""
+        self.version += 1
+
+    def extend(self, entries: Iterable[Tuple[Dict[str, Any], int]]) -> None:
+        """Bulk-load (task, seq) pairs given in seq order, after any existing members."""
+        with self._lock:
+            self._extend(entries)
+
+    def _extend(self, entries: Iterable[Tuple[Dict[str, Any], int]]) -> None:
+        key_fn, key_of = self.key_fn, self._key_of
+        new_seqs: Dict[Any, List[int]] = {}
+        new_members: Dict[Any, List[Dict[str, Any]]] = {}
+        for task, seq in entries:
+            key = key_fn(task)
+            try:
+                new_seqs[key].append(seq)
+                new_members[key].append(task)
+            except KeyError:
+                new_seqs[key] = [seq]
+                new_members[key] = [task]
+            key_of[task["id"]] = key
+        # One new member list per touched group and batch
+        members = self._members
+        for key, added in new_members.items():
+            if key in members:
+                self._seqs[key].extend(new_seqs[key])
+                members[key] = members[key].extend(added)
+            else:
+                self._seqs[key] = new_seqs[key]
+                members[key] = Members.of(added)
+        self._keys = sorted(self._members, key=self.sort_key)
+        self._key_order = [self.sort_key(key) for key in self._keys]
+        self._publish()
+
+    def reorder(self, entries: Iterable[Tuple[Dict[str, Any], int]]) -> None:
+        """Rebuild from (task, seq) pairs given in their new seq order."""
+        with self._lock:
+            self._keys, self._key_order = [], []
+            self._seqs, self._members, self._key_of = {}, {}, {}
+            self._extend(entries)
+
+    def add(self, task: Dict[str, Any], seq: int) -> None:
+        """Insert a task into its group."""
+        with self._lock:
+            self._add(task, seq)
+            self._publish()
+
+    def remove(self, task: Dict[str, Any], seq: int) -> None:
+        """Remove a task from its group (dropping the group when it empties)."""
+        with self._lock:
+            if self._remove(task, seq):
+                self._publish()
+
+    def update(self, task: Dict[str, Any], seq: int) -> None:
+        """Move a task to another group if its key changed, else swap in its new record."""
+        with self._lock:
+            key = self._key_of.get(task["id"], _MISSING)
+            if key != self.key_fn(task):
+                self._remove(task, seq)
+                self._add(task, seq)
+            else:
+                pos = bisect_left(self._seqs[key], seq)
+                members = self._members[key]
+                if members[pos] is task:
+                    return
+                self._members[key] = members.replace(pos, task)
+            self._publish()
+
+    def _add(self, task: Dict[str, Any], seq: int) -> None:
+        key = self.key_fn(task)
+        if key not in self._members:
+            order = self.sort_key(key)
+            pos = bisect_left(self._key_order, order)
+            self._key_order.insert(pos, order)
+            self._keys.insert(pos, key)
+            self._seqs[key] = []
+            self._members[key] = _EMPTY
+        seqs = self._seqs[key]
+        pos = bisect_left(seqs, seq)
+        seqs.insert(pos, seq)
+        self._members[key] = self._members[key].insert(pos, task)
+        self._key_of[task["id"]] = key
+
+    def _remove(self, task: Dict[str, Any], seq: int) -> bool:
+        key = self._key_of.pop(task["id"], _MISSING)
+        if key is _MISSING:
+            return False
+        seqs = self._seqs[key]
+        pos = bisect_left(seqs, seq)
+        del seqs[pos]
+        self._members[key] = self._members[key].delete(pos)
+        if not seqs:
+            order = self.sort_key(key)
+            pos = bisect_left(self._key_order, order)
+            while self._keys[pos] != key:
+                pos += 1
+            del self._key_order[pos]
+            del self._keys[pos]
+            del self._seqs[key]
+            del self._members[key]
+        return True
+
+    def groups(self) -> Iterator[Tuple[Any, Members]]:
+        """Iterate over (key, members) in display order, as of the call."""
+        view = self._view
+        if self._view_version != self.version:
+            with self._lock:
+                self._view = view = [(key, self._members[key]) for key in self._keys]
+                self._view_version = self.version
+        return iter(view)
+
+    def subset(self, tasks: Iterable[Dict[str, Any]]) -> List[Tuple[Any, List[Dict[str, Any]]]]:
+        """
+        Group just ``tasks`` (given in insertion order, e.g. search hits) like ``groups()``.
+
+        Costs O(m log m) for m tasks, independent of the size of the index.
+        """
+        members: Dict[Any, List[Dict[str, Any]]] = {}
+        for task in tasks:
+            key = self.key_fn(task)
+            try:
+                members[key].append(task)
+            except KeyError:
+                members[key] = [task]
+        return [(key, members[key]) for key in sorted(members, key=self.sort_key)]
+
+    def get(self, key: Any) -> Members:
+        """Members of one group (empty if none)."""
+        return self._members.get(key, _EMPTY)
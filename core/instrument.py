@@ -0,0 +1,195 @@
+"""
+Opt-in performance instrumentation: latency histograms, call counts,
+controls built per render and bytes written to disk.
+
+Disabled by default; enable it with the PRODUCTIVITY_INSTRUMENT=1
+environment variable or from Settings > Diagnostics. While disabled an
+instrumented call costs one flag check. Histograms have fixed buckets, so
+recording is O(1) and memory does not grow with the number of calls.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Optional, Sequence
+
+ENV_VAR = "PRODUCTIVITY_INSTRUMENT"
+
+# Bucket upper bounds; values above the last bound land in an overflow bucket
+LATENCY_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+CONTROL_BOUNDS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum, min and max."""
+
+    __slots__ = ("bounds", "buckets", "count", "total", "min", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (0-100), capped at the max seen."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4) if self.count else 0.0,
+            "min": round(self.min, 4) if self.count else 0.0,
+            "max": round(self.max, 4),
+            "p50": round(self.percentile(50), 4),
+            "p95": round(self.percentile(95), 4),
+            "p99": round(self.percentile(99), 4),
+            "bounds": list(self.bounds),
+            "buckets": list(self.buckets),
+        }
+
+
+_enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+_lock = threading.Lock()
+_latency: Dict[str, Histogram] = {}  # name -> latency histogram (ms)
+_controls: Dict[str, Histogram] = {}  # name -> controls built per render
+_bytes: Dict[str, int] = {}  # file name -> bytes written
+_since = time.time()
+
+
+def is_enabled() -> bool:
+    """Whether measurements are being recorded."""
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn recording on or off (collected data is kept)."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def reset() -> None:
+    """Drop everything recorded so far."""
+    global _since
+    with _lock:
+        _latency.clear()
+        _controls.clear()
+        _bytes.clear()
+        _since = time.time()
+
+
+def record_latency(name: str, seconds: float) -> None:
+    """Record one call of ``name`` that took ``seconds``."""
+    if not _enabled:
+        return
+    with _lock:
+        hist = _latency.get(name)
+        if hist is None:
+            hist = _latency[name] = Histogram(LATENCY_BOUNDS_MS)
+        hist.record(seconds * 1000)
+
+
+def record_controls(name: str, count: int) -> None:
+    """Record the number of controls one render pass of ``name`` built or patched."""
+    if not _enabled:
+        return
+    with _lock:
+        hist = _controls.get(name)
+        if hist is None:
+            hist = _controls[name] = Histogram(CONTROL_BOUNDS)
+        hist.record(count)
+
+
+def add_bytes(path: str, count: int) -> None:
+    """Count ``count`` bytes written to ``path`` (tracked by file name)."""
+    if not _enabled:
+        return
+    name = os.path.basename(path)
+    with _lock:
+        _bytes[name] = _bytes.get(name, 0) + count
+
+
+def timed(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator recording the latency of each call under ``name`` (while enabled)."""
+
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record_latency(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorate
+
+
+def instrument_page(page) -> None:
+    """
+    Wrap ``page.update`` to record its latency.
+
+    ``Control.update()`` goes through ``page.update`` too, so every render is
+    covered. Control counts are recorded by the render passes themselves
+    (``record_controls``), which know how many controls they built.
+    """
+    update = page.update
+
+    def instrumented_update(*controls):
+        if not _enabled:
+            return update(*controls)
+        start = time.perf_counter()
+        try:
+            return update(*controls)
+        finally:
+            record_latency("page.update", time.perf_counter() - start)
+
+    page.update = instrumented_update
+
+
+def snapshot() -> Dict[str, Any]:
+    """Everything recorded so far as JSON-ready data."""
+    with _lock:
+        return {
+            "enabled": _enabled,
+            "since": _since,
+            "now": time.time(),
+            "latency_ms": {name: h.to_dict() for name, h in sorted(_latency.items())},
+            "controls_per_render": {name: h.to_dict() for name, h in sorted(_controls.items())},
+            "bytes_written": dict(sorted(_bytes.items())),
+        }
+
+
+def export_json(path: str, extra: Optional[Dict[str, Any]] = None) -> str:
+    """Write ``snapshot()`` (plus ``extra`` fields) to ``path`` and return the path."""
+    data = snapshot()
+    if extra:
+        data.update(extra)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
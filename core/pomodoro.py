@@ -1,81 +1,499 @@
 """
 Pomodoro Timer module: handles 25-min work sessions and breaks.
+
+Timing is driven by ``time.monotonic()`` deadlines: every tick is scheduled
+at an absolute offset from the end of the session, so callback time never
+accumulates as drift. ``PomodoroTimer`` runs on the shared scheduler thread
+(``core.scheduler``); ``AsyncPomodoroTimer`` runs as a task on an asyncio
+event loop (e.g. Flet's, via ``page.run_task``) and uses no threads at all.
+``FocusTimers`` runs many independent countdowns on one timing wheel.
 """
-import time
+import asyncio
+import inspect
+import math
 import threading
-from typing import Callable, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from core.scheduler import Scheduler, ScheduledCall, get_scheduler
+
+# Session phases
+WORK = "Work"
+BREAK = "Break"
+LONG_BREAK = "Long Break"
+
+# Pause between a finished work session and the start of its break (seconds)
+TRANSITION_DELAY = 2.0
+
+
+class _PomodoroCycle:
+    """Session settings and the work/break/long-break state machine shared by both timers."""
+
+    def __init__(
+        self,
+        work_minutes: int = 25,
+        break_minutes: int = 5,
+        long_break_minutes: int = 15,
+        sessions_before_long_break: int = 4,
+        break_tick_seconds: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.work_seconds = work_minutes * 60
+        self.break_seconds = break_minutes * 60
+        self.long_break_seconds = long_break_minutes * 60
+        self.sessions_before_long_break = sessions_before_long_break
+        self.break_tick_seconds = max(1, int(break_tick_seconds))
+        self.clock = clock
+        self.phase = WORK
+        self.completed_sessions = 0  # finished work sessions in this cycle
+        self.seconds_left = self.work_seconds
+        self.running = False
+        self.paused = False
+        self.paused_total = 0.0  # seconds spent paused in the current session
+        self.on_tick: Optional[Callable[[str], Any]] = None
+        self.on_complete: Optional[Callable[[str], Any]] = None
+        self._end: float = 0.0  # monotonic deadline of the current session
+        self._remaining: float = float(self.work_seconds)  # exact time left while paused/idle
+        self._paused_at: float = 0.0
+        self._in_transition = False  # between a work session and its break
+        self._generation = 0  # bumped on start/stop so stale callbacks are ignored
+
+    def duration_of(self, phase: str) -> int:
+        """Length of a phase in seconds."""
+        if phase == WORK:
+            return self.work_seconds
+        if phase == LONG_BREAK:
+            return self.long_break_seconds
+        return self.break_seconds
+
+    def _format_time(self, seconds: int) -> str:
+        """Format seconds as MM:SS."""
+        mins, secs = divmod(seconds, 60)
+        return f"{mins:02d}:{secs:02d}"
 
+    def _left(self) -> int:
+        """Whole seconds left until the session deadline (rounded up)."""
+        return math.ceil(max(0.0, self._end - self.clock()) - 1e-6)
 
-class PomodoroTimer:
+    def _next_tick_at(self, left: int) -> float:
+        """Monotonic time at which the displayed value next changes."""
+        step = 1 if self.phase == WORK else self.break_tick_seconds
+        # Whole seconds are measured back from the session end, not forward from the last tick
+        return self._end - max(0, (left - 1) // step * step)
+
+    def _reset(self) -> None:
+        """Return to an idle work session."""
+        self._generation += 1
+        self._in_transition = False
+        self.running = False
+        self.paused = False
+        self.paused_total = 0.0
+        self.phase = WORK
+        self._remaining = float(self.work_seconds)
+        self.seconds_left = self.work_seconds
+
+    def _mark_paused(self) -> bool:
+        """Record a pause; return False if there was nothing to pause."""
+        if not self.running or self.paused:
+            return False
+        self.paused = True
+        self._paused_at = self.clock()
+        if not self._in_transition:
+            self._remaining = max(0.0, self._end - self._paused_at)
+        self._in_transition = False
+        return True
+
+    def _mark_resumed(self) -> bool:
+        """Account for the pause and set the new deadline; return False if not paused."""
+        if not self.running or not self.paused:
+            return False
+        self.paused = False
+        self.paused_total += self.clock() - self._paused_at
+        self._end = self.clock() + self._remaining
+        return True
+
+    def _advance(self) -> str:
+        """Move to the next phase after a session ends and return the finished phase."""
+        finished = self.phase
+        if finished == WORK:
+            self.completed_sessions += 1
+            if self.completed_sessions >= self.sessions_before_long_break:
+                self.completed_sessions = 0
+                self.phase = LONG_BREAK
+            else:
+                self.phase = BREAK
+            self._remaining = float(self.duration_of(self.phase))
+            self._in_transition = True
+        else:
+            # Breaks end the run; the next start() begins a work session
+            self.phase = WORK
+            self._remaining = float(self.work_seconds)
+            self.running = False
+        return finished
+
+
+class PomodoroTimer(_PomodoroCycle):
     """Thread-safe Pomodoro timer with completion callback."""
 
-    def __init__(self, work_minutes: int = 25, break_minutes: int = 5):
+    def __init__(
+        self,
+        work_minutes: int = 25,
+        break_minutes: int = 5,
+        long_break_minutes: int = 15,
+        sessions_before_long_break: int = 4,
+        break_tick_seconds: int = 1,
+        scheduler: Optional[Scheduler] = None,
+    ):
         """
         Initialize timer.
-        
+
         Args:
             work_minutes: duration of work session (default 25)
             break_minutes: duration of break (default 5)
+            long_break_minutes: duration of the long break (default 15)
+            sessions_before_long_break: work sessions per long break (default 4)
+            break_tick_seconds: seconds between on_tick calls during breaks (default 1)
+            scheduler: scheduler to run on (defaults to the shared one)
         """
-        self.work_seconds = work_minutes * 60
-        self.break_seconds = break_minutes * 60
-        self.seconds_left = self.work_seconds
-        self.running = False
-        self.paused = False
-        self.on_tick: Optional[Callable[[str], None]] = None
-        self.on_complete: Optional[Callable[[str], None]] = None
+        self.scheduler = scheduler or get_scheduler()
+        super().__init__(
+            work_minutes,
+            break_minutes,
+            long_break_minutes,
+            sessions_before_long_break,
+            break_tick_seconds,
+            clock=self.scheduler.clock,
+        )
+        self._lock = threading.RLock()
+        self._call: Optional[ScheduledCall] = None
+
+    def start(self) -> None:
+        """Start (or continue) the current session on the shared scheduler."""
+        with self._lock:
+            if self.running:
+                return
+            self.running = True
+            self.paused = False
+            self.paused_total = 0.0
+            self._generation += 1
+            self._begin(self._remaining)
+
+    def stop(self) -> None:
+        """Stop the timer and reset."""
+        with self._lock:
+            self._cancel()
+            self._reset()
+        self._emit_tick(self.seconds_left)
+
+    def pause(self) -> None:
+        """Pause the timer (can resume)."""
+        with self._lock:
+            if self._mark_paused():
+                self._cancel()
+
+    def resume(self) -> None:
+        """Resume a paused timer."""
+        with self._lock:
+            if self._mark_resumed():
+                self._schedule_tick()
+
+    def remaining(self) -> float:
+        """Exact seconds left in the current session."""
+        with self._lock:
+            if self.running and not self.paused and not self._in_transition:
+                return max(0.0, self._end - self.clock())
+            return self._remaining
+
+    def _cancel(self) -> None:
+        """Cancel the pending scheduler call (caller holds the lock)."""
+        if self._call is not None:
+            self._call.cancel()
+            self._call = None
+
+    def _begin(self, remaining: float) -> None:
+        """Set the session deadline ``remaining`` seconds from now and schedule the next tick."""
+        self._end = self.clock() + remaining
+        self._schedule_tick()
+
+    def _schedule_tick(self) -> None:
+        """Schedule a tick for the moment the displayed second next changes (caller holds the lock)."""
+        left = self._left()
+        self.seconds_left = left
+        self._call = self.scheduler.call_at(self._next_tick_at(left), self._tick, self._generation)
+
+    def _tick(self, generation: int) -> None:
+        """Scheduler callback: publish the time left and finish the session at zero."""
+        with self._lock:
+            if generation != self._generation or not self.running or self.paused:
+                return
+            left = self._left()
+            if left > 0:
+                self._schedule_tick()
+            else:
+                self._call = None
+                self.seconds_left = 0
+        self._emit_tick(left)
+        if left <= 0:
+            self._finish(generation)
+
+    def _finish(self, generation: int) -> None:
+        """Move the state machine on after a session ends."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            finished = self._advance()
+            if self.running:
+                # Auto-transition to the break after a short pause
+                self._call = self.scheduler.call_later(TRANSITION_DELAY, self._start_break, generation)
+        if self.on_complete:
+            self.on_complete(finished)
+
+    def _start_break(self, generation: int) -> None:
+        """Scheduler callback: begin the break that follows a work session."""
+        with self._lock:
+            if generation != self._generation or not self.running or self.paused:
+                return
+            self._in_transition = False
+            self.paused_total = 0.0
+            self._begin(self._remaining)
+        self._emit_tick(self.seconds_left)
+
+    def _emit_tick(self, seconds: int) -> None:
+        if self.on_tick:
+            self.on_tick(self._format_time(seconds))
+
+
+class AsyncPomodoroTimer(_PomodoroCycle):
+    """
+    Pomodoro timer that runs as a coroutine on an asyncio event loop.
+
+    Control methods and callbacks run on the loop thread, so callbacks can
+    touch UI controls directly. Callbacks may be plain functions or coroutines.
+    """
+
+    def __init__(
+        self,
+        work_minutes: int = 25,
+        break_minutes: int = 5,
+        long_break_minutes: int = 15,
+        sessions_before_long_break: int = 4,
+        break_tick_seconds: int = 1,
+        run_task: Optional[Callable[..., Any]] = None,
+    ):
+        """
+        Initialize timer.
+
+        Args:
+            work_minutes: duration of work session (default 25)
+            break_minutes: duration of break (default 5)
+            long_break_minutes: duration of the long break (default 15)
+            sessions_before_long_break: work sessions per long break (default 4)
+            break_tick_seconds: seconds between on_tick calls during breaks (default 1)
+            run_task: schedules a coroutine function on the loop, e.g. ``page.run_task``
+                (defaults to ``create_task`` on the running loop)
+        """
+        super().__init__(work_minutes, break_minutes, long_break_minutes, sessions_before_long_break, break_tick_seconds)
+        self.run_task = run_task
+        self._task = None
 
     def start(self) -> None:
-        """Start the timer in a background thread."""
+        """Start (or continue) the current session as a task on the event loop."""
         if self.running:
             return
         self.running = True
         self.paused = False
-        threading.Thread(target=self._run, daemon=True).start()
+        self.paused_total = 0.0
+        self._generation += 1
+        self._end = self.clock() + self._remaining
+        self._spawn()
 
     def stop(self) -> None:
         """Stop the timer and reset."""
-        self.running = False
-        self.paused = False
-        self.seconds_left = self.work_seconds
+        self._cancel()
+        self._reset()
         if self.on_tick:
-            self.on_tick(self._format_time(self.seconds_left))
+            result = self.on_tick(self._format_time(self.seconds_left))
+            if inspect.isawaitable(result):
+                asyncio.ensure_future(result)
 
     def pause(self) -> None:
         """Pause the timer (can resume)."""
-        self.paused = True
+        if self._mark_paused():
+            self._cancel()
 
     def resume(self) -> None:
         """Resume a paused timer."""
-        self.paused = False
+        if self._mark_resumed():
+            self._generation += 1
+            self._spawn()
 
-    def _format_time(self, seconds: int) -> str:
-        """Format seconds as MM:SS."""
-        mins, secs = divmod(seconds, 60)
-        return f"{mins:02d}:{secs:02d}"
+    def remaining(self) -> float:
+        """Exact seconds left in the current session."""
+        if self.running and not self.paused and not self._in_transition:
+            return max(0.0, self._end - self.clock())
+        return self._remaining
+
+    def _spawn(self) -> None:
+        """Run the session loop for the current generation on the event loop."""
+        if self.run_task is not None:
+            self._task = self.run_task(self._run, self._generation)
+        else:
+            self._task = asyncio.get_running_loop().create_task(self._run(self._generation))
+
+    def _cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _current(self, generation: int) -> bool:
+        return generation == self._generation and self.running and not self.paused
+
+    async def _invoke(self, callback: Optional[Callable[[str], Any]], value: str) -> None:
+        if callback is None:
+            return
+        result = callback(value)
+        if inspect.isawaitable(result):
+            await result
+
+    async def _run(self, generation: int) -> None:
+        """Session loop: sleep until each display change, then run the break transition or stop."""
+        while self._current(generation):
+            if self._in_transition:
+                await asyncio.sleep(TRANSITION_DELAY)
+                if not self._current(generation):
+                    return
+                self._in_transition = False
+                self.paused_total = 0.0
+                self._end = self.clock() + self._remaining
+                self.seconds_left = self._left()
+                await self._invoke(self.on_tick, self._format_time(self.seconds_left))
+                continue
+            self.seconds_left = self._left()
+            await asyncio.sleep(max(0.0, self._next_tick_at(self.seconds_left) - self.clock()))
+            if not self._current(generation):
+                return
+            left = self._left()
+            self.seconds_left = left
+            await self._invoke(self.on_tick, self._format_time(left))
+            if left <= 0 and self._current(generation):
+                # Either starts the break transition or ends the run
+                await self._invoke(self.on_complete, self._advance())
+
+
+class FocusTimers:
+    """
+    Many concurrent countdowns (e.g. one focus timer per task) on a hashed timing wheel.
+
+    The wheel advances one slot per tick on the shared scheduler, so any number
+    of running timers costs one wakeup per tick instead of a thread each, and
+    starting or cancelling a timer is O(1). Timers complete on the first tick
+    at or after their deadline.
+    """
+
+    def __init__(self, tick_seconds: float = 1.0, slots: int = 64, scheduler: Optional[Scheduler] = None):
+        """
+        Initialize the wheel.
 
-    def _run(self) -> None:
-        """Main timer loop (runs in background thread)."""
-        is_work_session = True
-        while self.running and self.seconds_left > 0:
-            if not self.paused:
-                self.seconds_left -= 1
-                if self.on_tick:
-                    self.on_tick(self._format_time(self.seconds_left))
-            time.sleep(1)
-
-        if self.running and self.seconds_left == 0:
-            # Session completed
-            session_type = "Work" if is_work_session else "Break"
-            if self.on_complete:
-                self.on_complete(session_type)
-
-            # Auto-transition to break or next session
-            if is_work_session:
-                self.seconds_left = self.break_seconds
-                is_work_session = False
-                time.sleep(2)
-                if self.running:
-                    self._run()
+        Args:
+            tick_seconds: wheel resolution in seconds (default 1)
+            slots: number of wheel slots; longer timers wrap around in rounds
+            scheduler: scheduler to run on (defaults to the shared one)
+        """
+        self.tick_seconds = tick_seconds
+        self.scheduler = scheduler or get_scheduler()
+        self.clock = self.scheduler.clock
+        self.on_tick: Optional[Callable[[], None]] = None  # once per wheel tick while timers run
+        self._slots: List[Dict[Any, int]] = [{} for _ in range(slots)]  # key -> remaining rounds
+        self._slot_of: Dict[Any, int] = {}
+        self._deadlines: Dict[Any, float] = {}
+        self._callbacks: Dict[Any, Optional[Callable[[Any], None]]] = {}
+        self._cursor = 0
+        self._ticks = 0  # ticks since _origin
+        self._origin = 0.0
+        self._call: Optional[ScheduledCall] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._deadlines
+
+    def start(self, key: Any, seconds: float, on_complete: Optional[Callable[[Any], None]] = None) -> None:
+        """Start (or restart) the countdown for a key; ``on_complete(key)`` runs when it expires."""
+        with self._lock:
+            self._discard(key)
+            now = self.clock()
+            if self._call is None:
+                # Idle wheel: restart it aligned to now
+                self._origin, self._ticks, self._cursor = now, 0, 0
+                self._call = self.scheduler.call_at(now + self.tick_seconds, self._advance)
+            deadline = now + seconds
+            due = max(self._ticks + 1, math.ceil((deadline - self._origin) / self.tick_seconds - 1e-9))
+            offset = due - self._ticks
+            slot = (self._cursor + offset) % len(self._slots)
+            self._slots[slot][key] = (offset - 1) // len(self._slots)
+            self._slot_of[key] = slot
+            self._deadlines[key] = deadline
+            self._callbacks[key] = on_complete
+
+    def cancel(self, key: Any) -> bool:
+        """Cancel a countdown; return False if it was not running."""
+        with self._lock:
+            return self._discard(key)
+
+    def cancel_all(self) -> List[Any]:
+        """Cancel every countdown and stop the wheel (e.g. when its session closes); return the keys cancelled."""
+        with self._lock:
+            keys = list(self._deadlines)
+            for key in keys:
+                self._discard(key)
+            if self._call is not None:
+                self._call.cancel()
+                self._call = None
+            return keys
+
+    def remaining(self, key: Any) -> Optional[float]:
+        """Seconds left for a key (None if it has no running timer)."""
+        deadline = self._deadlines.get(key)
+        if deadline is None:
+            return None
+        return max(0.0, deadline - self.clock())
+
+    def active(self) -> List[Any]:
+        """Keys with a running timer."""
+        with self._lock:
+            return list(self._deadlines)
+
+    def _discard(self, key: Any) -> bool:
+        slot = self._slot_of.pop(key, None)
+        if slot is None:
+            return False
+        del self._slots[slot][key]
+        del self._deadlines[key]
+        del self._callbacks[key]
+        return True
+
+    def _advance(self) -> None:
+        """Scheduler callback: move the wheel one slot and fire the timers that expired."""
+        with self._lock:
+            self._ticks += 1
+            self._cursor = (self._cursor + 1) % len(self._slots)
+            slot = self._slots[self._cursor]
+            expired = []
+            for key, rounds in list(slot.items()):
+                if rounds:
+                    slot[key] = rounds - 1
+                else:
+                    expired.append((key, self._callbacks[key]))
+                    self._discard(key)
+            if self._deadlines:
+                # Absolute tick times: a late tick does not push the following ones back
+                self._call = self.scheduler.call_at(self._origin + (self._ticks + 1) * self.tick_seconds, self._advance)
             else:
-                self.running = False
+                self._call = None
+        if self.on_tick:
+            self.on_tick()
+        for key, callback in expired:
+            if callback:
+                callback(key)
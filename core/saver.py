@@ -0,0 +1,179 @@
+"""
+Write-behind saver: batches storage writes and performs them on a background worker.
+
+Callers ``submit()`` items and return immediately. The worker waits for a
+short quiet period so bursts of mutations coalesce into one call of the
+``write_batch`` function, which does the actual disk I/O.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List
+
+
+class WriteBehindSaver:
+    """Debounced, coalescing background writer with latency/queue statistics."""
+
+    def __init__(self, write_batch: Callable[[List[Any]], None], delay: float = 0.05, max_delay: float = 0.5, retry_delay: float = 1.0):
+        """
+        Initialize saver.
+
+        Args:
+            write_batch: performs the I/O for a list of pending items (runs on the worker)
+            delay: quiet period (seconds) to wait for more items before writing
+            max_delay: upper bound on how long a burst can postpone the write
+            retry_delay: pause before retrying after a failed write
+        """
+        self.write_batch = write_batch
+        self.delay = delay
+        self.max_delay = max_delay
+        self.retry_delay = retry_delay
+        self._pending: List[Any] = []
+        self._first_pending_at = 0.0
+        self._last_submit_at = 0.0
+        self._cond = threading.Condition()
+        self._io_lock = threading.RLock()
+        self._thread = None
+        self._closed = False
+        self._paused = 0  # nesting depth of paused() blocks
+        self._stats = {
+            "writes": 0,
+            "items_written": 0,
+            "errors": 0,
+            "last_error": "",
+            "last_latency_ms": 0.0,
+            "max_latency_ms": 0.0,
+            "total_latency_ms": 0.0,
+            "max_queue_depth": 0,
+        }
+
+    def submit(self, item: Any) -> None:
+        """Queue an item for writing and return immediately."""
+        with self._cond:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_pending_at = now
+            self._last_submit_at = now
+            self._pending.append(item)
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], len(self._pending))
+            closed = self._closed
+            if not closed and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="write-behind-saver", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        if closed:
+            # After close (interpreter exit) there is no worker to hand off to
+            self.flush()
+
+    def discard_pending(self) -> List[Any]:
+        """Drop and return queued items (e.g. when a snapshot already covers them)."""
+        with self._cond:
+            items, self._pending = self._pending, []
+            return items
+
+    def queue_depth(self) -> int:
+        """Number of items waiting to be written."""
+        with self._cond:
+            return len(self._pending)
+
+    def flush(self) -> bool:
+        """Write all pending items now, on the calling thread. Return False if the write failed."""
+        with self._io_lock:
+            return self._write(self.discard_pending())
+
+    @contextmanager
+    def flushed(self):
+        """Flush, then hold off the worker for the duration of the block."""
+        with self._io_lock:
+            self._write(self.discard_pending())
+            yield
+
+    @contextmanager
+    def io(self):
+        """Hold the I/O lock without flushing (for callers that touch the files themselves)."""
+        with self._io_lock:
+            yield
+
+    @contextmanager
+    def paused(self):
+        """
+        Hold off the worker until the block exits; submits keep queueing.
+
+        Unlike ``flushed`` this is not tied to a thread, so it can span the
+        yields of a generator that is resumed from different threads.
+        Explicit ``flush()`` calls still write.
+        """
+        with self._cond:
+            self._paused += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._paused -= 1
+                self._cond.notify()
+
+    def close(self) -> None:
+        """Flush pending writes; later submits are written synchronously."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return save latency and queue depth statistics."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["queue_depth"] = len(self._pending)
+        writes = stats["writes"]
+        stats["avg_latency_ms"] = stats["total_latency_ms"] / writes if writes else 0.0
+        return stats
+
+    def _write(self, batch: List[Any]) -> bool:
+        """Run write_batch for a batch and record timing (caller holds the I/O lock)."""
+        if not batch:
+            return True
+        start = time.perf_counter()
+        try:
+            self.write_batch(batch)
+        except Exception as exc:
+            # Put the batch back so the next flush retries it
+            with self._cond:
+                self._pending[:0] = batch
+                self._stats["errors"] += 1
+                self._stats["last_error"] = repr(exc)
+            return False
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._cond:
+            self._stats["writes"] += 1
+            self._stats["items_written"] += len(batch)
+            self._stats["last_latency_ms"] = elapsed
+            self._stats["total_latency_ms"] += elapsed
+            self._stats["max_latency_ms"] = max(self._stats["max_latency_ms"], elapsed)
+        return True
+
+    def _run(self) -> None:
+        """Worker loop: wait for a quiet period, then write everything queued."""
+        while True:
+            with self._cond:
+                while (not self._pending or self._paused) and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # Debounce: keep waiting while items keep arriving, up to max_delay
+                while True:
+                    now = time.monotonic()
+                    quiet_until = self._last_submit_at + self.delay
+                    deadline = min(quiet_until, self._first_pending_at + self.max_delay)
+                    if now >= deadline or self._closed:
+                        break
+                    self._cond.wait(deadline - now)
+            with self._io_lock:
+                # A pause may have begun during the debounce (pausers take this
+                # lock before touching the files, so checking here is race-free)
+                if self._paused:
+                    continue
+                ok = self._write(self.discard_pending())
+            if not ok:
+                # Back off before retrying a failed write
+                with self._cond:
+                    self._cond.wait(self.retry_delay)
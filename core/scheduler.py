@@ -0,0 +1,132 @@
+"""
+Shared monotonic-clock scheduler: one background thread runs callbacks for any number of timers.
+
+Callbacks are queued by absolute ``time.monotonic()`` deadline in a heap, so
+time spent in callbacks never shifts later deadlines (no cumulative drift),
+and starting a timer never spawns a thread of its own.
+"""
+import heapq
+import itertools
+import threading
+import time
+import traceback
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class ScheduledCall:
+    """Handle for a scheduled callback; ``cancel()`` prevents it from running."""
+
+    __slots__ = ("when", "callback", "args", "cancelled")
+
+    def __init__(self, when: float, callback: Callable[..., None], args: Tuple[Any, ...]):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the call (no-op if it already ran)."""
+        self.cancelled = True
+
+
+class Scheduler:
+    """Runs callbacks at monotonic deadlines on a single daemon thread."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, name: str = "scheduler", threaded: bool = True):
+        """
+        Initialize scheduler.
+
+        Args:
+            clock: monotonic time source (seconds)
+            name: name of the worker thread
+            threaded: set False to run due calls only through ``run_due`` (manual clocks, tests)
+        """
+        self.clock = clock
+        self.name = name
+        self.threaded = threaded
+        self._heap: List[Tuple[float, int, ScheduledCall]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def call_at(self, when: float, callback: Callable[..., None], *args: Any) -> ScheduledCall:
+        """Run ``callback(*args)`` on the scheduler thread at monotonic time ``when``."""
+        call = ScheduledCall(when, callback, args)
+        with self._cond:
+            heapq.heappush(self._heap, (when, next(self._seq), call))
+            if self._thread is None and self.threaded:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            # Wake the worker only if this call is now the earliest
+            if self._heap[0][2] is call:
+                self._cond.notify()
+        return call
+
+    def call_later(self, delay: float, callback: Callable[..., None], *args: Any) -> ScheduledCall:
+        """Run ``callback(*args)`` after ``delay`` seconds."""
+        return self.call_at(self.clock() + delay, callback, *args)
+
+    def pending(self) -> int:
+        """Number of scheduled (not cancelled) calls."""
+        with self._cond:
+            return sum(1 for _, _, call in self._heap if not call.cancelled)
+
+    def next_deadline(self) -> Optional[float]:
+        """Monotonic time of the earliest scheduled call (None if there is none)."""
+        with self._cond:
+            self._drop_cancelled()
+            return self._heap[0][0] if self._heap else None
+
+    def run_due(self) -> int:
+        """Run every call that is due now on the calling thread; return how many ran."""
+        ran = 0
+        while True:
+            with self._cond:
+                self._drop_cancelled()
+                if not self._heap or self._heap[0][0] > self.clock():
+                    return ran
+                call = heapq.heappop(self._heap)[2]
+            self._invoke(call)
+            ran += 1
+
+    def _drop_cancelled(self) -> None:
+        """Pop cancelled calls off the top of the heap (caller holds the condition)."""
+        # Dropped lazily instead of searching the heap on cancel
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+
+    def _invoke(self, call: ScheduledCall) -> None:
+        try:
+            call.callback(*call.args)
+        except Exception:
+            # A failing callback must not take down every other timer
+            traceback.print_exc()
+
+    def _run(self) -> None:
+        """Worker loop: sleep until the earliest deadline, then run every due call."""
+        while True:
+            with self._cond:
+                while True:
+                    self._drop_cancelled()
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0][0] - self.clock()
+                    if delay <= 0:
+                        call = heapq.heappop(self._heap)[2]
+                        break
+                    self._cond.wait(delay)
+            self._invoke(call)
+
+
+_default: Optional[Scheduler] = None
+_default_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """Return the process-wide shared scheduler."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = Scheduler()
+        return _default
@@ -0,0 +1,171 @@
+"""
+In-memory full-text search over task titles, descriptions and subjects.
+
+``SearchIndex`` is a task index (see core.indexes): attached with
+``TaskList.add_index`` it is updated incrementally by the storage mutation
+helpers, so queries never rescan task text. It keeps an inverted index
+(token -> task ids), a forward index (task id -> tokens) and a prefix map
+(prefix -> tokens) so the word being typed matches as a prefix. Its sets
+change in place, so updates and queries take the index's own lock: a
+shared index can be searched by one session while another writes.
+"""
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Fields searched, in the task dict shape used by core.storage
+SEARCH_FIELDS = ("title", "deskripsi", "mata_kuliah")
+
+# Longest prefix stored in the prefix map; longer query terms are checked with startswith
+MAX_PREFIX = 12
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens of a string."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class SearchIndex:
+    """Inverted index with prefix lookup, maintained incrementally."""
+
+    def __init__(self, fields: Tuple[str, ...] = SEARCH_FIELDS):
+        """
+        Initialize index.
+
+        Args:
+            fields: task fields whose text is indexed
+        """
+        self.fields = fields
+        self._postings: Dict[str, Set[Any]] = {}  # token -> task ids
+        self._tokens_of: Dict[Any, frozenset] = {}  # task id -> its tokens
+        self._prefixes: Dict[str, Set[str]] = {}  # prefix -> tokens starting with it
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._tokens_of)
+
+    def _task_tokens(self, task: Dict[str, Any]) -> frozenset:
+        text = "\n".join(value for value in map(task.get, self.fields) if isinstance(value, str))
+        return frozenset(tokenize(text))
+
+    def _link(self, task_id: Any, tokens: Iterable[str]) -> None:
+        postings, prefixes = self._postings, self._prefixes
+        for token in tokens:
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = {task_id}
+                for n in range(1, min(len(token), MAX_PREFIX) + 1):
+                    prefixes.setdefault(token[:n], set()).add(token)
+            else:
+                ids.add(task_id)
+
+    def _unlink(self, task_id: Any, tokens: Iterable[str]) -> None:
+        postings, prefixes = self._postings, self._prefixes
+        for token in tokens:
+            ids = postings[token]
+            ids.discard(task_id)
+            if not ids:
+                # Last task using this token: drop it from the vocabulary
+                del postings[token]
+                for n in range(1, min(len(token), MAX_PREFIX) + 1):
+                    bucket = prefixes[token[:n]]
+                    bucket.discard(token)
+                    if not bucket:
+                        del prefixes[token[:n]]
+
+    def extend(self, entries: Iterable[Tuple[Dict[str, Any], int]]) -> None:
+        """Bulk-load (task, seq) pairs."""
+        with self._lock:
+            tokens_of, postings = self._tokens_of, self._postings
+            new_tokens = []
+            for task, _ in entries:
+                task_id = task["id"]
+                tokens = tokens_of[task_id] = self._task_tokens(task)
+                for token in tokens:
+                    ids = postings.get(token)
+                    if ids is None:
+                        postings[token] = {task_id}
+                        new_tokens.append(token)
+                    else:
+                        ids.add(task_id)
+            # Prefix map for the new vocabulary in one pass (batched loads extend repeatedly)
+            prefixes = self._prefixes
+            for token in new_tokens:
+                for n in range(1, min(len(token), MAX_PREFIX) + 1):
+                    bucket = prefixes.get(token[:n])
+                    if bucket is None:
+                        prefixes[token[:n]] = {token}
+                    else:
+                        bucket.add(token)
+
+    def add(self, task: Dict[str, Any], seq: int) -> None:
+        """Index a new task."""
+        with self._lock:
+            tokens = self._task_tokens(task)
+            self._tokens_of[task["id"]] = tokens
+            self._link(task["id"], tokens)
+
+    def update(self, task: Dict[str, Any], seq: int) -> None:
+        """Re-index a changed task (only tokens that were added or removed are touched)."""
+        with self._lock:
+            task_id = task["id"]
+            old = self._tokens_of.get(task_id, frozenset())
+            new = self._task_tokens(task)
+            if new == old:
+                return
+            self._unlink(task_id, old - new)
+            self._link(task_id, new - old)
+            self._tokens_of[task_id] = new
+
+    def remove(self, task: Dict[str, Any], seq: int) -> None:
+        """Drop a task from the index."""
+        with self._lock:
+            tokens = self._tokens_of.pop(task["id"], None)
+            if tokens is not None:
+                self._unlink(task["id"], tokens)
+
+    def reorder(self, entries: Iterable[Tuple[Dict[str, Any], int]]) -> None:
+        """Nothing to do: postings are keyed by task id, not position."""
+
+    def tokens_with_prefix(self, prefix: str) -> Set[str]:
+        """Indexed tokens starting with ``prefix``."""
+        with self._lock:
+            tokens = self._prefixes.get(prefix[:MAX_PREFIX], set())
+            if len(prefix) > MAX_PREFIX:
+                return {t for t in tokens if t.startswith(prefix)}
+            return tokens
+
+    def search(self, query: str) -> Optional[Set[Any]]:
+        """
+        Ids of tasks matching every word of the query (each word as a prefix).
+
+        Returns:
+            set of task ids, or None if the query has no words (no filtering)
+        """
+        with self._lock:
+            terms = set(tokenize(query))
+            if not terms:
+                return None
+            postings = self._postings
+            candidates = []
+            for term in terms:
+                tokens = self.tokens_with_prefix(term)
+                if not tokens:
+                    return set()
+                # Upper bound on the tasks this term matches
+                candidates.append((sum(len(postings[t]) for t in tokens), tokens))
+            # Start from the most selective term, then filter by the others
+            candidates.sort(key=lambda c: c[0])
+            first = candidates[0][1]
+            if len(first) == 1:
+                ids = set(postings[next(iter(first))])
+            else:
+                ids = set().union(*(postings[t] for t in first))
+            tokens_of = self._tokens_of
+            for _, tokens in candidates[1:]:
+                ids = {i for i in ids if not tokens_of[i].isdisjoint(tokens)}
+                if not ids:
+                    break
+            return ids
@@ -0,0 +1,246 @@
+"""
+Pomodoro session log: completed and aborted sessions in an append-only JSON-lines file.
+
+Focus-time aggregates (minutes per day, minutes per mata_kuliah, streaks) are
+updated incrementally as each session is logged and cached in
+sessions_stats.json together with the log offset they cover, so loading the
+statistics only replays sessions logged after the last cache write instead
+of the whole history.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+import traceback
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from core import instrument, storage
+from core.saver import WriteBehindSaver
+
+SESSIONS_FILE = os.path.join(storage.DATA_DIR, "sessions.jsonl")
+STATS_FILE = os.path.join(storage.DATA_DIR, "sessions_stats.json")
+
+COMPLETED = "completed"
+ABORTED = "aborted"
+
+# Phases that count as focus time ("Work" from the Pomodoro timer, "Focus" from per-task timers)
+FOCUS_PHASES = ("Work", "Focus")
+
+STATS_VERSION = 1
+
+_lock = threading.RLock()
+_stats: Optional[Dict[str, Any]] = None  # aggregates, including "offset" into the log
+_listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {
+        "version": STATS_VERSION,
+        "offset": 0,  # bytes of the log covered by these aggregates
+        "minutes_by_day": {},
+        "minutes_by_subject": {},
+        "total_minutes": 0.0,
+        "completed": 0,
+        "aborted": 0,
+        "last_day": None,  # last day with a completed focus session
+        "streak": 0,  # consecutive days ending at last_day
+        "longest_streak": 0,
+    }
+
+
+def _accumulate(stats: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """Fold one session record into the aggregates."""
+    if record.get("phase") not in FOCUS_PHASES:
+        return
+    day = record["day"]
+    minutes = record.get("minutes", 0.0)
+    by_day = stats["minutes_by_day"]
+    by_day[day] = round(by_day.get(day, 0.0) + minutes, 2)
+    subject = record.get("mata_kuliah", "")
+    by_subject = stats["minutes_by_subject"]
+    by_subject[subject] = round(by_subject.get(subject, 0.0) + minutes, 2)
+    stats["total_minutes"] = round(stats["total_minutes"] + minutes, 2)
+    if record.get("status") != COMPLETED:
+        stats["aborted"] += 1
+        return
+    stats["completed"] += 1
+    # Streaks: records arrive in time order, so only the last day matters
+    last = stats["last_day"]
+    if last == day:
+        return
+    if last is not None and date.fromisoformat(day) - date.fromisoformat(last) == timedelta(days=1):
+        stats["streak"] += 1
+    else:
+        stats["streak"] = 1
+    stats["last_day"] = day
+    stats["longest_streak"] = max(stats["longest_streak"], stats["streak"])
+
+
+def _replay(stats: Dict[str, Any]) -> None:
+    """Fold log records past ``stats["offset"]`` into the aggregates."""
+    try:
+        with open(SESSIONS_FILE, "rb") as f:
+            f.seek(stats["offset"])
+            tail = f.read()
+    except FileNotFoundError:
+        return
+    offset = stats["offset"]
+    for line in tail.split(b"\n")[:-1]:
+        offset += len(line) + 1
+        if not line.strip():
+            continue
+        try:
+            _accumulate(stats, json.loads(line))
+        except (json.JSONDecodeError, KeyError, ValueError):
+            # Skip a damaged line rather than losing the whole history
+            continue
+    stats["offset"] = offset
+
+
+def _load() -> Dict[str, Any]:
+    """Load cached aggregates and catch up with the log tail (caller holds the lock)."""
+    global _stats
+    if _stats is not None:
+        return _stats
+    stats = None
+    try:
+        with open(STATS_FILE, "r", encoding="utf-8") as f:
+            stats = json.load(f)
+        size = os.path.getsize(SESSIONS_FILE) if os.path.exists(SESSIONS_FILE) else 0
+        if stats.get("version") != STATS_VERSION or stats.get("offset", 0) > size:
+            # Cache belongs to another log (replaced or truncated): rebuild
+            stats = None
+    except (FileNotFoundError, json.JSONDecodeError):
+        stats = None
+    if stats is None:
+        stats = _empty_stats()
+    _replay(stats)
+    _stats = stats
+    return stats
+
+
+def _write_batch(records: List[Dict[str, Any]]) -> None:
+    """Append records to the log in one write, then refresh the aggregate cache (saver worker)."""
+    storage.ensure_data_dir()
+    data = "".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records).encode("utf-8")
+    with open(SESSIONS_FILE, "ab") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    instrument.add_bytes(SESSIONS_FILE, len(data))
+    with _lock:
+        if _stats is None or _saver.queue_depth():
+            # Aggregates already include queued records; cache them once those are written
+            return
+        _stats["offset"] = os.path.getsize(SESSIONS_FILE)
+        payload = json.dumps(_stats, ensure_ascii=False)
+    tmp = STATS_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(payload)
+    os.replace(tmp, STATS_FILE)
+    instrument.add_bytes(STATS_FILE, len(payload.encode("utf-8")))
+
+
+_saver = WriteBehindSaver(_write_batch)
+atexit.register(_saver.close)
+
+
+def log_session(
+    phase: str,
+    status: str,
+    minutes: float,
+    mata_kuliah: str = "",
+    task_id: Optional[str] = None,
+    ended_at: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Record a finished or aborted session and update the aggregates.
+
+    Args:
+        phase: session kind ("Work", "Break", "Long Break" or "Focus" for per-task timers)
+        status: COMPLETED or ABORTED
+        minutes: time actually spent in the session
+        mata_kuliah: subject the session was for ("" if none)
+        task_id: task the session was for, if any
+        ended_at: end time as a Unix timestamp (defaults to now)
+
+    Returns:
+        The logged record.
+    """
+    ended_at = time.time() if ended_at is None else ended_at
+    record = {
+        "ts": int(ended_at),
+        "day": datetime.fromtimestamp(ended_at).date().isoformat(),
+        "phase": phase,
+        "status": status,
+        "minutes": round(max(0.0, minutes), 2),
+        "mata_kuliah": mata_kuliah or "",
+    }
+    if task_id is not None:
+        record["task_id"] = task_id
+    with _lock:
+        stats = _load()
+        _accumulate(stats, record)
+        _saver.submit(record)
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(record)
+        except Exception:
+            # A failing view must not break the timer that logged the session
+            traceback.print_exc()
+    return record
+
+
+def on_session_logged(callback: Callable[[Dict[str, Any]], None]) -> Callable[[], None]:
+    """
+    Register ``callback(record)`` to run after each logged session (e.g. to refresh a stats view).
+
+    Returns a function that unregisters it (call it when the view goes away).
+    """
+    with _lock:
+        _listeners.append(callback)
+
+    def unsubscribe() -> None:
+        with _lock:
+            if callback in _listeners:
+                _listeners.remove(callback)
+
+    return unsubscribe
+
+
+def get_stats(today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Summary for the statistics view, read from the precomputed aggregates.
+
+    Returns:
+        dict with today_minutes, week_minutes (last 7 days), total_minutes,
+        completed, aborted, current_streak, longest_streak, last_7_days
+        [(day, minutes), oldest first] and by_subject [(mata_kuliah, minutes), largest first].
+    """
+    today = today or date.today()
+    with _lock:
+        stats = _load()
+        by_day = stats["minutes_by_day"]
+        days = [(today - timedelta(days=i)).isoformat() for i in range(6, -1, -1)]
+        last_7_days = [(d, by_day.get(d, 0.0)) for d in days]
+        last = stats["last_day"]
+        alive = last is not None and (today - date.fromisoformat(last)).days <= 1
+        return {
+            "today_minutes": by_day.get(today.isoformat(), 0.0),
+            "week_minutes": round(sum(m for _, m in last_7_days), 2),
+            "total_minutes": stats["total_minutes"],
+            "completed": stats["completed"],
+            "aborted": stats["aborted"],
+            "current_streak": stats["streak"] if alive else 0,
+            "longest_streak": stats["longest_streak"],
+            "last_7_days": last_7_days,
+            "by_subject": sorted(stats["minutes_by_subject"].items(), key=lambda kv: -kv[1]),
+        }
+
+
+def flush_sessions() -> None:
+    """Block until every logged session has reached the disk."""
+    _saver.flush()
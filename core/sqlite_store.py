@@ -0,0 +1,282 @@
+"""
+SQLite task store: same operations as core.storage, backed by data/tasks.db.
+
+This is a standalone alternative backend: the app itself reads and writes
+through core.storage, and nothing imports this module.
+
+Tasks are rows in an indexed table (deadline, mata_kuliah, done), so views
+can query just the group they render instead of scanning every task. Rows
+are keyed by the task's persistent string id, as in tasks.json, and keys
+beyond the known fields are kept as JSON in the ``extra`` column. On first
+use the existing data/tasks.json (and its journal) is copied into the
+database once, read without touching the JSON store's files.
+"""
+import json
+import os
+import sqlite3
+import threading
+from typing import List, Dict, Any, Optional
+
+from core import storage
+from core.storage import TaskList
+
+# Database path; None = tasks.db in storage.DATA_DIR, resolved on connect
+DB_FILE: Optional[str] = None
+
+# Bumped whenever the schema changes; 1 = initial schema + JSON migration,
+# 2 = string ids (as in tasks.json) and the extra column
+SCHEMA_VERSION = 2
+
+FIELDS = ("title", "done", "deadline", "mata_kuliah", "deskripsi")
+COLUMNS = ("id",) + FIELDS + ("extra",)
+# Defaults of the NOT NULL text columns, used when a task holds None (e.g. "mata_kuliah": null)
+_TEXT_DEFAULTS = {"title": "Untitled", "mata_kuliah": "", "deskripsi": ""}
+
+# Rows come back in insertion order (rowid), not id order
+_TABLE = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY NOT NULL,
+    title TEXT NOT NULL DEFAULT 'Untitled',
+    done INTEGER NOT NULL DEFAULT 0,
+    deadline TEXT,
+    mata_kuliah TEXT NOT NULL DEFAULT '',
+    deskripsi TEXT NOT NULL DEFAULT '',
+    extra TEXT
+)
+"""
+_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks(deadline)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_mata_kuliah ON tasks(mata_kuliah)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_done ON tasks(done)",
+)
+
+_SELECT = "SELECT id, title, done, deadline, mata_kuliah, deskripsi, extra FROM tasks"
+_INSERT = f"INSERT INTO tasks ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+_lock = threading.RLock()
+_conn: Optional[sqlite3.Connection] = None
+
+
+def _row_to_task(row) -> Dict[str, Any]:
+    """Convert a database row into the task dict shape used by the UI."""
+    task = {
+        "id": row[0],
+        "title": row[1],
+        "done": bool(row[2]),
+        "deadline": row[3],
+        "mata_kuliah": row[4],
+        "deskripsi": row[5],
+    }
+    if row[6]:
+        task.update(json.loads(row[6]))
+    return task
+
+
+def _extra_json(task) -> Optional[str]:
+    """The task's keys beyond the known fields as a JSON object (None if it has none)."""
+    extra = {k: v for k, v in task.items() if k not in storage.TASK_FIELDS}
+    return json.dumps(extra, ensure_ascii=False) if extra else None
+
+
+def _column_value(name: str, value) -> Any:
+    """A task field as stored: NOT NULL text columns take their default for None, done is 0/1."""
+    if name == "done":
+        return int(bool(value))
+    if value is None and name in _TEXT_DEFAULTS:
+        return _TEXT_DEFAULTS[name]
+    return value
+
+
+def _insert_values(task) -> tuple:
+    """Values for _INSERT, in COLUMNS order."""
+    return (task["id"],) + tuple(_column_value(name, task.get(name)) for name in FIELDS) + (_extra_json(task),)
+
+
+def db_file() -> str:
+    """Path of the database: DB_FILE, or tasks.db next to the JSON store."""
+    return DB_FILE or os.path.join(storage.DATA_DIR, "tasks.db")
+
+
+def get_connection() -> sqlite3.Connection:
+    """Open (once) the database, create the schema and migrate tasks.json."""
+    global _conn
+    with _lock:
+        if _conn is None:
+            storage.ensure_data_dir()
+            conn = sqlite3.connect(db_file(), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            try:
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version == 1:
+                    _upgrade_integer_ids(conn)
+                conn.execute(_TABLE)
+                for statement in _INDEXES:
+                    conn.execute(statement)
+                conn.commit()
+                if version < 1:
+                    migrate_from_json(conn)
+            except Exception:
+                conn.close()
+                raise
+            _conn = conn
+        return _conn
+
+
+def migrate_from_json(conn: sqlite3.Connection) -> int:
+    """
+    Copy tasks from data/tasks.json into the database and return the row count.
+
+    The JSON store is only read (storage.read_tasks), never rewritten. The rows and the schema version are written in one transaction: if any
+    insert fails nothing is kept, and the next connect tries again.
+    """
+    items = storage.read_tasks()
+    rows = [_insert_values(t) for t in items]
+    conn.execute("BEGIN")
+    try:
+        conn.executemany(_INSERT, rows)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    except Exception:
+        conn.rollback()
+        raise
+    conn.commit()
+    return len(items)
+
+
+def _upgrade_integer_ids(conn: sqlite3.Connection) -> None:
+    """
+    Move a version 1 database (integer ids) to the current schema, in one transaction.
+
+    Its ids were assigned by SQLite, the ones from tasks.json are gone, so
+    each row keeps its number as a string id.
+    """
+    conn.execute("BEGIN")
+    try:
+        conn.execute("ALTER TABLE tasks RENAME TO tasks_v1")
+        # The old indexes moved with the table and are dropped with it
+        conn.execute(_TABLE)
+        conn.execute(
+            "INSERT INTO tasks (id, title, done, deadline, mata_kuliah, deskripsi) "
+            "SELECT CAST(id AS TEXT), title, done, deadline, mata_kuliah, deskripsi FROM tasks_v1 ORDER BY rowid"
+        )
+        conn.execute("DROP TABLE tasks_v1")
+        for statement in _INDEXES:
+            conn.execute(statement)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    except Exception:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+def close() -> None:
+    """Close the shared connection."""
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+
+
+def load_tasks() -> TaskList:
+    """Load all tasks in insertion order."""
+    with _lock:
+        rows = get_connection().execute(f"{_SELECT} ORDER BY rowid").fetchall()
+    return TaskList(_row_to_task(r) for r in rows)
+
+
+def add_task(tasks: TaskList, title: str, mata_kuliah: str = "", deadline: str = None, deskripsi: str = "") -> Dict[str, Any]:
+    """Add a new task with all parameters and return the created task object."""
+    task = {
+        "id": storage.new_task_id(),
+        "title": title.strip(),
+        "done": False,
+        "deadline": deadline,
+        "mata_kuliah": (mata_kuliah or "").strip(),
+        "deskripsi": (deskripsi or "").strip(),
+    }
+    with _lock:
+        conn = get_connection()
+        with conn:
+            conn.execute(_INSERT, _insert_values(task))
+    return tasks.append(task)
+
+
+def update_task(tasks: TaskList, task_id: str, **kwargs) -> None:
+    """Update the task with the given id with provided kwargs."""
+    kwargs.pop("id", None)
+    task = tasks.update(task_id, **kwargs) if kwargs else None
+    if task is None:
+        return
+    fields = {k: _column_value(k, v) for k, v in kwargs.items() if k in FIELDS}
+    if len(fields) < len(kwargs):
+        fields["extra"] = _extra_json(task)
+    assignments = ", ".join(f"{k} = ?" for k in fields)
+    with _lock:
+        conn = get_connection()
+        with conn:
+            conn.execute(f"UPDATE tasks SET {assignments} WHERE id = ?", (*fields.values(), task_id))
+
+
+def delete_task(tasks: TaskList, task_id: str) -> None:
+    """Delete the task with the given id."""
+    if tasks.remove(task_id) is None:
+        return
+    with _lock:
+        conn = get_connection()
+        with conn:
+            conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+
+def toggle_task(tasks: TaskList, task_id: str) -> None:
+    """Toggle the 'done' status of a task."""
+    task = tasks.get(task_id)
+    if task is not None:
+        update_task(tasks, task_id, done=not task["done"])
+
+
+def get_deadlines() -> List[str]:
+    """Distinct deadlines in display order ("No deadline" last), served from the deadline index."""
+    with _lock:
+        rows = get_connection().execute(
+            "SELECT DISTINCT deadline FROM tasks WHERE deadline IS NOT NULL AND deadline != 'No deadline' ORDER BY deadline"
+        ).fetchall()
+        has_none = get_connection().execute(
+            "SELECT 1 FROM tasks WHERE deadline IS NULL OR deadline = 'No deadline' LIMIT 1"
+        ).fetchone()
+    deadlines = [r[0] for r in rows]
+    if has_none:
+        deadlines.append("No deadline")
+    return deadlines
+
+
+def get_tasks_by_deadline(deadline: Optional[str], done: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """Tasks due on one deadline ("No deadline"/None for undated), optionally filtered by done."""
+    if deadline in (None, "No deadline"):
+        where, params = "(deadline IS NULL OR deadline = 'No deadline')", []
+    else:
+        where, params = "deadline = ?", [deadline]
+    if done is not None:
+        where += " AND done = ?"
+        params.append(int(done))
+    with _lock:
+        rows = get_connection().execute(f"{_SELECT} WHERE {where} ORDER BY rowid", params).fetchall()
+    return [_row_to_task(r) for r in rows]
+
+
+def get_subjects() -> List[str]:
+    """Distinct subjects (mata_kuliah) that have at least one task."""
+    with _lock:
+        rows = get_connection().execute("SELECT DISTINCT mata_kuliah FROM tasks ORDER BY mata_kuliah").fetchall()
+    return [r[0] for r in rows]
+
+
+def get_tasks_by_subject(mata_kuliah: str, done: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """Tasks for one subject (mata_kuliah), optionally filtered by done."""
+    where, params = "mata_kuliah = ?", [mata_kuliah]
+    if done is not None:
+        where += " AND done = ?"
+        params.append(int(done))
+    with _lock:
+        rows = get_connection().execute(f"{_SELECT} WHERE {where} ORDER BY rowid", params).fetchall()
+    return [_row_to_task(r) for r in rows]
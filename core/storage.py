@@ -1,12 +1,108 @@
 """
 Task storage module: handles loading and saving tasks to tasks.json.
+
+Mutations are recorded in an append-only journal (tasks.journal) next to the
+snapshot, so each change costs one small write instead of a full rewrite.
+``load_tasks`` replays the journal onto the snapshot, and the journal is
+folded back into the snapshot once it grows past ``JOURNAL_COMPACT_BYTES``.
+
+All disk I/O runs on a write-behind worker (core.saver), so mutation
+helpers only touch memory and queue a record; bursts coalesce into one
+write and ``flush_tasks()`` drains the queue on exit.
+
+Very large snapshots can be loaded incrementally (``load_tasks_incrementally``),
+parsing tasks.json element by element so the first tasks are usable before
+the rest is read.
+
+Each snapshot is also kept as a pickled, already normalized copy
+(tasks.cache) keyed by the snapshot's mtime, size and digest, so startup
+skips JSON parsing and backfilling while the snapshot is unchanged.
+
+In memory each task is a ``Task`` record (slots instead of a dict, with
+interned subjects and deadlines) that reads and writes like the task dict.
 """
+import atexit
+import codecs
+import hashlib
 import json
 import os
-from typing import List, Dict, Any
+import pickle
+import re
+import sys
+import threading
+import time
+import traceback
+import uuid
+from collections.abc import Mapping, MutableMapping
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from operator import attrgetter
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Set, Tuple
+
+from core import instrument
+from core.saver import WriteBehindSaver
+from core.scheduler import get_scheduler
+from core.watcher import FileWatcher, file_signature
+
+try:
+    import fcntl
+except ImportError:
+    # No flock() (Windows): writers are not coordinated across processes
+    fcntl = None
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 DATA_FILE = os.path.join(DATA_DIR, "tasks.json")
+JOURNAL_FILE = os.path.join(DATA_DIR, "tasks.journal")
+CACHE_FILE = os.path.join(DATA_DIR, "tasks.cache")
+LOCK_FILE = os.path.join(DATA_DIR, "tasks.lock")
+
+# Bumped whenever the cached structure changes
+CACHE_VERSION = 2
+
+# Fields of a task record (see Task), in tasks.json order
+TASK_FIELDS = ("id", "title", "done", "deadline", "mata_kuliah", "deskripsi")
+_TASK_FIELD_SET = frozenset(TASK_FIELDS)
+
+# Fields with few distinct values: interned, so every task shares one string per value
+_SHARED_FIELDS = frozenset(("deadline", "mata_kuliah"))
+
+# Journal size (bytes) that triggers a background compaction
+JOURNAL_COMPACT_BYTES = 64 * 1024
+
+# Bulk adds of this many tasks (about JOURNAL_COMPACT_BYTES of records) are
+# written as one snapshot instead of journal records that compaction would
+# fold into a snapshot right away
+BULK_SNAPSHOT_TASKS = 256
+
+# Streaming loads: bytes read per chunk, tasks in the first batch (about a
+# screenful) and in each later batch
+STREAM_CHUNK_BYTES = 64 * 1024
+STREAM_FIRST_BATCH = 50
+STREAM_BATCH = 2000
+
+# Whitespace and element separators between array elements
+_SKIP_RE = re.compile(r"[\s,]*")
+
+# Seconds between checks for changes by other writers where inotify is unavailable
+WATCH_POLL_INTERVAL = 1.0
+# Set False to poll instead of using inotify (e.g. for network file systems)
+WATCH_USE_INOTIFY = True
+
+# Guards the in-memory task list; file state below is only touched under the saver's I/O lock
+_lock = threading.RLock()
+_tasks_ref: Optional["TaskList"] = None  # list that compaction snapshots
+_snapshot_digest = ""  # digest of the snapshot the journal applies to
+_journal_size = 0
+_loading = 0  # incremental loads in progress (the list is incomplete, so no compaction)
+_partial_ref: Optional["TaskList"] = None  # list whose last load did not finish: never compacted or merged into
+# Files as this process last read or wrote them; anything else is another writer's change
+_disk_state: Optional[Tuple[Any, Any]] = None
+# Ids with queued (unwritten) records, and queued snapshots: local changes that win a merge
+_pending_ids: Dict[Any, int] = {}
+_pending_snapshots = 0
+_watcher: Optional[FileWatcher] = None
+_watch_lock = None  # held around merges made for the watcher (e.g. the UI's render lock)
+_watch_listeners: List[Callable[[Set[Any]], None]] = []
 
 
 def ensure_data_dir():
@@ -14,68 +110,1205 @@ def ensure_data_dir():
     os.makedirs(DATA_DIR, exist_ok=True)
 
 
-def load_tasks() -> List[Dict[str, Any]]:
-    """Load tasks from tasks.json. Return empty list if file doesn't exist."""
-    ensure_data_dir()
+def _digest(data: bytes) -> str:
+    """Short content digest used to tie a journal to its snapshot."""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def new_task_id() -> str:
+    """Generate a persistent unique task id."""
+    return uuid.uuid4().hex[:12]
+
+
+def _normalize(items) -> int:
+    """Ensure all tasks have required fields (backward compatibility). Return number of ids assigned."""
+    assigned = 0
+    for item in items:
+        if "id" not in item:
+            item["id"] = new_task_id()
+            assigned += 1
+        if "title" not in item:
+            item["title"] = "Untitled"
+        if "done" not in item:
+            item["done"] = False
+        if "deadline" not in item:
+            item["deadline"] = None
+        if "mata_kuliah" not in item:
+            item["mata_kuliah"] = ""
+        if "deskripsi" not in item:
+            item["deskripsi"] = ""
+    return assigned
+
+
+def _shared(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class Task(MutableMapping):
+    """
+    Compact task record: one slot per field instead of a per-task dict.
+
+    Reads and writes like the task dict it replaces (``task["title"]``,
+    ``task.get``, ``task.update``, ``dict(task)``, equality with dicts), so UI
+    code is unchanged. Deadlines and subjects are interned, and keys outside
+    ``TASK_FIELDS`` are kept in ``extra`` so they round-trip through
+    tasks.json. Use ``to_dict()`` for JSON.
+    """
+
+    __slots__ = TASK_FIELDS + ("extra", "_seq")
+
+    def __init__(self, id=None, title="Untitled", done=False, deadline=None, mata_kuliah="", deskripsi="", extra=None):
+        self.id = id
+        self.title = title
+        self.done = done
+        self.deadline = deadline
+        self.mata_kuliah = mata_kuliah
+        self.deskripsi = deskripsi
+        self.extra: Optional[Dict[str, Any]] = extra
+        self._seq: Optional[int] = None  # insertion sequence number in the owning TaskList
+
+    @classmethod
+    def from_mapping(cls, item: Mapping) -> "Task":
+        """Record for a task dict (missing fields get their defaults)."""
+        if type(item) is Task:
+            return cls(*item.row())
+        get = item.get
+        deadline, subject = get("deadline"), get("mata_kuliah", "")
+        # Inlined _shared: this runs once per task on every JSON load
+        if type(deadline) is str:
+            deadline = sys.intern(deadline)
+        if type(subject) is str:
+            subject = sys.intern(subject)
+        extra = None
+        if not _TASK_FIELD_SET.issuperset(item):
+            extra = {key: value for key, value in item.items() if key not in _TASK_FIELD_SET}
+        return cls(get("id"), get("title", "Untitled"), get("done", False), deadline, subject, get("deskripsi", ""), extra)
+
+    def row(self) -> Tuple[Any, ...]:
+        """Field values in ``Task(*row)`` order (used by the snapshot cache)."""
+        return (self.id, self.title, self.done, self.deadline, self.mata_kuliah, self.deskripsi, self.extra)
+
+    def copy(self) -> "Task":
+        """A new record with the same values, not owned by any list."""
+        return Task(self.id, self.title, self.done, self.deadline, self.mata_kuliah, self.deskripsi,
+                    dict(self.extra) if self.extra else None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy, e.g. for JSON."""
+        item = {"id": self.id, "title": self.title, "done": self.done, "deadline": self.deadline,
+                "mata_kuliah": self.mata_kuliah, "deskripsi": self.deskripsi}
+        if self.extra:
+            item.update(self.extra)
+        return item
+
+    def __getitem__(self, key):
+        if key in _TASK_FIELD_SET:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in _TASK_FIELD_SET:
+            return getattr(self, key)
+        return default if self.extra is None else self.extra.get(key, default)
+
+    def __setitem__(self, key, value) -> None:
+        if key in _TASK_FIELD_SET:
+            setattr(self, key, _shared(value) if key in _SHARED_FIELDS else value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key) -> None:
+        if key in _TASK_FIELD_SET:
+            raise KeyError(f"{key!r} is a required task field")
+        if self.extra is None or key not in self.extra:
+            raise KeyError(key)
+        del self.extra[key]
+
+    def __contains__(self, key) -> bool:
+        return key in _TASK_FIELD_SET or (self.extra is not None and key in self.extra)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from TASK_FIELDS
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return len(TASK_FIELDS) + (len(self.extra) if self.extra else 0)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Task):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Task({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return (Task, self.row())
+
+
+def _from_normalized(items: List[Dict[str, Any]]) -> List[Task]:
+    """Task records for dicts that went through _normalize, built column by column (bulk loads)."""
+    intern = sys.intern
+    columns = [[item[name] for item in items] for name in TASK_FIELDS]
+    for i in (TASK_FIELDS.index("deadline"), TASK_FIELDS.index("mata_kuliah")):
+        columns[i] = [intern(v) if type(v) is str else v for v in columns[i]]
+    # Normalized dicts hold every field, so only longer ones have extra keys
+    width = len(TASK_FIELDS)
+    extras = [
+        None if len(item) == width else {k: v for k, v in item.items() if k not in _TASK_FIELD_SET}
+        for item in items
+    ]
+    return list(map(Task, *columns, extras))
+
+
+class TaskList:
+    """
+    Ordered task collection indexed by task id.
+
+    Iterates over tasks in insertion order like the old list, while lookups,
+    updates and deletes by id are O(1) (backed by an ordered dict). Tasks are
+    stored as ``Task`` records (dicts passed in are converted) and carry
+    their own sequence number. Attached indexes (see core.indexes) are kept
+    in sync by ``append``, ``update``, ``replace``, ``reorder`` and
+    ``remove``, so tasks should only change through them. Stored records are never changed in place, so a
+    reader holding one needs no lock.
+    """
+
+    def __init__(self, items=()):
+        self._by_id: Dict[Any, Task] = {}
+        self._next_seq = 0
+        self._indexes = []
+        self.extend(items)
+
+    @staticmethod
+    def _own(item) -> Task:
+        """The record to store for ``item``: itself if it is a free Task, else a new one."""
+        if type(item) is Task and item._seq is None:
+            return item
+        return Task.from_mapping(item)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, task_id) -> bool:
+        return task_id in self._by_id
+
+    def __repr__(self) -> str:
+        return f"TaskList({list(self._by_id.values())!r})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TaskList):
+            return list(self) == list(other)
+        return list(self) == other
+
+    def get(self, task_id) -> Optional[Task]:
+        """Return the task with this id, or None."""
+        return self._by_id.get(task_id)
+
+    def add_index(self, index) -> None:
+        """Attach an index, filling it with the current tasks."""
+        # Under the storage lock, so no task is appended between the fill and the attach
+        with _lock:
+            index.extend((task, task._seq) for task in self._by_id.values())
+            self._indexes.append(index)
+
+    def append(self, task: Dict[str, Any]) -> Task:
+        """Add a task at the end, assigning an id if it has none; return the stored record."""
+        task = self._own(task)
+        while task.id is None or task.id in self._by_id:
+            task.id = new_task_id()
+        self._by_id[task.id] = task
+        task._seq = seq = self._next_seq
+        self._next_seq += 1
+        for index in self._indexes:
+            index.add(task, seq)
+        return task
+
+    def extend(self, items: Iterable[Dict[str, Any]]) -> int:
+        """Append several tasks like ``append`` (indexes are bulk-loaded); return how many got a new id."""
+        by_id = self._by_id
+        seq = self._next_seq
+        entries = [] if self._indexes else None
+        assigned = 0
+        for task in items:
+            if type(task) is not Task or task._seq is not None:
+                task = Task.from_mapping(task)
+            if task.id is None or task.id in by_id:
+                assigned += 1
+                while task.id is None or task.id in by_id:
+                    task.id = new_task_id()
+            by_id[task.id] = task
+            task._seq = seq
+            if entries is not None:
+                entries.append((task, seq))
+            seq += 1
+        self._next_seq = seq
+        if entries:
+            for index in self._indexes:
+                index.extend(entries)
+        return assigned
+
+    def update(self, task_id, **fields) -> Optional[Task]:
+        """
+        Update fields of a task and return its new record (None if missing).
+
+        The stored record is replaced by an updated copy instead of being
+        changed in place (copy-on-write), so a reader still holding the old
+        record, e.g. a render on another thread, sees consistent values.
+        """
+        task = self._by_id.get(task_id)
+        if task is None:
+            return None
+        new = task.copy()
+        new.update(fields)
+        new._seq = task._seq
+        self._by_id[task_id] = new
+        for index in self._indexes:
+            index.update(new, new._seq)
+        return new
+
+    def replace(self, task: Dict[str, Any]) -> Optional[Task]:
+        """
+        Replace the record with ``task``'s id by ``task`` and return the new record (None if missing).
+
+        Unlike ``update`` the whole record is swapped, so keys ``task`` lacks are dropped.
+        """
+        old = self._by_id.get(task["id"])
+        if old is None:
+            return None
+        new = Task.from_mapping(task)
+        new._seq = old._seq
+        self._by_id[new.id] = new
+        for index in self._indexes:
+            index.update(new, new._seq)
+        return new
+
+    def reorder(self, ids: Iterable[Any]) -> None:
+        """
+        Put the tasks in the order of ``ids``; tasks not listed follow in their current order.
+
+        Every record is replaced by a renumbered copy and the indexes are
+        rebuilt (``reorder`` on each), so this is O(n): meant for rare bulk
+        changes such as following another writer's snapshot.
+        """
+        by_id = self._by_id
+        order = [by_id[task_id] for task_id in dict.fromkeys(ids) if task_id in by_id]
+        if len(order) < len(by_id):
+            listed = {task.id for task in order}
+            order.extend(task for task in by_id.values() if task.id not in listed)
+        new_by_id = {}
+        entries = []
+        for seq, task in enumerate(order):
+            task = task.copy()
+            task._seq = seq
+            new_by_id[task.id] = task
+            entries.append((task, seq))
+        self._by_id = new_by_id
+        self._next_seq = len(order)
+        for index in self._indexes:
+            index.reorder(entries)
+
+    def remove(self, task_id) -> Optional[Task]:
+        """Remove and return the task with this id (None if missing)."""
+        task = self._by_id.pop(task_id, None)
+        if task is not None:
+            seq, task._seq = task._seq, None
+            for index in self._indexes:
+                index.remove(task, seq)
+        return task
+
+    def clear(self) -> None:
+        """Remove every task (attached indexes are updated like for ``remove``)."""
+        with _lock:
+            for task_id in list(self._by_id):
+                self.remove(task_id)
+
+    def select(self, ids: Iterable[Any]) -> List[Task]:
+        """Tasks with these ids (unknown ids are skipped), in insertion order: O(m log m) for m ids."""
+        by_id = self._by_id
+        found = [task for task in map(by_id.get, ids) if task is not None]
+        found.sort(key=attrgetter("_seq"))
+        return found
+
+    def to_list(self) -> List[Task]:
+        """Tasks as a plain list."""
+        return list(self._by_id.values())
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Tasks as plain dicts (e.g. for JSON)."""
+        return [task.to_dict() for task in self._by_id.values()]
+
+
+def _read_journal(path: str):
+    """Return (base_digest, records, size) for a journal file, or None if missing."""
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            items = json.load(f)
-            # Ensure all tasks have required fields (backward compatibility)
-            for item in items:
-                if "title" not in item:
-                    item["title"] = "Untitled"
-                if "done" not in item:
-                    item["done"] = False
-                if "deadline" not in item:
-                    item["deadline"] = None
-                if "mata_kuliah" not in item:
-                    item["mata_kuliah"] = ""
-                if "deskripsi" not in item:
-                    item["deskripsi"] = ""
-            return items
+        with open(path, "rb") as f:
+            raw = f.read()
     except FileNotFoundError:
+        return None
+    base = None
+    records = []
+    for line in raw.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # Torn write at the tail (crash mid-append): ignore the rest
+            break
+        if base is None:
+            base = record.get("digest") if record.get("op") == "base" else ""
+            continue
+        records.append(record)
+    return base, records, len(raw)
+
+
+def _apply(tasks: TaskList, record: Dict[str, Any]) -> None:
+    """Apply one journal record to a task list."""
+    op = record.get("op")
+    if op == "add":
+        task = dict(record["task"])
+        _normalize([task])
+        tasks.append(task)
+        return
+    if "index" in record:
+        # Records written before tasks had ids address them by position
+        items = tasks.to_list()
+        index = record["index"]
+        task = items[index] if 0 <= index < len(items) else None
+    else:
+        task = tasks.get(record.get("id"))
+    if task is None:
+        return
+    if op == "update":
+        tasks.update(task["id"], **record.get("fields", {}))
+    elif op == "toggle":
+        tasks.update(task["id"], done=record["done"])
+    elif op == "delete":
+        tasks.remove(task["id"])
+
+
+def _open_journal(digest: str) -> List[Dict[str, Any]]:
+    """Records of the journal that belongs to the snapshot with ``digest`` (a stale journal is removed)."""
+    global _journal_size
+    journal = _read_journal(JOURNAL_FILE)
+    _journal_size = 0
+    if journal is None:
         return []
-    except json.JSONDecodeError:
+    base, records, size = journal
+    if base != digest:
+        # Journal predates the current snapshot (already compacted into it)
+        os.remove(JOURNAL_FILE)
         return []
+    _journal_size = size
+    return records
+
+
+def _replay_journal(tasks: TaskList) -> None:
+    """Replay the journal that belongs to the current snapshot onto items."""
+    for record in _open_journal(_snapshot_digest):
+        _apply(tasks, record)
+
+
+def _read_cache(stat: os.stat_result) -> Optional[Tuple[List[Task], str]]:
+    """Return (tasks, digest) from the snapshot cache if it matches tasks.json, else None."""
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            cache = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION or cache.get("size") != stat.st_size:
+        return None
+    if cache.get("mtime_ns") != stat.st_mtime_ns:
+        # Same size but touched (e.g. copied back): trust the cache only if the content hash matches
+        with open(DATA_FILE, "rb") as f:
+            if _digest(f.read()) != cache.get("digest"):
+                return None
+    return list(map(Task, *cache["columns"])), cache["digest"]
+
+
+def _write_cache(items: Iterable[Dict[str, Any]], digest: str) -> None:
+    """Pickle normalized tasks, one list per field, for the current tasks.json (best effort)."""
+    tasks = [item if type(item) is Task else Task.from_mapping(item) for item in items]
+    _store_cache([list(map(attrgetter(name), tasks)) for name in Task.__slots__[:-1]], digest)
+
+
+def _store_cache(columns: List[List[Any]], digest: str) -> None:
+    """Pickle task columns (in Task(*row) order) for the current tasks.json (best effort)."""
+    # One map(Task, ...) call loads them; subjects and deadlines are interned,
+    # so pickle writes (and loads) each distinct value once
+    try:
+        stat = os.stat(DATA_FILE)
+        cache = {"version": CACHE_VERSION, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "digest": digest, "columns": columns}
+        tmp = CACHE_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            instrument.add_bytes(CACHE_FILE, f.tell())
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        # The cache is only an accelerator; tasks.json stays authoritative
+        pass
+
+
+@instrument.timed("storage.load_tasks")
+def load_tasks() -> TaskList:
+    """Load tasks from tasks.json and replay the journal. Return an empty list if the file doesn't exist."""
+    global _snapshot_digest
+    ensure_data_dir()
+    # Pending writes land first; the worker (and other processes) wait while we read
+    with _saver.flushed(), _file_lock():
+        try:
+            stat = os.stat(DATA_FILE)
+        except FileNotFoundError:
+            stat = None
+        cached = _read_cache(stat) if stat is not None else None
+        if cached is not None:
+            items, _snapshot_digest = cached
+            assigned = 0
+        else:
+            try:
+                with open(DATA_FILE, "rb") as f:
+                    raw = f.read()
+                items = json.loads(raw)
+                _snapshot_digest = _digest(raw)
+            except FileNotFoundError:
+                raw, items = b"", []
+                _snapshot_digest = ""
+            except json.JSONDecodeError:
+                # Unreadable snapshot: keep what its journal added, set both files
+                # aside and start a valid snapshot, so later records are not
+                # appended to a journal no load can apply
+                _snapshot_digest = _digest(raw)
+                tasks = TaskList()
+                _replay_journal(tasks)
+                _set_aside_damaged()
+                _write_snapshot(tasks)
+                return tasks
+            assigned = _normalize(items)
+            items = _from_normalized(items)
+            # With new ids the snapshot is rewritten below, which refreshes the cache
+            if raw and not assigned:
+                _write_cache(items, _snapshot_digest)
+        tasks = TaskList(items)
+        _replay_journal(tasks)
+        if assigned:
+            # Persist newly assigned ids before any journal record refers to them
+            _write_snapshot(tasks)
+        _note_disk_state()
+        return tasks
 
 
-def save_tasks(tasks: List[Dict[str, Any]]) -> None:
-    """Save tasks to tasks.json."""
+def _set_aside_damaged() -> None:
+    """Rename an unreadable tasks.json and its journal to ``*.damaged-<time>`` (caller holds the I/O lock)."""
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    for path in (DATA_FILE, JOURNAL_FILE):
+        if os.path.exists(path):
+            os.replace(path, f"{path}.damaged-{stamp}")
+
+
+def _iter_array(f, chunk_size: int = STREAM_CHUNK_BYTES) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array from a binary file, reading it in chunks.
+
+    Only the unparsed tail of the text is kept between chunks, so memory is
+    bounded by the chunk size plus the largest element. Raises
+    json.JSONDecodeError on malformed input.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8-sig")()
+    buf, pos, opened = "", 0, False
+    while True:
+        chunk = f.read(chunk_size)
+        try:
+            buf = buf[pos:] + text.decode(chunk, final=not chunk)
+        except UnicodeDecodeError as exc:
+            raise json.JSONDecodeError(f"Invalid UTF-8 ({exc.reason})", buf, len(buf)) from exc
+        pos = 0
+        while True:
+            pos = _SKIP_RE.match(buf, pos).end()
+            if pos == len(buf):
+                break
+            if not opened:
+                if buf[pos] != "[":
+                    raise json.JSONDecodeError("Expecting '['", buf, pos)
+                opened, pos = True, pos + 1
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not chunk:
+                    raise
+                # The element continues in the next chunk
+                break
+            if end == len(buf) and chunk:
+                # A number may continue in the next chunk too
+                break
+            pos = end
+            yield item
+        if not chunk:
+            raise json.JSONDecodeError("Unterminated array", buf, len(buf))
+
+
+def iter_tasks(path: Optional[str] = None, chunk_size: int = STREAM_CHUNK_BYTES) -> Iterator[Task]:
+    """
+    Yield the tasks of a tasks.json file one at a time as normalized Task records.
+
+    The file is parsed element by element instead of being loaded whole.
+    Tasks without an id come back with ``id`` None; a TaskList assigns one
+    on append.
+    """
+    with open(path or DATA_FILE, "rb") as f:
+        for item in _iter_array(f, chunk_size):
+            if isinstance(item, dict):
+                yield Task.from_mapping(item)
+
+
+def _digest_file(f) -> str:
+    """_digest of a file's contents, read in chunks."""
+    hasher = hashlib.blake2b(digest_size=8)
+    for chunk in iter(lambda: f.read(STREAM_CHUNK_BYTES * 16), b""):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _apply_to_new(task: Task, records: List[Dict[str, Any]]) -> bool:
+    """Apply journal records to a task not yet in a list; return False if one deletes it."""
+    for record in records:
+        op = record.get("op")
+        if op == "delete":
+            return False
+        if op == "update":
+            task.update(record.get("fields", {}))
+        elif op == "toggle":
+            task["done"] = record["done"]
+    return True
+
+
+def _append_batch(tasks: TaskList, batch: List[Task], journal: Dict[Any, List[Dict[str, Any]]],
+                  columns: Optional[List[List[Any]]]) -> Tuple[List[Task], int]:
+    """Append a loaded batch, applying its journal records; return (appended tasks, ids assigned)."""
+    if columns is not None:
+        # The cache holds the snapshot as read, before the journal
+        for column, name in zip(columns, Task.__slots__[:-1]):
+            column.extend(map(attrgetter(name), batch))
+    if journal:
+        batch = [task for task in batch if _apply_to_new(task, journal.pop(task.id, ()))]
+    with _lock:
+        assigned = tasks.extend(batch)
+    return batch, assigned
+
+
+def _batches(items: Iterable[Any], first: int, size: int) -> Iterator[List[Any]]:
+    """Lists of ``first`` items, then ``size`` items, until ``items`` runs out."""
+    items = iter(items)
+    batch = list(islice(items, first))
+    while batch:
+        yield batch
+        batch = list(islice(items, size))
+
+
+def load_tasks_incrementally(
+    tasks: TaskList,
+    first_batch: int = STREAM_FIRST_BATCH,
+    batch_size: int = STREAM_BATCH,
+    progress: Optional[Callable[[float], None]] = None,
+) -> Iterator[List[Task]]:
+    """
+    Load the tasks into ``tasks`` a batch at a time, yielding each batch once it is in the list.
+
+    Same result as load_tasks, but tasks.json is parsed element by element:
+    memory stays bounded instead of holding the whole file and its parsed
+    copy, and a caller can show the first ``first_batch`` tasks while the
+    rest is still being read. The list may be changed through the usual
+    helpers meanwhile; their writes are queued until loading finishes (an
+    explicit flush still writes, but never compacts), and tasks added
+    meanwhile end up last, where a reload puts them. The generator may be
+    resumed from different threads. ``progress`` (if given) is called with
+    the fraction of the snapshot read so far before each batch is yielded.
+    """
+    global _snapshot_digest, _loading, _partial_ref
     ensure_data_dir()
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(tasks, f, indent=2, ensure_ascii=False)
+    started, first = time.perf_counter(), True
+    f = None
+    complete = False
+    with _lock:
+        _loading += 1
+    try:
+        with _saver.paused():
+            with _saver.flushed(), _file_lock():
+                try:
+                    stat = os.stat(DATA_FILE)
+                except FileNotFoundError:
+                    stat = None
+                cached = _read_cache(stat) if stat is not None else None
+                columns = None
+                if cached is not None:
+                    items, _snapshot_digest = cached
+                elif stat is not None:
+                    f = open(DATA_FILE, "rb")
+                    stat = os.fstat(f.fileno())
+                    # Hashed up front so the journal is matched (and new records
+                    # are based) before the first batch is shown
+                    _snapshot_digest = _digest_file(f)
+                    f.seek(0)
+                    items = (item for item in _iter_array(f) if isinstance(item, dict))
+                    columns = [[] for _ in Task.__slots__[:-1]]
+                else:
+                    items, _snapshot_digest = (), ""
+                records = _open_journal(_snapshot_digest)
+                _note_disk_state()
+
+            # Records for snapshot tasks are applied as each task arrives, so
+            # edits made while loading are never overwritten by older records.
+            # Records addressed by position need the whole list first.
+            journal: Dict[Any, List[Dict[str, Any]]] = {}
+            positional = any("index" in record for record in records)
+            if not positional:
+                for record in records:
+                    if record.get("op") in ("update", "toggle", "delete"):
+                        journal.setdefault(record.get("id"), []).append(record)
+
+            assigned = read = 0
+            damaged = False
+            loaded: List[Any] = []  # ids of the snapshot tasks, in order
+            first_seq = tasks._next_seq
+            batches = _batches(items, first_batch, batch_size)
+            while True:
+                try:
+                    batch = next(batches, None)
+                except json.JSONDecodeError:
+                    # Damaged snapshot: keep the batches already loaded and
+                    # replace the files below (as load_tasks does)
+                    damaged = True
+                    break
+                if batch is None:
+                    break
+                read += len(batch)
+                if columns is not None:
+                    # Same normalization as load_tasks, a batch at a time
+                    assigned += _normalize(batch)
+                    batch = _from_normalized(batch)
+                batch, count = _append_batch(tasks, batch, journal, columns)
+                loaded.extend(map(attrgetter("id"), batch))
+                assigned += count
+                if first:
+                    # Latency until something can be shown, then (below) until fully loaded
+                    instrument.record_latency("storage.load_first_batch", time.perf_counter() - started)
+                    first = False
+                if progress is not None:
+                    progress(f.tell() / max(stat.st_size, 1) if f is not None else read / len(items))
+                yield batch
+
+            with _saver.io(), _file_lock():
+                with _lock:
+                    # Tasks added while loading landed between batches; their
+                    # records follow the journal's, so a reload lists them last
+                    local = None
+                    if tasks._next_seq - first_seq > len(loaded):
+                        snapshot_ids = set(loaded)
+                        local = {task.id for task in tasks if task.id not in snapshot_ids}
+                    # The rest of the journal, in order: adds and records for the
+                    # tasks they added (or everything, for positional records)
+                    for record in records:
+                        if positional or record.get("op") == "add" or record.get("id") in journal:
+                            _apply(tasks, record)
+                    if local:
+                        tasks.reorder([task.id for task in tasks if task.id not in local])
+                    if assigned or damaged:
+                        items = tasks.to_dicts()
+                        # Anything still queued is already reflected in the copied list
+                        _settle(_saver.discard_pending())
+                if damaged:
+                    f.close()
+                    _set_aside_damaged()
+                if assigned or damaged:
+                    # Persist newly assigned ids before any journal record refers to them
+                    _write_snapshot(items)
+                elif columns is not None and stat.st_size:
+                    try:
+                        current = os.stat(DATA_FILE)
+                    except FileNotFoundError:
+                        current = None
+                    if current is not None and (current.st_mtime_ns, current.st_size) == (stat.st_mtime_ns, stat.st_size):
+                        _store_cache(columns, _snapshot_digest)
+            instrument.record_latency("storage.load_incremental", time.perf_counter() - started)
+            complete = True
+    finally:
+        if f is not None:
+            f.close()
+        with _lock:
+            _loading -= 1
+            # A failed or abandoned load leaves the list incomplete: writing it
+            # back as a snapshot would drop the tasks that were never read
+            if not complete:
+                _partial_ref = tasks
+            elif _partial_ref is tasks:
+                _partial_ref = None
+
+
+def _to_json(value):
+    """json.dumps hook: Task records are written as plain objects."""
+    if isinstance(value, Task):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@contextmanager
+def _file_lock():
+    """Hold the advisory lock that serializes writers across processes (no-op without flock)."""
+    if fcntl is None:
+        yield
+        return
+    ensure_data_dir()
+    with open(LOCK_FILE, "ab") as f:
+        # Released when the file is closed
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        yield
+
+
+def _note_disk_state() -> None:
+    """Remember the files as this process left them (caller holds the I/O lock)."""
+    global _disk_state
+    _disk_state = (file_signature(DATA_FILE), file_signature(JOURNAL_FILE))
+
+
+def _record_id(record: Dict[str, Any]) -> Any:
+    """Id of the task a journal record touches."""
+    if record.get("op") == "add":
+        return record["task"].get("id")
+    return record.get("id")
+
+
+def _settle(batch: List[Tuple[str, Any]]) -> None:
+    """Unmark queued items that reached the disk (or were folded into a snapshot)."""
+    global _pending_snapshots
+    with _lock:
+        for kind, payload in batch:
+            if kind == "snapshot":
+                _pending_snapshots -= 1
+                continue
+            for record in payload if kind == "records" else (payload,):
+                task_id = _record_id(record)
+                left = _pending_ids.get(task_id, 0) - 1
+                if left > 0:
+                    _pending_ids[task_id] = left
+                else:
+                    _pending_ids.pop(task_id, None)
+
+
+def _write_snapshot(items: Iterable[Dict[str, Any]]) -> None:
+    """Atomically replace tasks.json (temp file, fsync, rename) and drop the old journal."""
+    global _snapshot_digest, _journal_size
+    ensure_data_dir()
+    items = list(items)
+    data = json.dumps(items, indent=2, ensure_ascii=False, default=_to_json).encode("utf-8")
+    tmp = DATA_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, DATA_FILE)
+    instrument.add_bytes(DATA_FILE, len(data))
+    _snapshot_digest = _digest(data)
+    _write_cache(items, _snapshot_digest)
+    # A crash before this point leaves a journal whose base digest no longer
+    # matches the snapshot, so it is discarded on the next load.
+    if os.path.exists(JOURNAL_FILE):
+        os.remove(JOURNAL_FILE)
+    _journal_size = 0
+    _note_disk_state()
+
+
+def _append_records(records: List[Dict[str, Any]]) -> None:
+    """Append records to the journal in a single write."""
+    global _journal_size
+    ensure_data_dir()
+    lines = [json.dumps(r, ensure_ascii=False, separators=(",", ":")) for r in records]
+    if _journal_size == 0:
+        lines.insert(0, json.dumps({"op": "base", "digest": _snapshot_digest}))
+    data = ("\n".join(lines) + "\n").encode("utf-8")
+    with open(JOURNAL_FILE, "ab") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    _journal_size += len(data)
+    instrument.add_bytes(JOURNAL_FILE, len(data))
+    _note_disk_state()
+
+
+@instrument.timed("storage.write_batch")
+def _write_batch(batch: List[Tuple[str, Any]]) -> None:
+    """Perform queued writes (runs on the saver worker)."""
+    queued = batch
+    with _file_lock():
+        # Take in what other writers did first, so none of it is overwritten
+        changed = _sync_locked(_tasks_ref)
+        # The last full snapshot in the batch supersedes everything queued before it
+        for i in range(len(batch) - 1, -1, -1):
+            if batch[i][0] == "snapshot":
+                _write_snapshot(batch[i][1])
+                batch = batch[i + 1:]
+                break
+        records = []
+        for kind, payload in batch:
+            if kind == "record":
+                records.append(payload)
+            elif kind == "records":
+                records.extend(payload)
+        if records:
+            _append_records(records)
+        _settle(queued)
+        if _journal_size >= JOURNAL_COMPACT_BYTES and _tasks_ref is not None and not _loading and _tasks_ref is not _partial_ref:
+            _compact()
+    if changed:
+        # Listeners re-render; not from this thread, which holds the I/O lock
+        get_scheduler().call_later(0, _notify_watchers, changed)
+
+
+def _compact() -> None:
+    """Fold the journal into a new snapshot (runs on the saver worker)."""
+    with _lock:
+        items = [t.to_dict() for t in _tasks_ref]
+        # Anything still queued is already reflected in the copied list
+        _settle(_saver.discard_pending())
+    _write_snapshot(items)
+
+
+_saver = WriteBehindSaver(_write_batch)
+atexit.register(_saver.close)
+
 
+def _submit(tasks: TaskList, record: Dict[str, Any]) -> None:
+    """Queue one journal record (caller holds the lock)."""
+    global _tasks_ref
+    _tasks_ref = tasks
+    task_id = _record_id(record)
+    _pending_ids[task_id] = _pending_ids.get(task_id, 0) + 1
+    _saver.submit(("record", record))
 
-def add_task(tasks: List[Dict[str, Any]], title: str, mata_kuliah: str = "", deadline: str = None, deskripsi: str = "") -> Dict[str, Any]:
+
+def _submit_all(tasks: TaskList, records: List[Dict[str, Any]]) -> None:
+    """Queue journal records as one item, so they reach the disk in the same append (caller holds the lock)."""
+    global _tasks_ref
+    _tasks_ref = tasks
+    for record in records:
+        task_id = _record_id(record)
+        _pending_ids[task_id] = _pending_ids.get(task_id, 0) + 1
+    _saver.submit(("records", records))
+
+
+@instrument.timed("storage.save_tasks")
+def save_tasks(tasks: Iterable[Dict[str, Any]]) -> None:
+    """Save all tasks to tasks.json (written in the background) and start a fresh journal."""
+    global _tasks_ref, _pending_snapshots
+    with _lock:
+        _tasks_ref = tasks
+        _pending_snapshots += 1
+        _saver.submit(("snapshot", [t.to_dict() if type(t) is Task else dict(t) for t in tasks]))
+
+
+def flush_tasks() -> None:
+    """Block until every queued write has reached the disk (e.g. on app exit)."""
+    _saver.flush()
+
+
+def get_save_stats() -> Dict[str, Any]:
+    """Return write-behind statistics: save latency (ms), queue depth, write counts."""
+    return _saver.stats()
+
+
+def _read_store() -> Optional[Tuple[TaskList, str, int]]:
+    """tasks.json as (tasks, digest, ids assigned), without the journal; None if unreadable."""
+    try:
+        with open(DATA_FILE, "rb") as f:
+            raw = f.read()
+        items = json.loads(raw)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not isinstance(items, list):
+        return None
+    assigned = _normalize(items)
+    disk = TaskList()
+    assigned += disk.extend(_from_normalized(items))
+    return disk, _digest(raw), assigned
+
+
+def read_tasks() -> TaskList:
+    """
+    tasks.json with its journal replayed, for other readers (e.g. a migration).
+
+    Unlike load_tasks it writes nothing: no cache, no ids persisted, no repair
+    of a damaged snapshot, which raises ValueError instead.
+    """
+    with _saver.flushed(), _file_lock():
+        if not os.path.exists(DATA_FILE):
+            tasks, digest = TaskList(), ""
+        else:
+            stored = _read_store()
+            if stored is None:
+                raise ValueError(f"{DATA_FILE} is not a readable task list")
+            tasks, digest, _ = stored
+        journal = _read_journal(JOURNAL_FILE)
+    if journal is not None and journal[0] == digest:
+        for record in journal[1]:
+            _apply(tasks, record)
+    return tasks
+
+
+def _merge_record(tasks: TaskList, record: Dict[str, Any]) -> Any:
+    """Apply another writer's journal record unless a local change wins; return the id it changed or None."""
+    task_id = _record_id(record)
+    if task_id in _pending_ids or "index" in record:
+        return None
+    if (record.get("op") == "add") == (task_id in tasks):
+        # An add we already have, or a change to a task we don't
+        return None
+    _apply(tasks, record)
+    return task_id
+
+
+def _merge_tasks(tasks: TaskList, disk: TaskList) -> Set[Any]:
+    """
+    Make ``tasks`` match ``disk`` except where local changes are queued; return the changed ids.
+
+    Tasks end up in disk order, with local additions not yet on disk after
+    them. Changed tasks take the disk record whole, so keys removed there are
+    removed here too.
+    """
+    changed = set()
+    added = False
+    for task in disk:
+        task_id = task.id
+        if task_id in _pending_ids:
+            continue
+        local = tasks.get(task_id)
+        if local is None:
+            tasks.append(task)
+            added = True
+        elif local.row() != task.row():
+            tasks.replace(task)
+        else:
+            continue
+        changed.add(task_id)
+    gone = [task.id for task in tasks if task.id not in disk and task.id not in _pending_ids]
+    for task_id in gone:
+        tasks.remove(task_id)
+    changed.update(gone)
+    if added:
+        # Appended above; move them to where the other writer put them
+        order = [task_id for task_id in map(attrgetter("id"), disk) if task_id in tasks]
+        if [task.id for task in islice(tasks, len(order))] != order:
+            tasks.reorder(order)
+    return changed
+
+
+def _sync_locked(tasks: Optional[TaskList]) -> Set[Any]:
+    """
+    Merge changes another writer made to the files into ``tasks``; return the changed ids.
+
+    Caller holds the saver's I/O lock and the file lock. Tasks with queued
+    local changes keep them (they are written next); everything else follows
+    the files. Appended journal records are read from where this process
+    left off; a replaced snapshot is read in full and diffed.
+    """
+    global _snapshot_digest, _journal_size
+    if tasks is None or tasks is _partial_ref or _disk_state is None or _loading or _pending_snapshots:
+        # Nothing loaded yet, or a queued snapshot is about to replace the files anyway
+        return set()
+    snapshot, journal = state = (file_signature(DATA_FILE), file_signature(JOURNAL_FILE))
+    if state == _disk_state:
+        return set()
+    changed: Set[Any] = set()
+    if snapshot is None:
+        # tasks.json was removed: write it back from memory
+        save_tasks(tasks)
+    elif snapshot == _disk_state[0]:
+        # Same snapshot, so only the journal changed; a replaced journal is
+        # read from the start (records already applied are skipped as no-ops)
+        previous = _disk_state[1]
+        offset = _journal_size if previous is not None and journal is not None and journal[0] == previous[0] else 0
+        raw = b""
+        if journal is not None:
+            with open(JOURNAL_FILE, "rb") as f:
+                f.seek(offset)
+                raw = f.read()
+        # A line still being written is read again next time
+        raw = raw[:raw.rfind(b"\n") + 1]
+        records = []
+        for line in raw.split(b"\n"):
+            if line.strip():
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+        if offset == 0 and records:
+            base = records.pop(0)
+            if base.get("op") != "base" or base.get("digest") != _snapshot_digest:
+                # Not a journal for our snapshot: drop it, as a load would
+                os.remove(JOURNAL_FILE)
+                records, raw = [], b""
+        with _lock:
+            for record in records:
+                task_id = _merge_record(tasks, record)
+                if task_id is not None:
+                    changed.add(task_id)
+        _journal_size = offset + len(raw)
+    else:
+        fresh = _read_store()
+        if fresh is None:
+            # Mid-write by a writer that doesn't replace atomically: try again on the next change
+            return set()
+        disk, _snapshot_digest, assigned = fresh
+        for record in _open_journal(_snapshot_digest):
+            _apply(disk, record)
+        with _lock:
+            changed = _merge_tasks(tasks, disk)
+        if assigned:
+            # The other writer left tasks without ids: persist ours before records refer to them
+            save_tasks(tasks)
+    _note_disk_state()
+    return changed
+
+
+def sync_tasks(tasks: TaskList) -> Set[Any]:
+    """
+    Merge changes another process made to tasks.json or the journal into ``tasks`` now.
+
+    Returns the ids of the tasks that were added, changed or removed. Tasks
+    with unsaved local changes keep them.
+    """
+    with _saver.io(), _file_lock():
+        return _sync_locked(tasks)
+
+
+def _notify_watchers(changed: Set[Any]) -> None:
+    for listener in list(_watch_listeners):
+        try:
+            listener(changed)
+        except Exception:
+            traceback.print_exc()
+
+
+def _on_store_files_changed(names: Set[str]) -> None:
+    """FileWatcher callback: merge the change and tell the listeners."""
+    tasks = _tasks_ref
+    if tasks is None or _loading:
+        return
+    with _watch_lock or nullcontext():
+        changed = sync_tasks(tasks)
+    if changed:
+        _notify_watchers(changed)
+
+
+def watch_tasks(tasks: TaskList, on_change: Callable[[Set[Any]], None], lock=None) -> None:
+    """
+    Keep ``tasks`` in step with other writers (another window, a script, a sync tool).
+
+    tasks.json and the journal are watched with inotify where available
+    (and WATCH_USE_INOTIFY is set), otherwise polled every
+    WATCH_POLL_INTERVAL seconds. After each merge,
+    ``on_change`` is called with the changed ids from a background thread.
+    Merges hold ``lock`` (if given), so code that reads ``tasks`` under it
+    never sees one half-applied. Anything changed before the call (e.g.
+    while loading) is merged first.
+    """
+    global _tasks_ref, _watcher, _watch_lock
+    with _lock:
+        _tasks_ref = tasks
+        _watch_lock = lock
+        if on_change not in _watch_listeners:
+            _watch_listeners.append(on_change)
+        if _watcher is None:
+            names = (os.path.basename(DATA_FILE), os.path.basename(JOURNAL_FILE))
+            _watcher = FileWatcher(DATA_DIR, names, _on_store_files_changed, interval=WATCH_POLL_INTERVAL,
+                                   use_inotify=WATCH_USE_INOTIFY)
+            _watcher.start()
+    with lock or nullcontext():
+        changed = sync_tasks(tasks)
+    if changed:
+        on_change(changed)
+
+
+def unwatch_tasks(on_change: Optional[Callable[[Set[Any]], None]] = None) -> None:
+    """Stop calling ``on_change`` (every listener if None); the watcher stops with the last one."""
+    global _watcher
+    with _lock:
+        if on_change is None:
+            _watch_listeners.clear()
+        elif on_change in _watch_listeners:
+            _watch_listeners.remove(on_change)
+        if not _watch_listeners and _watcher is not None:
+            _watcher.stop()
+            _watcher = None
+
+
+def get_task(tasks: TaskList, task_id) -> Optional[Task]:
+    """Return the task with the given id (None if missing)."""
+    return tasks.get(task_id)
+
+
+def add_task(tasks: TaskList, title: str, mata_kuliah: str = "", deadline: str = None, deskripsi: str = "") -> Task:
     """Add a new task with all parameters and return the created task object."""
-    task = {
-        "title": title.strip(),
-        "done": False,
-        "deadline": deadline,
-        "mata_kuliah": mata_kuliah.strip(),
-        "deskripsi": deskripsi.strip(),
-    }
-    tasks.append(task)
-    save_tasks(tasks)
+    task = Task(new_task_id(), title.strip(), False, _shared(deadline), _shared(mata_kuliah.strip()), deskripsi.strip())
+    with _lock:
+        task = tasks.append(task)
+        _submit(tasks, {"op": "add", "task": task.to_dict()})
     return task
 
 
-def update_task(tasks: List[Dict[str, Any]], index: int, **kwargs) -> None:
-    """Update a task at the given index with provided kwargs."""
-    if 0 <= index < len(tasks):
-        tasks[index].update(kwargs)
-        save_tasks(tasks)
+@instrument.timed("storage.add_tasks")
+def add_tasks(tasks: TaskList, items: List[Dict[str, Any]]) -> List[Task]:
+    """
+    Add many tasks at once (e.g. an import) with a single write; return the stored records.
 
+    Items are normalized in place; ones whose id is taken get a new id. Fewer
+    than BULK_SNAPSHOT_TASKS tasks are journaled (one append), more are saved
+    as one snapshot.
+    """
+    _normalize(items)
+    records = _from_normalized(items)
+    with _lock:
+        tasks.extend(records)
+        if len(records) >= BULK_SNAPSHOT_TASKS:
+            save_tasks(tasks)
+        else:
+            _submit_all(tasks, [{"op": "add", "task": task.to_dict()} for task in records])
+    return records
+
+
+def update_task(tasks: TaskList, task_id, **kwargs) -> None:
+    """Update the task with the given id with provided kwargs."""
+    kwargs.pop("id", None)
+    with _lock:
+        if tasks.update(task_id, **kwargs) is not None:
+            _submit(tasks, {"op": "update", "id": task_id, "fields": kwargs})
 
-def delete_task(tasks: List[Dict[str, Any]], index: int) -> None:
-    """Delete a task at the given index."""
-    if 0 <= index < len(tasks):
-        del tasks[index]
-        save_tasks(tasks)
 
+def delete_task(tasks: TaskList, task_id) -> None:
+    """Delete the task with the given id."""
+    with _lock:
+        if tasks.remove(task_id) is not None:
+            _submit(tasks, {"op": "delete", "id": task_id})
 
-def toggle_task(tasks: List[Dict[str, Any]], index: int) -> None:
+
+def toggle_task(tasks: TaskList, task_id) -> None:
     """Toggle the 'done' status of a task."""
-    if 0 <= index < len(tasks):
-        tasks[index]["done"] = not tasks[index]["done"]
-        save_tasks(tasks)
+    with _lock:
+        task = tasks.get(task_id)
+        if task is not None:
+            task = tasks.update(task_id, done=not task["done"])
+            _submit(tasks, {"op": "toggle", "id": task_id, "done": task["done"]})
@@ -0,0 +1,153 @@
+"""
+Process-wide task store shared by every session.
+
+With ``ft.app(target=main, view=ft.WEB_BROWSER)`` each browser tab is a
+session that runs ``main`` on its own page. Instead of loading its own copy
+of the tasks, every session uses the one ``TaskStore``: the task list and its
+indexes exist once, so memory is O(tasks) rather than O(tasks x sessions).
+The first session to connect loads the store in the background; later
+sessions start from memory without touching the disk.
+
+Writers are serialized by core.storage's lock, which every mutation helper
+holds. Readers take no lock: ``TaskList.update`` replaces records instead of
+changing them and ``GroupIndex`` member lists are immutable (a change copies
+one chunk), so a render keeps a consistent snapshot while writes go on. After each write
+the changed task ids are broadcast on the ``TOPIC`` pubsub topic and every
+session re-renders on its own thread.
+
+If the load fails, the error is kept in ``error`` and broadcast like a
+batch, and the next session to connect tries again from an empty list.
+"""
+import threading
+import traceback
+from typing import Any, Callable, Dict, Optional, Set
+
+from core import storage
+
+# Flet pubsub topic; messages are sets of changed task ids, or None for "many"
+TOPIC = "tasks"
+
+
+class TaskStore:
+    """One task list and its shared indexes, with change broadcasts to the connected sessions."""
+
+    def __init__(self):
+        self.tasks = storage.TaskList()
+        self.loaded = threading.Event()  # set once the load has finished (check error)
+        self.first_batch = False  # True once the first batch is in (something to show)
+        self.progress = 0.0  # fraction of tasks.json read by the load
+        self.error: Optional[str] = None  # why the last load failed (None if it did not)
+        self._complete = False  # every task is in the list
+        self._lock = threading.Lock()  # guards the fields below
+        self._indexes: Dict[str, Any] = {}
+        self._started = False
+        self._pubsub = None  # a session's page.pubsub; sends through it reach every session
+
+    def index(self, name: str, factory: Callable[[], Any]) -> Any:
+        """The shared index called ``name``, created with ``factory()`` and attached on first use."""
+        with self._lock:
+            index = self._indexes.get(name)
+            if index is None:
+                index = self._indexes[name] = factory()
+                self.tasks.add_index(index)
+            return index
+
+    def connect(self, page, on_change: Callable[[Optional[Set[Any]]], None]) -> None:
+        """
+        Subscribe a session to changes; the first session also starts the load.
+
+        ``on_change(ids)`` runs on the session's own thread pool after each
+        change made outside it: load batches (ids None), writes by other
+        sessions and merged changes from other processes. Flet drops the
+        subscription when the session closes. If the last load failed,
+        connecting starts it again.
+        """
+        page.pubsub.subscribe_topic(TOPIC, lambda topic, ids: on_change(ids))
+        with self._lock:
+            self._pubsub = page.pubsub
+            start, self._started = not self._started, True
+        if start:
+            page.run_thread(self._load)
+
+    def publish(self, ids: Optional[Set[Any]], origin=None) -> None:
+        """Broadcast changed task ids (None: many); a write made by page ``origin`` is not echoed back to it."""
+        if origin is not None:
+            origin.pubsub.send_others_on_topic(TOPIC, ids)
+        elif self._pubsub is not None:
+            self._pubsub.send_all_on_topic(TOPIC, ids)
+
+    def _load(self) -> None:
+        """Stream the tasks in (unless an earlier run did), then follow other writers."""
+        try:
+            if not self._complete:
+                self._load_tasks()
+            storage.watch_tasks(self.tasks, self.publish)
+        except Exception as exc:
+            traceback.print_exc()
+            if not self._complete:
+                # Drop the part that was read, so a retry does not add it twice
+                self.tasks.clear()
+                self.error = f"{type(exc).__name__}: {exc}"
+            with self._lock:
+                self._started = False  # the next session to connect tries again
+            self.first_batch = True
+            self.loaded.set()
+            self.publish(None)
+
+    def _load_tasks(self) -> None:
+        """Stream the tasks into the list, broadcasting each batch."""
+        self.error = None
+        self.loaded.clear()
+        for _ in storage.load_tasks_incrementally(self.tasks, progress=self._on_progress):
+            self.first_batch = True
+            self.publish(None)
+        self._complete = True
+        self.first_batch = True
+        self.loaded.set()
+        self.publish(None)
+
+    def _on_progress(self, fraction: float) -> None:
+        self.progress = fraction
+
+    def add_task(self, title: str, mata_kuliah: str = "", deadline: str = None, deskripsi: str = "", origin=None) -> storage.Task:
+        """Add a task (see core.storage.add_task) and broadcast it."""
+        task = storage.add_task(self.tasks, title, mata_kuliah=mata_kuliah, deadline=deadline, deskripsi=deskripsi)
+        self.publish({task["id"]}, origin)
+        return task
+
+    def update_task(self, task_id, origin=None, **fields) -> None:
+        """Update a task's fields and broadcast the change."""
+        storage.update_task(self.tasks, task_id, **fields)
+        self.publish({task_id}, origin)
+
+    def toggle_task(self, task_id, origin=None) -> None:
+        """Flip a task's done flag and broadcast the change."""
+        storage.toggle_task(self.tasks, task_id)
+        self.publish({task_id}, origin)
+
+    def delete_task(self, task_id, origin=None) -> None:
+        """Delete a task and broadcast the change."""
+        storage.delete_task(self.tasks, task_id)
+        self.publish({task_id}, origin)
+
+
+_default: Optional[TaskStore] = None
+_default_lock = threading.Lock()
+
+
+def get_task_store() -> TaskStore:
+    """Return the process-wide task store (the first session to connect loads it)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = TaskStore()
+        return _default
+
+
+def reset_task_store() -> None:
+    """Drop the shared store, so the next session loads from disk again (benchmarks, tests)."""
+    global _default
+    with _default_lock:
+        if _default is not None:
+            storage.unwatch_tasks(_default.publish)
+        _default = None
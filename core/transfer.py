@@ -0,0 +1,549 @@
+"""
+Bulk import and export of tasks: CSV, JSON Lines and iCalendar (VTODO).
+
+Imports are a generator pipeline: records are read from the file one at a
+time, validated and normalized in batches of ``IMPORT_BATCH`` and committed
+to the task list with one write (``core.storage.add_tasks``). Files of
+``PARALLEL_MIN_BYTES`` or more are split at record boundaries and parsed by a
+process pool. Invalid records are skipped and reported with their line
+number; tasks whose id is already in the list are skipped as duplicates, so
+importing an export twice adds nothing.
+
+Exports stream the tasks to a temporary file that replaces the target once
+it is complete.
+
+Usage::
+
+    python -m core.transfer import tasks.csv
+    python -m core.transfer import todo.txt --format jsonl
+    python -m core.transfer export backup.ics
+
+To import into the shared store (core.store) call ``import_tasks`` with
+``store.tasks`` and broadcast afterwards with ``store.publish(None)``.
+"""
+import argparse
+import csv
+import datetime
+import functools
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core import instrument, storage
+
+FORMATS = ("csv", "jsonl", "ics")
+EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".ics": "ics", ".ical": "ics"}
+
+# Records validated per batch (sequential parsing)
+IMPORT_BATCH = 5000
+
+# Files at least this large are parsed by a process pool (when there is more than one CPU)
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+# Ranges per worker, so a slow range does not hold up the others
+PARALLEL_SPLIT = 4
+
+NO_DEADLINE = "No deadline"
+CSV_FIELDS = ("id", "title", "done", "deadline", "mata_kuliah", "deskripsi")
+# Column names other tools use for our fields (matched case-insensitively)
+FIELD_ALIASES = {
+    "summary": "title",
+    "name": "title",
+    "completed": "done",
+    "status": "done",
+    "due": "deadline",
+    "due_date": "deadline",
+    "subject": "mata_kuliah",
+    "course": "mata_kuliah",
+    "description": "deskripsi",
+    "notes": "deskripsi",
+}
+TRUE_WORDS = frozenset(("1", "true", "yes", "y", "x", "done", "completed"))
+
+_DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y%m%d", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y")
+_NO_DEADLINE_WORDS = frozenset(("", "-", "none", "null", "no deadline"))
+
+# iCalendar (RFC 5545): lines are folded at 75 octets and text values escaped
+ICS_LINE_OCTETS = 75
+_ICS_ESCAPES = {"n": "\n", "N": "\n", ",": ",", ";": ";", "\\": "\\"}
+_ICS_UNESCAPE = re.compile(r"\\([nN,;\\])")
+
+Row = Tuple[int, Any]  # (line number, field dict or the ValueError that made it unreadable)
+
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    """``fmt`` if given, else the format of the file's extension; raise ValueError if unknown."""
+    if fmt is None:
+        fmt = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if fmt is None:
+            raise ValueError(f"Cannot tell the format of {path!r}; pass one of {', '.join(FORMATS)}")
+    elif fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    return fmt
+
+
+# --- validation -------------------------------------------------------------
+
+def _clean_text(value) -> str:
+    """One line of text with runs of whitespace collapsed."""
+    if value is None:
+        return ""
+    return " ".join(str(value).split())
+
+
+def _clean_block(value) -> str:
+    """Multi-line text with normalized line endings and no surrounding whitespace."""
+    if value is None:
+        return ""
+    return str(value).replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+def _flag(value) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_WORDS
+    return bool(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_deadline(text: str) -> str:
+    """"YYYY-MM-DD" (or NO_DEADLINE) for a date in any of _DATE_FORMATS; raise ValueError otherwise."""
+    if text.lower() in _NO_DEADLINE_WORDS:
+        return NO_DEADLINE
+    # Dates with a time ("2025-06-01T09:00", iCalendar "20250601T090000Z"): keep the day
+    day = text.split("T", 1)[0].split(" ", 1)[0]
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(day, fmt).date().isoformat()
+        except ValueError:
+            pass
+    raise ValueError(f"unrecognized deadline {text!r}")
+
+
+def _deadline(value) -> str:
+    if value is None:
+        return NO_DEADLINE
+    if not isinstance(value, str):
+        raise ValueError(f"unrecognized deadline {value!r}")
+    return _parse_deadline(value.strip())
+
+
+def normalize_batch(rows: Iterable[Row]) -> Tuple[List[Dict[str, Any]], List[Tuple[int, str]]]:
+    """
+    Validate and normalize a batch of read records.
+
+    Titles are required and collapsed to one line, deadlines are turned into
+    "YYYY-MM-DD" or "No deadline", subjects are trimmed and descriptions keep
+    their line breaks. Ids are kept as strings; other fields are passed on
+    (they end up in ``Task.extra``).
+
+    Returns:
+        (task dicts, errors as (line, reason))
+    """
+    tasks: List[Dict[str, Any]] = []
+    errors: List[Tuple[int, str]] = []
+    for line, row in rows:
+        if isinstance(row, ValueError):
+            errors.append((line, str(row)))
+            continue
+        title = _clean_text(row.get("title"))
+        if not title:
+            errors.append((line, "missing title"))
+            continue
+        try:
+            deadline = _deadline(row.get("deadline"))
+        except ValueError as err:
+            errors.append((line, str(err)))
+            continue
+        task = {
+            "title": title,
+            "done": _flag(row.get("done")),
+            "deadline": deadline,
+            "mata_kuliah": _clean_text(row.get("mata_kuliah")),
+            "deskripsi": _clean_block(row.get("deskripsi")),
+        }
+        task_id = _clean_text(row.get("id"))
+        if task_id:
+            task["id"] = task_id
+        for key, value in row.items():
+            if key not in storage.TASK_FIELDS and value not in (None, ""):
+                task[key] = value
+        tasks.append(task)
+    return tasks, errors
+
+
+# --- readers ----------------------------------------------------------------
+# Each reader turns lines of text into (line number, field dict) rows; a
+# record that cannot be read becomes (line number, ValueError).
+
+def _csv_columns(header: List[str]) -> List[str]:
+    """Field name for each CSV column (known fields and their aliases; other names as they are)."""
+    columns = []
+    for name in header:
+        key = name.strip().lower().replace(" ", "_")
+        columns.append(FIELD_ALIASES.get(key, key) if key else "")
+    return columns
+
+
+def _read_csv(text: io.StringIO, first_line: int = 1, columns: Optional[List[str]] = None) -> Iterator[Row]:
+    reader = csv.reader(text)
+    if columns is None:
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = _csv_columns(header)
+    offset = first_line - 1
+    line = reader.line_num
+    for values in reader:
+        start, line = line + 1, reader.line_num
+        if not values:
+            continue
+        yield offset + start, {name: value for name, value in zip(columns, values) if name}
+
+
+def _read_jsonl(text: io.StringIO, first_line: int = 1) -> Iterator[Row]:
+    for line, raw in enumerate(text, first_line):
+        if not raw.strip():
+            continue
+        try:
+            row = json.loads(raw)
+        except json.JSONDecodeError as err:
+            yield line, ValueError(f"invalid JSON: {err.msg}")
+            continue
+        if isinstance(row, dict):
+            yield line, row
+        else:
+            yield line, ValueError("expected a JSON object")
+
+
+def _ics_unescape(value: str) -> str:
+    return _ICS_UNESCAPE.sub(lambda m: _ICS_ESCAPES[m.group(1)], value)
+
+
+def _ics_property(line: str) -> Tuple[str, str]:
+    """(upper-case name, raw value) of a content line; parameters are dropped."""
+    quoted = False
+    for i, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ":" and not quoted:
+            return line[:i].split(";", 1)[0].upper(), line[i + 1:]
+    return line.upper(), ""
+
+
+def _ics_lines(text: io.StringIO, first_line: int) -> Iterator[Tuple[int, str]]:
+    """Unfolded content lines with the number of the line each starts on."""
+    start, current = first_line, None
+    for line, raw in enumerate(text, first_line):
+        raw = raw.rstrip("\r\n")
+        if raw[:1] in (" ", "\t") and current is not None:
+            current += raw[1:]
+            continue
+        if current is not None:
+            yield start, current
+        start, current = line, raw
+    if current is not None:
+        yield start, current
+
+
+def _read_ics(text: io.StringIO, first_line: int = 1) -> Iterator[Row]:
+    todo: Optional[Dict[str, Any]] = None
+    start = first_line
+    for line, content in _ics_lines(text, first_line):
+        name, value = _ics_property(content)
+        if name == "BEGIN" and value.upper() == "VTODO":
+            todo, start = {}, line
+        elif todo is None:
+            continue
+        elif name == "END" and value.upper() == "VTODO":
+            yield start, todo
+            todo = None
+        elif name == "UID":
+            todo["id"] = value
+        elif name == "SUMMARY":
+            todo["title"] = _ics_unescape(value)
+        elif name == "DESCRIPTION":
+            todo["deskripsi"] = _ics_unescape(value)
+        elif name == "DUE":
+            todo["deadline"] = value
+        elif name == "CATEGORIES":
+            # First category; commas inside a category are escaped
+            todo["mata_kuliah"] = _ics_unescape(re.split(r"(?<!\\),", value, 1)[0])
+        elif name == "STATUS":
+            todo["done"] = value.upper() == "COMPLETED"
+        elif name == "COMPLETED":
+            todo["done"] = True
+    if todo is not None:
+        yield start, ValueError("VTODO without END:VTODO")
+
+
+_READERS = {"csv": _read_csv, "jsonl": _read_jsonl, "ics": _read_ics}
+
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Row]:
+    """Stream (line number, fields) for each record in a CSV, JSON Lines or iCalendar file."""
+    fmt = detect_format(path, fmt)
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        yield from _READERS[fmt](f)
+
+
+# --- parallel parsing -------------------------------------------------------
+
+def _boundary(data: bytes, fmt: str, pos: int, quotes: List[int]) -> int:
+    """
+    First record boundary at or after ``pos`` (``len(data)`` if none).
+
+    CSV fields may hold line breaks inside quotes: a line break ends a record
+    only when an even number of quote characters precede it (escaped quotes
+    come in pairs). ``quotes`` is [offset, quotes before offset], advanced in
+    place so the file is counted once.
+    """
+    if fmt == "ics":
+        found = data.find(b"\nBEGIN:VTODO", max(pos - 1, 0))
+        return len(data) if found < 0 else found + 1
+    while True:
+        found = data.find(b"\n", pos)
+        if found < 0:
+            return len(data)
+        pos = found + 1
+        if fmt != "csv":
+            return pos
+        quotes[1] += data.count(b'"', quotes[0], pos)
+        quotes[0] = pos
+        if quotes[1] % 2 == 0:
+            return pos
+
+
+def _split(data: bytes, fmt: str, start: int, parts: int) -> List[Tuple[int, int, int]]:
+    """(start, end, first line) ranges of ``data[start:]`` that hold whole records."""
+    ranges = []
+    quotes = [0, data.count(b'"', 0, start)] if fmt == "csv" else [0, 0]
+    quotes[0] = start
+    line = data.count(b"\n", 0, start) + 1
+    size = len(data) - start
+    for i in range(1, parts + 1):
+        end = len(data) if i == parts else _boundary(data, fmt, max(start + size * i // parts, start), quotes)
+        if end > start:
+            ranges.append((start, end, line))
+            line += data.count(b"\n", start, end)
+            start = end
+    return ranges
+
+
+def _parse_range(path: str, fmt: str, span: Tuple[int, int, int], columns: Optional[List[str]]):
+    """Worker: read and normalize the records in one byte range of the file."""
+    start, end, first_line = span
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8-sig" if start == 0 else "utf-8")
+    stream = io.StringIO(text, newline="")
+    rows = _read_csv(stream, first_line, columns) if fmt == "csv" else _READERS[fmt](stream, first_line)
+    return normalize_batch(rows)
+
+
+def _parallel_batches(path: str, fmt: str, workers: int):
+    with open(path, "rb") as f:
+        data = f.read()
+    start, columns = 0, None
+    if fmt == "csv":
+        # The header is parsed here and handed to every worker
+        start = _boundary(data, fmt, 0, [0, 0])
+        header = next(csv.reader(io.StringIO(data[:start].decode("utf-8-sig"), newline="")), None)
+        if header is None:
+            return
+        columns = _csv_columns(header)
+    ranges = _split(data, fmt, start, workers * PARALLEL_SPLIT)
+    del data
+    with ProcessPoolExecutor(workers) as pool:
+        yield from pool.map(_parse_range, repeat(path), repeat(fmt), ranges, repeat(columns))
+
+
+def _batches(path: str, fmt: str, workers: Optional[int]):
+    """(tasks, errors) per batch, in file order."""
+    if workers is None:
+        workers = (os.cpu_count() or 1) if os.path.getsize(path) >= PARALLEL_MIN_BYTES else 1
+    if workers > 1:
+        yield from _parallel_batches(path, fmt, workers)
+        return
+    rows = read_records(path, fmt)
+    while True:
+        batch = list(islice(rows, IMPORT_BATCH))
+        if not batch:
+            return
+        yield normalize_batch(batch)
+
+
+@instrument.timed("transfer.import")
+def import_tasks(path: str, tasks: Optional[storage.TaskList] = None, fmt: Optional[str] = None,
+                 workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Import the tasks in a CSV, JSON Lines or iCalendar file with one write.
+
+    Args:
+        path: file to read
+        tasks: list to add to (default: the saved tasks, loaded here and flushed after the import)
+        fmt: "csv", "jsonl" or "ics" (default: from the file extension)
+        workers: parsing processes (default: one per CPU for files of
+            PARALLEL_MIN_BYTES or more, else parsed in this process)
+
+    Returns:
+        dict with imported (count), duplicates (count), errors
+        ((line, reason) per skipped record) and seconds
+    """
+    started = time.perf_counter()
+    fmt = detect_format(path, fmt)
+    own = tasks is None
+    if own:
+        tasks = storage.load_tasks()
+    items: List[Dict[str, Any]] = []
+    errors: List[Tuple[int, str]] = []
+    seen = set()
+    duplicates = 0
+    for batch, batch_errors in _batches(path, fmt, workers):
+        errors.extend(batch_errors)
+        for task in batch:
+            task_id = task.get("id")
+            if task_id is not None:
+                if task_id in seen or task_id in tasks:
+                    duplicates += 1
+                    continue
+                seen.add(task_id)
+            items.append(task)
+    added = storage.add_tasks(tasks, items) if items else []
+    if own:
+        storage.flush_tasks()
+    return {
+        "imported": len(added),
+        "duplicates": duplicates,
+        "errors": errors,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+# --- writers ----------------------------------------------------------------
+# Each writer streams the tasks to an open text file.
+
+def _export_deadline(task) -> str:
+    deadline = task.get("deadline")
+    return "" if deadline in (None, NO_DEADLINE) else deadline
+
+
+def _write_csv(f, tasks: Iterable[Dict[str, Any]]) -> None:
+    writer = csv.writer(f)
+    writer.writerow(CSV_FIELDS)
+    writer.writerows(
+        (t["id"], t["title"], "true" if t["done"] else "false", _export_deadline(t), t["mata_kuliah"], t["deskripsi"])
+        for t in tasks
+    )
+
+
+def _write_jsonl(f, tasks: Iterable[storage.Task]) -> None:
+    encode = json.JSONEncoder(ensure_ascii=False).encode  # json.dumps builds an encoder per call
+    f.writelines(encode(t.to_dict()) + "\n" for t in tasks)
+
+
+def _ics_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n")
+
+
+def _ics_fold(line: str) -> str:
+    """A content line folded into CRLF-terminated lines of at most ICS_LINE_OCTETS octets."""
+    if len(line) * 4 <= ICS_LINE_OCTETS or len(line.encode("utf-8")) <= ICS_LINE_OCTETS:
+        return line + "\r\n"
+    parts, current, octets, limit = [], [], 0, ICS_LINE_OCTETS
+    for char in line:
+        size = len(char.encode("utf-8"))
+        if octets + size > limit:
+            parts.append("".join(current))
+            # Continuation lines start with a space, which counts towards the limit
+            current, octets, limit = [], 0, ICS_LINE_OCTETS - 1
+        current.append(char)
+        octets += size
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ics_todo(task, stamp: str) -> str:
+    lines = ["BEGIN:VTODO", f"UID:{task['id']}", f"DTSTAMP:{stamp}", "SUMMARY:" + _ics_escape(task["title"])]
+    if task["deskripsi"]:
+        lines.append("DESCRIPTION:" + _ics_escape(task["deskripsi"]))
+    if task["mata_kuliah"]:
+        lines.append("CATEGORIES:" + _ics_escape(task["mata_kuliah"]))
+    deadline = _export_deadline(task)
+    if deadline:
+        lines.append("DUE;VALUE=DATE:" + deadline.replace("-", ""))
+    lines.append("STATUS:COMPLETED" if task["done"] else "STATUS:NEEDS-ACTION")
+    lines.append("END:VTODO")
+    return "".join(map(_ics_fold, lines))
+
+
+def _write_ics(f, tasks: Iterable[Dict[str, Any]]) -> None:
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Productivity Tracker//Tasks//EN\r\n")
+    f.writelines(_ics_todo(t, stamp) for t in tasks)
+    f.write("END:VCALENDAR\r\n")
+
+
+_WRITERS = {"csv": _write_csv, "jsonl": _write_jsonl, "ics": _write_ics}
+
+
+@instrument.timed("transfer.export")
+def export_tasks(path: str, tasks: Optional[storage.TaskList] = None, fmt: Optional[str] = None) -> int:
+    """
+    Write tasks to a CSV, JSON Lines or iCalendar file and return how many were written.
+
+    ``tasks`` defaults to the saved tasks. The file is written to a temporary
+    name and renamed into place, so a failed export leaves the old one intact.
+    """
+    fmt = detect_format(path, fmt)
+    records = (storage.load_tasks() if tasks is None else tasks).to_list()
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        _WRITERS[fmt](f, records)
+    instrument.add_bytes(path, os.path.getsize(tmp))
+    os.replace(tmp, path)
+    return len(records)
+
+
+# --- command line -----------------------------------------------------------
+
+# Invalid records listed by the command (all are counted)
+MAX_SHOWN_ERRORS = 20
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m core.transfer", description="Import or export tasks as CSV, JSON Lines or iCalendar.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="add the tasks in a file to data/tasks.json")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--format", choices=FORMATS, help="file format (default: from the extension)")
+    import_parser.add_argument("--workers", type=int, help="parsing processes (default: one per CPU for large files)")
+    export_parser = commands.add_parser("export", help="write every task to a file")
+    export_parser.add_argument("path")
+    export_parser.add_argument("--format", choices=FORMATS, help="file format (default: from the extension)")
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "export":
+            count = export_tasks(args.path, fmt=args.format)
+            print(f"Exported {count} tasks to {args.path}")
+            return 0
+        result = import_tasks(args.path, fmt=args.format, workers=args.workers)
+    except (OSError, ValueError) as err:
+        print(f"{args.command} failed: {err}", file=sys.stderr)
+        return 1
+    errors = result["errors"]
+    print(f"Imported {result['imported']} tasks in {result['seconds']:.2f} s "
+          f"({result['duplicates']} duplicates, {len(errors)} invalid records skipped)")
+    for line, reason in errors[:MAX_SHOWN_ERRORS]:
+        print(f"  line {line}: {reason}", file=sys.stderr)
+    if len(errors) > MAX_SHOWN_ERRORS:
+        print(f"  ... and {len(errors) - MAX_SHOWN_ERRORS} more", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
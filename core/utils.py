@@ -1,43 +1,94 @@
 """
 Utility functions for the productivity app.
+
+Date helpers share a memoized parser and a cached "today" that is
+refreshed at local midnight, so rendering many cards does not re-parse
+dates or call ``datetime.now()`` per card.
 """
-from datetime import datetime
-from typing import Optional
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+OVERDUE = "overdue"
+TODAY = "today"
+FUTURE = "future"
+
+# Cached local date and the epoch time at which it expires (next local midnight)
+_today = {"date": None, "expires": 0.0}
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string (memoized). Return None if invalid."""
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _format_parsed(date_str: str) -> str:
+    parsed = parse_date(date_str)
+    return parsed.strftime("%d %b %Y") if parsed else date_str
+
+
+def get_today() -> date:
+    """Today's local date, cached until local midnight."""
+    now = time.time()
+    if now >= _today["expires"]:
+        today = datetime.fromtimestamp(now).date()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _today["date"] = today
+        _today["expires"] = midnight.timestamp()
+        # Statuses are memoized per day; drop the previous day's entries
+        _status_for.cache_clear()
+    return _today["date"]
 
 
 def format_date(date_str: Optional[str]) -> str:
     """Format a date string (YYYY-MM-DD) to a human-readable format."""
     if not date_str:
         return "No date"
-    try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        return date_obj.strftime("%d %b %Y")
-    except (ValueError, TypeError):
+    if not isinstance(date_str, str):
         return date_str
+    return _format_parsed(date_str)
+
+
+@lru_cache(maxsize=4096)
+def _status_for(date_str: str, today: date) -> Optional[str]:
+    parsed = parse_date(date_str)
+    if parsed is None:
+        return None
+    if parsed < today:
+        return OVERDUE
+    if parsed == today:
+        return TODAY
+    return FUTURE
+
+
+def deadline_status(date_str: Optional[str]) -> Optional[str]:
+    """Classify a date as OVERDUE, TODAY or FUTURE (None if missing or invalid)."""
+    if not date_str or not isinstance(date_str, str):
+        return None
+    return _status_for(date_str, get_today())
+
+
+def classify_deadlines(date_strs: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """Classify many dates in one pass against a single "today" value."""
+    today = get_today()
+    status_for = _status_for
+    return [status_for(d, today) if d and isinstance(d, str) else None for d in date_strs]
 
 
 def is_overdue(date_str: Optional[str]) -> bool:
     """Check if a task date is overdue (before today)."""
-    if not date_str:
-        return False
-    try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        today = datetime.now().date()
-        return date_obj.date() < today
-    except (ValueError, TypeError):
-        return False
+    return deadline_status(date_str) == OVERDUE
 
 
 def is_today(date_str: Optional[str]) -> bool:
     """Check if a task date is today."""
-    if not date_str:
-        return False
-    try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        today = datetime.now().date()
-        return date_obj.date() == today
-    except (ValueError, TypeError):
-        return False
+    return deadline_status(date_str) == TODAY
 
 
 def get_greeting() -> str:
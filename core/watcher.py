@@ -0,0 +1,192 @@
+"""
+File watcher: calls back when watched files in a directory change.
+
+On Linux it uses inotify (through ctypes), so a change is seen as soon as
+the writer closes or renames the file. Elsewhere, or when inotify is not
+available (or stops working), it polls the files' stat (inode, mtime, size)
+every ``interval`` seconds. Bursts of events are coalesced into one
+callback, which runs on the watcher's daemon thread.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import traceback
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Close-after-write and rename-into-place cover both journal appends and
+# atomic snapshot replacement; deletes and overflows force a check too
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE
+
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (name follows)
+
+Signature = Optional[Tuple[int, int, int]]
+
+
+def _load_inotify():
+    """libc's (inotify_init1, inotify_add_watch), or None where unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        init, add_watch = libc.inotify_init1, libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    init.argtypes = [ctypes.c_int]
+    init.restype = ctypes.c_int
+    add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    add_watch.restype = ctypes.c_int
+    return init, add_watch
+
+
+def file_signature(path: str) -> Signature:
+    """(inode, mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class FileWatcher:
+    """Watches a set of file names in one directory on a daemon thread."""
+
+    def __init__(self, directory: str, names: Iterable[str], callback: Callable[[Set[str]], None],
+                 interval: float = 1.0, debounce: float = 0.05, use_inotify: bool = True):
+        """
+        Initialize watcher.
+
+        Args:
+            directory: directory holding the files
+            names: file names (not paths) to watch
+            callback: called with the names that changed (runs on the watcher thread)
+            interval: seconds between checks when polling
+            debounce: quiet period that coalesces a burst of events (inotify)
+            use_inotify: set False to force polling
+        """
+        self.directory = directory
+        self.names = frozenset(names)
+        self.callback = callback
+        self.interval = interval
+        self.debounce = debounce
+        self.mode = "stopped"
+        self._inotify = _load_inotify() if use_inotify else None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start watching (no-op if already running)."""
+        if self._thread is not None:
+            return
+        fd = self._open_inotify()
+        self.mode = "inotify" if fd is not None else "poll"
+        # A fresh event per run, so a stopped thread still winding down stays stopped
+        self._stop = threading.Event()
+        if fd is not None:
+            self._thread = threading.Thread(target=self._run_inotify, args=(fd, self._stop), name="file-watcher", daemon=True)
+        else:
+            # Baseline taken now, so a change right after start() is not missed
+            self._thread = threading.Thread(target=self._run_poll, args=(self._stop, self._signatures()),
+                                            name="file-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching; the thread exits within a second."""
+        self._stop.set()
+        self._thread = None
+        self.mode = "stopped"
+
+    def _open_inotify(self) -> Optional[int]:
+        if self._inotify is None:
+            return None
+        init, add_watch = self._inotify
+        fd = init(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if add_watch(fd, os.fsencode(self.directory), WATCH_MASK) < 0:
+            # E.g. the per-user watch limit is exhausted: fall back to polling
+            os.close(fd)
+            return None
+        return fd
+
+    def _notify(self, names: Set[str]) -> None:
+        try:
+            self.callback(names)
+        except Exception:
+            # A failing callback must not stop the watcher
+            traceback.print_exc()
+
+    def _read_events(self, fd: int) -> Set[str]:
+        """Drain pending inotify events; return the watched names they touch."""
+        names: Set[str] = set()
+        while True:
+            try:
+                data = os.read(fd, 64 * 1024)
+            except BlockingIOError:
+                return names
+            pos = 0
+            while pos + _EVENT.size <= len(data):
+                _, mask, _, length = _EVENT.unpack_from(data, pos)
+                pos += _EVENT.size
+                name = data[pos:pos + length].rstrip(b"\0").decode("utf-8", "replace")
+                pos += length
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped: assume everything changed
+                    names.update(self.names)
+                elif name in self.names:
+                    names.add(name)
+
+    def _run_inotify(self, fd: int, stop: threading.Event) -> None:
+        failed = False
+        try:
+            while not stop.is_set():
+                ready, _, _ = select.select([fd], [], [], 0.5)
+                if not ready:
+                    continue
+                names = self._read_events(fd)
+                # Coalesce the rest of the burst (a rename is several events)
+                while select.select([fd], [], [], self.debounce)[0]:
+                    names |= self._read_events(fd)
+                if names and not stop.is_set():
+                    self._notify(names)
+        except OSError:
+            traceback.print_exc()
+            failed = True
+        finally:
+            os.close(fd)
+        if failed and not stop.is_set():
+            # inotify stopped working: keep watching by polling, after a
+            # check for anything missed in between
+            self.mode = "poll"
+            seen = self._signatures()
+            self._notify(set(self.names))
+            self._run_poll(stop, seen)
+
+    def _signatures(self) -> Dict[str, Signature]:
+        return {name: file_signature(os.path.join(self.directory, name)) for name in self.names}
+
+    def _run_poll(self, stop: threading.Event, seen: Dict[str, Signature]) -> None:
+        paths = {name: os.path.join(self.directory, name) for name in self.names}
+        while not stop.wait(self.interval):
+            changed = set()
+            for name, path in paths.items():
+                signature = file_signature(path)
+                if signature != seen[name]:
+                    seen[name] = signature
+                    changed.add(name)
+            if changed:
+                self._notify(changed)
@@ -4,6 +4,7 @@ Clean and modular architecture with UI separated into modules.
 Supports multiple themes: Light Blue, Dark Blue, and Pink.
 """
 import flet as ft
+from core.instrument import instrument_page
 from ui.layout import build_page_layout
 from ui.theme import get_theme, LIGHT_BLUE_THEME
 
@@ -20,18 +21,19 @@ def main(page: ft.Page):
     page.window_height = 900
     page.theme_mode = ft.ThemeMode.LIGHT
     page.padding = 0
+
+    # Renders are timed once Diagnostics are enabled (no-op otherwise)
+    instrument_page(page)
     
     # Theme state (mutable reference for theme switching)
     theme_state = {"current_theme": "light_blue"}
     
     def apply_theme(theme_key: str):
-        """Apply theme and refresh layout."""
+        """Apply theme by restyling the existing controls in place."""
         theme_state["current_theme"] = theme_key
-        theme = get_theme(theme_key)
+        theme = theme_state["theme"]
+        theme.switch(theme_key)
         page.bgcolor = theme["background"]
-        page.clean()
-        layout = build_page_layout(page, theme_state)
-        page.add(layout)
         page.update()
     
     # Apply initial theme
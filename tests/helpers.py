@@ -0,0 +1,89 @@
+"""Shared test fixtures: a temporary data directory, a fake page and control-tree helpers."""
+import shutil
+import tempfile
+import unittest
+
+from benchmarks.fixtures import use_data_dir
+from benchmarks.stub import StubPage, StubPubSub
+from core import storage
+from core.store import reset_task_store
+from ui.tasks import build_task_section
+from ui.theme import LiveTheme
+
+
+class StorageTestCase(unittest.TestCase):
+    """Runs each test against an empty temporary data directory."""
+
+    def setUp(self):
+        storage.flush_tasks()
+        self._saved_dir = storage.DATA_DIR
+        self.data_dir = tempfile.mkdtemp(prefix="productivity-test-")
+        use_data_dir(self.data_dir)
+
+    def tearDown(self):
+        # Stop the shared store's watcher before the real data dir comes back.
+        reset_task_store()
+        storage.flush_tasks()
+        use_data_dir(self._saved_dir)
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def write_raw(self, data: bytes) -> None:
+        with open(storage.DATA_FILE, "wb") as f:
+            f.write(data)
+
+
+class FakePage(StubPage):
+    """
+    StubPage that also keeps the controls of each update in ``sent`` and
+    closes like a session (``close()`` runs the ``on_close`` handler).
+
+    With ``defer_threads`` worker threads are queued until ``run_threads()``.
+    """
+
+    def __init__(self, defer_threads: bool = False):
+        super().__init__()
+        self.sent = []
+        self.threads = []
+        self.defer_threads = defer_threads
+        self.on_close = None
+
+    def update(self, *controls):
+        super().update(*controls)
+        self.sent.append(controls)
+
+    def run_thread(self, handler, *args, **kwargs):
+        if self.defer_threads:
+            self.threads.append((handler, args, kwargs))
+        else:
+            handler(*args, **kwargs)
+
+    def run_threads(self):
+        while self.threads:
+            handler, args, kwargs = self.threads.pop(0)
+            handler(*args, **kwargs)
+
+    def close(self):
+        if self.on_close is not None:
+            self.on_close(None)
+
+
+def new_store():
+    """Start the next section from an empty shared store, as in a fresh process."""
+    reset_task_store()
+    StubPubSub.reset()
+
+
+def mount_task_section(page, theme=None):
+    """Build the Tasks section and add it to ``page``; return (task_list_container, handlers)."""
+    input_container, task_list, _, handlers = build_task_section(page, theme or LiveTheme("light_blue"))
+    page.add(input_container, task_list)
+    return task_list, handlers
+
+
+def walk(*controls):
+    """Every control under ``controls``, depth first."""
+    stack = list(controls)
+    while stack:
+        control = stack.pop()
+        yield control
+        stack.extend(control._get_children())
@@ -0,0 +1,201 @@
+"""Tests for core.indexes groupings and search subsets."""
+import random
+import unittest
+from unittest import mock
+
+from benchmarks.fixtures import make_tasks
+from core import indexes
+from core.indexes import GroupIndex, Members
+from core.search import MAX_PREFIX, SearchIndex, tokenize
+from core.storage import TaskList
+
+
+def deadline_index():
+    return GroupIndex(lambda t: t.get("deadline") or "No deadline", lambda d: (d == "No deadline", d))
+
+
+def regroup(index, tasks):
+    """What the index should hold: every task grouped from scratch."""
+    groups = {}
+    for task in tasks:
+        groups.setdefault(index.key_fn(task), []).append(task)
+    return [(key, groups[key]) for key in sorted(groups, key=index.sort_key)]
+
+
+class GroupIndexTest(unittest.TestCase):
+    def test_mutations_match_a_full_regroup(self):
+        tasks = TaskList(make_tasks(300))
+        index = deadline_index()
+        tasks.add_index(index)
+        rng = random.Random(7)
+        deadlines = sorted({t["deadline"] for t in tasks})
+        for step in range(300):
+            ids = [t["id"] for t in tasks]
+            op = rng.random()
+            if op < 0.3:
+                tasks.append({"id": f"new-{step}", "title": "New", "deadline": rng.choice(deadlines)})
+            elif op < 0.5:
+                tasks.remove(rng.choice(ids))
+            elif op < 0.8:
+                tasks.update(rng.choice(ids), deadline=rng.choice(deadlines + ["2099-01-01"]))
+            else:
+                tasks.update(rng.choice(ids), title=f"Renamed {step}")
+            self.assertEqual(list(index.groups()), regroup(index, tasks), step)
+        self.assertEqual(len(index), len(tasks))
+
+    def test_empty_groups_are_dropped_and_new_ones_sorted_in(self):
+        tasks = TaskList([{"id": "a", "deadline": "2025-02-01"}, {"id": "b", "deadline": None}])
+        index = deadline_index()
+        tasks.add_index(index)
+        tasks.append({"id": "c", "deadline": "2025-01-01"})
+        self.assertEqual([key for key, _ in index.groups()], ["2025-01-01", "2025-02-01", "No deadline"])
+        tasks.update("a", deadline="2025-01-01")
+        self.assertEqual([key for key, _ in index.groups()], ["2025-01-01", "No deadline"])
+        self.assertEqual([t["id"] for t in index.get("2025-01-01")], ["a", "c"])
+
+    def test_readers_keep_the_grouping_they_got(self):
+        tasks = TaskList([{"id": "a", "deadline": "2025-01-01"}, {"id": "b", "deadline": "2025-01-01"}])
+        index = deadline_index()
+        tasks.add_index(index)
+        before = list(index.groups())
+        version = index.version
+        tasks.update("a", title="Renamed")
+        tasks.remove("b")
+        self.assertEqual([t["id"] for t in before[0][1]], ["a", "b"])
+        self.assertEqual(before[0][1][0]["title"], "Untitled")
+        self.assertEqual(index.get("2025-01-01")[0]["title"], "Renamed")
+        self.assertGreater(index.version, version)
+
+    def test_update_copies_only_one_chunk(self):
+        tasks = TaskList([{"id": str(i), "deadline": None} for i in range(indexes.CHUNK_SIZE * 8)])
+        index = deadline_index()
+        tasks.add_index(index)
+        (_, before), = index.groups()
+        tasks.update("5", done=True)
+        (_, after), = index.groups()
+        self.assertTrue(after[5]["done"])
+        self.assertFalse(before[5]["done"])
+        shared = [a is b for a, b in zip(before._chunks, after._chunks)]
+        self.assertEqual(shared.count(False), 1)
+
+    def test_groups_are_published_once_per_version(self):
+        tasks = TaskList([{"id": "a", "deadline": None}])
+        index = deadline_index()
+        tasks.add_index(index)
+        self.assertIs(index.groups().__next__()[1], index.groups().__next__()[1])
+        tasks.append({"id": "b", "deadline": None})
+        self.assertEqual([t["id"] for _, members in index.groups() for t in members], ["a", "b"])
+
+
+class MembersTest(unittest.TestCase):
+    def test_matches_a_list_across_chunk_splits_and_merges(self):
+        rng = random.Random(11)
+        with mock.patch.object(indexes, "CHUNK_SIZE", 4):
+            members, expected = Members.of(range(10)), list(range(10))
+            for step in range(400):
+                op = rng.random()
+                if op < 0.4 or not expected:
+                    pos = rng.randint(0, len(expected))
+                    members, _ = members.insert(pos, step), expected.insert(pos, step)
+                elif op < 0.7:
+                    pos = rng.randrange(len(expected))
+                    members, _ = members.delete(pos), expected.pop(pos)
+                elif op < 0.9:
+                    pos = rng.randrange(len(expected))
+                    members, expected[pos] = members.replace(pos, -step), -step
+                else:
+                    members, _ = members.extend([step, step]), expected.extend([step, step])
+                self.assertEqual(members, expected, step)
+                self.assertEqual([members[i] for i in range(len(expected))], expected)
+                self.assertTrue(all(0 < len(chunk) <= 4 for chunk in members._chunks))
+        self.assertEqual(members[-1], expected[-1])
+        self.assertEqual(members[1:3], expected[1:3])
+        with self.assertRaises(IndexError):
+            members[len(expected)]
+
+
+def brute_force(tasks, query):
+    """Ids of tasks whose words start with every query word, by scanning every task."""
+    terms = tokenize(query)
+    if not terms:
+        return None
+    hits = set()
+    for task in tasks:
+        words = tokenize(" ".join(task[f] for f in ("title", "deskripsi", "mata_kuliah")))
+        if all(any(w.startswith(term) for w in words) for term in terms):
+            hits.add(task["id"])
+    return hits
+
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tasks = TaskList([
+            {"id": "a", "title": "Laporan Praktikum", "mata_kuliah": "Data Sains"},
+            {"id": "b", "title": "Kuis", "deskripsi": "Bab 3 praktik", "mata_kuliah": "Sistem Tertanam"},
+            {"id": "c", "title": "Kriptografi-modular-exponentiation"},
+        ])
+        self.index = SearchIndex()
+        self.tasks.add_index(self.index)
+
+    def test_words_match_as_prefixes(self):
+        self.assertEqual(self.index.search("prak"), {"a", "b"})
+        self.assertEqual(self.index.search("PRAKTIKUM"), {"a"})
+        self.assertEqual(self.index.search("prak dat"), {"a"})
+        self.assertEqual(self.index.search("prak zz"), set())
+        self.assertIsNone(self.index.search("  -- "))
+
+    def test_prefixes_longer_than_the_prefix_map(self):
+        term = "exponentiation"[:MAX_PREFIX + 1]
+        self.assertEqual(self.index.search(term), {"c"})
+        self.assertEqual(self.index.search(term + "x"), set())
+
+    def test_update_and_remove_drop_old_words(self):
+        self.tasks.update("a", title="Review")
+        self.assertEqual(self.index.search("laporan"), set())
+        self.assertEqual(self.index.search("rev"), {"a"})
+        self.tasks.remove("b")
+        self.assertEqual(self.index.search("prak"), set())
+        self.assertEqual(self.index.tokens_with_prefix("ku"), set())
+        self.assertEqual(len(self.index), 2)
+
+    def test_matches_a_full_scan_after_mutations(self):
+        tasks = TaskList(make_tasks(300))
+        index = SearchIndex()
+        tasks.add_index(index)
+        rng = random.Random(3)
+        words = ["laporan", "tugas", "kuis", "praktikum", "review", "catatan"]
+        for step in range(100):
+            ids = [t["id"] for t in tasks]
+            if step % 3 == 0:
+                tasks.remove(rng.choice(ids))
+            else:
+                tasks.update(rng.choice(ids), title=f"Task {step} {rng.choice(words)}", deskripsi=rng.choice(words))
+        for query in ("lap", "task 1", "kuis task", "data", "catat", "x"):
+            self.assertEqual(index.search(query), brute_force(tasks, query), query)
+
+
+class SubsetTest(unittest.TestCase):
+    def test_subset_of_search_hits_matches_filtered_groups(self):
+        tasks = TaskList(make_tasks(500))
+        index = GroupIndex(lambda t: t.get("mata_kuliah") or None, lambda key: (key is None, key or ""))
+        search = SearchIndex()
+        tasks.add_index(index)
+        tasks.add_index(search)
+        tasks.update(tasks.to_list()[3]["id"], mata_kuliah="Moved")
+        tasks.remove(tasks.to_list()[7]["id"])
+
+        for query in ("task 1", "laporan", "kuis 4", "nothing-like-this"):
+            hits = search.search(query)
+            expected = [
+                (key, [t for t in members if t["id"] in hits]) for key, members in index.groups()
+            ]
+            expected = [(key, members) for key, members in expected if members]
+            self.assertEqual(index.subset(tasks.select(hits)), expected, query)
+
+    def test_select_skips_unknown_ids_and_keeps_insertion_order(self):
+        tasks = TaskList([{"id": "a", "title": "A"}, {"id": "b", "title": "B"}, {"id": "c", "title": "C"}])
+        self.assertEqual([t["id"] for t in tasks.select(["c", "zz", "a"])], ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Tests for the page.update hook in core.instrument."""
+import unittest
+
+import flet as ft
+
+from core import instrument
+from tests.helpers import FakePage
+
+
+class InstrumentPageTest(unittest.TestCase):
+    def setUp(self):
+        self._was_enabled = instrument.is_enabled()
+        instrument.reset()
+        instrument.set_enabled(True)
+        self.page = FakePage()
+        instrument.instrument_page(self.page)
+
+    def tearDown(self):
+        instrument.set_enabled(self._was_enabled)
+        instrument.reset()
+
+    def test_update_latency_is_recorded(self):
+        text = ft.Text("x")
+        self.page.update(text)
+        self.page.update()
+        self.assertEqual(self.page.sent, [(text,), ()])
+        self.assertEqual(instrument.snapshot()["latency_ms"]["page.update"]["count"], 2)
+
+    def test_updates_record_no_control_counts(self):
+        # Render passes record what they built; the number of update arguments says nothing
+        self.page.update(ft.Column([ft.Text(str(i)) for i in range(500)]))
+        self.assertEqual(instrument.snapshot()["controls_per_render"], {})
+
+    def test_nothing_is_recorded_while_disabled(self):
+        instrument.set_enabled(False)
+        self.page.update(ft.Text("x"))
+        self.assertEqual(len(self.page.sent), 1)
+        self.assertEqual(instrument.snapshot()["latency_ms"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,322 @@
+"""Tests for the Pomodoro timers and per-task focus timers (core.pomodoro) on the shared scheduler."""
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import flet as ft
+
+from benchmarks.fixtures import make_tasks, write_store
+from core.pomodoro import BREAK, LONG_BREAK, TRANSITION_DELAY, WORK, AsyncPomodoroTimer, FocusTimers, PomodoroTimer
+from core.scheduler import Scheduler, get_scheduler
+from tests.helpers import FakePage, StorageTestCase, mount_task_section, new_store, walk
+from ui.lifecycle import on_session_close
+from ui.pomodoro import build_pomodoro_section
+from ui.theme import LiveTheme
+
+
+class ManualClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ManualSchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = ManualClock()
+        self.scheduler = Scheduler(clock=self.clock, threaded=False)
+
+    def run_until(self, end: float) -> None:
+        """Run the scheduled calls in deadline order up to ``end``, moving the clock to each one."""
+        while True:
+            when = self.scheduler.next_deadline()
+            if when is None or when > end:
+                break
+            self.clock.now = max(self.clock.now, when)
+            self.scheduler.run_due()
+        self.clock.now = max(self.clock.now, end)
+
+
+class PomodoroTimerTest(ManualSchedulerTestCase):
+    def make_timer(self, **kwargs):
+        timer = PomodoroTimer(work_minutes=1, break_minutes=1, scheduler=self.scheduler, **kwargs)
+        self.ticks, self.completed = [], []
+        timer.on_tick = lambda value: self.ticks.append((self.clock.now, value))
+        timer.on_complete = lambda phase: self.completed.append((self.clock.now, phase))
+        return timer
+
+    def test_slow_callbacks_do_not_drift(self):
+        timer = self.make_timer()
+
+        def slow_tick(value):
+            self.ticks.append((self.clock.now, value))
+            self.clock.now += 0.3  # the UI took a while
+
+        timer.on_tick = slow_tick
+        start = self.clock.now
+        timer.start()
+        self.run_until(start + 60)
+        self.assertEqual([when - start for when, _ in self.ticks], [float(i) for i in range(1, 61)])
+        self.assertEqual([value for _, value in self.ticks], [f"00:{s:02d}" for s in range(59, -1, -1)])
+        self.assertEqual(self.completed, [(start + 60.3, WORK)])
+
+    def test_paused_time_is_not_counted(self):
+        timer = self.make_timer()
+        start = self.clock.now
+        timer.start()
+        self.run_until(start + 10.5)
+        timer.pause()
+        self.assertEqual(self.scheduler.next_deadline(), None)
+        self.run_until(start + 110.5)
+        self.assertEqual(len(self.ticks), 10)
+        self.assertAlmostEqual(timer.remaining(), 49.5)
+        timer.resume()
+        self.assertAlmostEqual(timer.paused_total, 100.0)
+        self.assertAlmostEqual(timer.remaining(), 49.5)
+        self.run_until(start + 160)
+        self.assertEqual(self.completed, [(start + 160, WORK)])
+        self.assertEqual(self.ticks[10][0], start + 111)
+
+    def test_phase_switches_at_the_deadline(self):
+        timer = self.make_timer(sessions_before_long_break=2)
+        start = self.clock.now
+        timer.start()
+        self.run_until(start + 60)
+        self.assertEqual((timer.phase, timer.running), (BREAK, True))
+        self.assertEqual(timer.remaining(), 60)
+        self.run_until(start + 60 + TRANSITION_DELAY)
+        self.assertEqual(self.ticks[-1], (start + 60 + TRANSITION_DELAY, "01:00"))
+        self.run_until(start + 120 + TRANSITION_DELAY)
+        # A finished break ends the run with the next work session ready
+        self.assertEqual([phase for _, phase in self.completed], [WORK, BREAK])
+        self.assertEqual((timer.phase, timer.running, timer.remaining()), (WORK, False, 60))
+
+        timer.start()
+        self.run_until(self.clock.now + 60)
+        self.assertEqual(timer.phase, LONG_BREAK)
+        self.assertEqual(timer.remaining(), 15 * 60)
+
+    def test_breaks_tick_every_n_seconds(self):
+        timer = self.make_timer(break_tick_seconds=5)
+        start = self.clock.now
+        timer.start()
+        self.run_until(start + 60)
+        work_ticks = len(self.ticks)
+        self.run_until(start + 120 + TRANSITION_DELAY)
+        self.assertEqual(work_ticks, 60)
+        self.assertEqual([value for _, value in self.ticks[work_ticks:]], [f"{s // 60:02d}:{s % 60:02d}" for s in range(60, -1, -5)])
+        # Still measured back from the break's end
+        self.assertEqual(self.ticks[-1][0], start + 120 + TRANSITION_DELAY)
+
+    def test_stop_cancels_the_pending_tick(self):
+        timer = self.make_timer()
+        timer.start()
+        self.run_until(self.clock.now + 5)
+        timer.stop()
+        self.assertEqual(self.scheduler.pending(), 0)
+        self.run_until(self.clock.now + 120)
+        self.assertEqual(self.ticks[-1][1], "01:00")
+        self.assertEqual(self.completed, [])
+
+
+class AsyncPomodoroTimerTest(unittest.TestCase):
+    def test_paused_time_is_not_counted(self):
+        clock = ManualClock()
+        spawned = []
+        timer = AsyncPomodoroTimer(work_minutes=1, run_task=lambda fn, *args: spawned.append(args))
+        timer.clock = clock
+        timer.start()
+        clock.now += 10
+        timer.pause()
+        clock.now += 100
+        self.assertEqual(timer.remaining(), 50)
+        timer.resume()
+        self.assertEqual((timer.remaining(), timer.paused_total), (50, 100))
+        clock.now += 20
+        self.assertEqual(timer.remaining(), 30)
+        # Each run gets its own generation, so the paused one's loop exits
+        self.assertEqual(len(spawned), 2)
+        self.assertNotEqual(spawned[0], spawned[1])
+
+
+class AsyncPomodoroLoopTest(unittest.TestCase):
+    """AsyncPomodoroTimer on a real event loop whose sleeps advance a manual clock."""
+
+    def setUp(self):
+        self.clock = ManualClock()
+        self.yield_ = asyncio.sleep  # lets the loop run without moving the clock
+
+        async def sleep(seconds):
+            self.clock.now += seconds
+            await self.yield_(0)
+
+        patcher = mock.patch.object(asyncio, "sleep", sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_timer(self, body):
+        async def main():
+            timer = AsyncPomodoroTimer(work_minutes=1, break_minutes=1)
+            timer.clock = self.clock
+            return await body(timer)
+
+        return asyncio.run(main())
+
+    def test_callbacks_run_on_the_loop(self):
+        loop_thread, threads, completed = [], set(), []
+
+        async def on_complete(phase):
+            # Coroutine callbacks are awaited
+            threads.add(threading.get_ident())
+            completed.append((self.clock.now, phase))
+
+        async def body(timer):
+            loop_thread.append(threading.get_ident())
+            ticks = []
+            timer.on_tick = lambda value: (threads.add(threading.get_ident()), ticks.append(value))
+            timer.on_complete = on_complete
+            start = self.clock.now
+            timer.start()
+            while len(completed) < 2:
+                await self.yield_(0)
+            return start, ticks, timer
+
+        start, ticks, timer = self.run_timer(body)
+        self.assertEqual(threads, set(loop_thread))
+        self.assertEqual(completed, [(start + 60, WORK), (start + 120 + TRANSITION_DELAY, BREAK)])
+        self.assertEqual(ticks[:2], ["00:59", "00:58"])
+        self.assertEqual((timer.running, timer.phase), (False, WORK))
+
+    def test_stop_cancels_the_loop_task(self):
+        async def body(timer):
+            ticks = []
+            timer.on_tick = ticks.append
+            timer.start()
+            task = timer._task
+            for _ in range(3):
+                await self.yield_(0)
+            timer.stop()
+            await self.yield_(0)
+            self.clock.now += 120
+            for _ in range(5):
+                await self.yield_(0)
+            return task, ticks
+
+        task, ticks = self.run_timer(body)
+        self.assertTrue(task.cancelled())
+        self.assertEqual(ticks[-1], "01:00")
+
+
+class FocusTimersTest(ManualSchedulerTestCase):
+    def test_timers_complete_on_their_tick(self):
+        timers = FocusTimers(scheduler=self.scheduler)
+        fired = []
+        start = self.clock.now
+        timers.start("a", 2.5, lambda key: fired.append((key, self.clock.now)))
+        timers.start("b", 100, lambda key: fired.append((key, self.clock.now)))
+        self.run_until(start + 100)
+        self.assertEqual(fired, [("a", start + 3), ("b", start + 100)])
+        self.assertIsNone(self.scheduler.next_deadline())
+
+    def test_cancel_all_stops_pending_ticks(self):
+        timers = FocusTimers(scheduler=self.scheduler)
+        fired, ticks = [], []
+        timers.on_tick = lambda: ticks.append(1)
+        timers.start("a", 3, fired.append)
+        timers.start("b", 5, fired.append)
+        self.run_until(self.clock.now + 1)
+        self.assertEqual(sorted(timers.cancel_all()), ["a", "b"])
+        self.assertIsNone(self.scheduler.next_deadline())
+        self.run_until(self.clock.now + 10)
+        self.assertEqual((fired, ticks, len(timers)), ([], [1], 0))
+
+
+class FocusTimersThreadTest(unittest.TestCase):
+    def test_cancel_all_stops_the_wheel(self):
+        scheduler = Scheduler(name="test-scheduler")
+        timers = FocusTimers(tick_seconds=0.01, scheduler=scheduler)
+        fired, ticks = [], []
+        timers.on_tick = lambda: ticks.append(1)
+        timers.start("a", 0.03, fired.append)
+        timers.start("b", 0.05, fired.append)
+        self.assertEqual(sorted(timers.cancel_all()), ["a", "b"])
+        time.sleep(0.1)
+        self.assertEqual((fired, ticks, len(timers)), ([], [], 0))
+        self.assertEqual(scheduler.pending(), 0)
+
+    def test_closing_the_session_cancels_its_timers(self):
+        timers = FocusTimers(tick_seconds=0.01, scheduler=Scheduler(name="test-scheduler"))
+        fired = []
+        timers.start("a", 0.03, fired.append)
+        page = FakePage()
+        on_session_close(page, timers.cancel_all)
+        page.close()
+        time.sleep(0.06)
+        self.assertEqual(fired, [])
+
+
+class PomodoroSectionTest(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        self.page = FakePage()
+        self.container, self.timer, self.handlers = build_pomodoro_section(self.page, LiveTheme("light_blue"))
+        self.addCleanup(self.timer.stop)
+        self.controls = list(walk(self.container))
+        self.display = next(c for c in self.controls if isinstance(c, ft.Text) and c.value == "25:00")
+
+    def mount(self):
+        for control in self.controls:
+            control.page = self.page
+
+    def test_tick_sends_only_the_timer_display(self):
+        self.mount()
+        self.timer.on_tick("24:59")
+        self.timer.on_tick("24:59")
+        self.assertEqual(self.page.sent, [(self.display,)])
+        self.assertEqual(self.display.value, "24:59")
+
+    def test_nothing_is_sent_before_the_section_is_mounted(self):
+        self.timer.on_tick("24:59")
+        self.assertEqual(self.page.sent, [])
+
+    def test_completion_sends_the_status_and_buttons(self):
+        self.mount()
+        self.timer.on_complete(BREAK)
+        sent = self.page.sent[-1]
+        self.assertEqual(len(sent), 3)
+        self.assertNotIn(self.display, sent)
+        self.assertIn("Break Complete", sent[0].value)
+
+    def test_closing_the_session_stops_the_timer(self):
+        self.assertIsInstance(self.timer, AsyncPomodoroTimer)
+        self.timer.start()
+        self.page.close()
+        self.assertFalse(self.timer.running)
+
+
+class TaskSectionCloseTest(StorageTestCase):
+    def focus_calls(self):
+        """Scheduled, not cancelled wheel ticks of any FocusTimers on the shared scheduler."""
+        scheduler = get_scheduler()
+        with scheduler._cond:
+            calls = [call for _, _, call in scheduler._heap if not call.cancelled]
+        return [c for c in calls if isinstance(getattr(c.callback, "__self__", None), FocusTimers)]
+
+    def test_closing_the_session_stops_its_focus_timers(self):
+        write_store(make_tasks(10))
+        new_store()
+        page = FakePage()
+        task_list, _ = mount_task_section(page)
+        buttons = [c for c in walk(task_list) if isinstance(c, ft.IconButton) and c.icon == ft.Icons.TIMER_OUTLINED]
+        buttons[0].on_click(None)
+        self.assertEqual(len(self.focus_calls()), 1)
+        page.close()
+        self.assertEqual(self.focus_calls(), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for the write-behind saver (core.saver)."""
+import threading
+import time
+import unittest
+
+from core.saver import WriteBehindSaver
+
+
+class Recorder:
+    """write_batch stand-in: records each batch, optionally blocking or failing."""
+
+    def __init__(self):
+        self.batches = []
+        self.written = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        self.fail = 0
+
+    def __call__(self, batch):
+        self.release.wait(2)
+        if self.fail:
+            self.fail -= 1
+            raise OSError("disk full")
+        self.batches.append(list(batch))
+        self.written.set()
+
+
+class WriteBehindSaverTest(unittest.TestCase):
+    def setUp(self):
+        self.recorder = Recorder()
+        self.saver = WriteBehindSaver(self.recorder, delay=0.05, max_delay=0.5, retry_delay=0.05)
+        self.addCleanup(self.saver.close)
+
+    def test_burst_is_coalesced_into_one_write(self):
+        for i in range(5):
+            self.saver.submit(i)
+        self.assertTrue(self.recorder.written.wait(2))
+        self.assertEqual(self.recorder.batches, [[0, 1, 2, 3, 4]])
+        stats = self.saver.stats()
+        self.assertEqual((stats["writes"], stats["items_written"], stats["queue_depth"]), (1, 5, 0))
+
+    def test_submit_does_not_wait_for_a_slow_write(self):
+        self.recorder.release.clear()
+        self.saver.submit("first")
+        time.sleep(0.1)  # the worker is now blocked inside write_batch
+        start = time.perf_counter()
+        self.saver.submit("second")
+        self.assertLess(time.perf_counter() - start, 0.05)
+        self.recorder.release.set()
+        self.saver.flush()
+        self.assertEqual(sum(self.recorder.batches, []), ["first", "second"])
+
+    def test_flush_writes_on_the_calling_thread(self):
+        self.saver.submit("a")
+        self.saver.flush()
+        self.assertEqual(self.recorder.batches, [["a"]])
+        self.assertEqual(self.saver.queue_depth(), 0)
+
+    def test_failed_write_is_kept_for_the_next_flush(self):
+        self.recorder.fail = 1
+        self.saver.submit("a")
+        self.assertFalse(self.saver.flush())
+        self.assertEqual(self.saver.queue_depth(), 1)
+        self.assertIn("disk full", self.saver.stats()["last_error"])
+        self.assertTrue(self.saver.flush())
+        self.assertEqual(self.recorder.batches, [["a"]])
+
+    def test_paused_holds_off_the_worker(self):
+        with self.saver.paused():
+            self.saver.submit("a")
+            self.assertFalse(self.recorder.written.wait(0.2))
+            self.assertEqual(self.saver.queue_depth(), 1)
+        self.assertTrue(self.recorder.written.wait(2))
+        self.assertEqual(self.recorder.batches, [["a"]])
+
+    def test_submit_after_close_writes_synchronously(self):
+        self.saver.close()
+        self.saver.submit("late")
+        self.assertEqual(self.recorder.batches, [["late"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""Tests for session-log listeners (core.sessions) and their cleanup on session close (ui.lifecycle)."""
+import contextlib
+import io
+import unittest
+
+from core import sessions
+from tests.helpers import FakePage, StorageTestCase
+from ui.lifecycle import on_session_close
+
+
+class SessionListenerTest(StorageTestCase):
+    def tearDown(self):
+        sessions.flush_sessions()
+        super().tearDown()
+
+    def test_failing_listener_does_not_reach_the_caller(self):
+        seen = []
+
+        def broken(record):
+            raise RuntimeError("dead page")
+
+        unsubscribe_broken = sessions.on_session_logged(broken)
+        unsubscribe_seen = sessions.on_session_logged(seen.append)
+        try:
+            with contextlib.redirect_stderr(io.StringIO()) as err:
+                record = sessions.log_session("Work", sessions.COMPLETED, 25)
+        finally:
+            unsubscribe_broken()
+            unsubscribe_seen()
+        self.assertEqual(seen, [record])
+        self.assertIn("dead page", err.getvalue())
+
+    def test_listener_is_dropped_when_the_session_closes(self):
+        seen = []
+        page = FakePage()
+        previous = []
+        page.on_close = previous.append
+        on_session_close(page, sessions.on_session_logged(seen.append))
+        sessions.log_session("Work", sessions.COMPLETED, 25)
+        page.close()
+        sessions.log_session("Work", sessions.COMPLETED, 25)
+        self.assertEqual(len(seen), 1)
+        self.assertEqual(previous, [None])
+        self.assertNotIn(seen.append, sessions._listeners)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Tests for core.sqlite_store's migration from tasks.json, run in a temporary data directory."""
+import json
+import os
+import sqlite3
+import unittest
+from unittest import mock
+
+from core import sqlite_store, storage
+from tests.helpers import StorageTestCase
+
+
+class SqliteStoreTestCase(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        sqlite_store.close()
+
+    def tearDown(self):
+        sqlite_store.close()
+        super().tearDown()
+
+    def write_tasks(self, tasks) -> None:
+        with open(storage.DATA_FILE, "w", encoding="utf-8") as f:
+            json.dump(tasks, f)
+
+    def read_files(self, *names):
+        contents = {}
+        for name in names:
+            with open(os.path.join(self.data_dir, name), "rb") as f:
+                contents[name] = f.read()
+        return contents
+
+
+class MigrationTest(SqliteStoreTestCase):
+    def test_null_text_fields_are_migrated_as_defaults(self):
+        self.write_tasks([{"id": "a", "title": None, "mata_kuliah": None, "deskripsi": None, "deadline": None}])
+        tasks = sqlite_store.load_tasks()
+        task = next(iter(tasks))
+        self.assertEqual((task["title"], task["mata_kuliah"], task["deskripsi"]), ("Untitled", "", ""))
+        sqlite_store.update_task(tasks, task["id"], mata_kuliah=None)
+        self.assertEqual(sqlite_store.get_subjects(), [""])
+
+    def test_failed_migration_rolls_back_and_is_retried(self):
+        self.write_tasks([{"id": "a", "title": "One"}, {"id": "b", "title": "Two"}])
+        values = sqlite_store._insert_values
+
+        def insert_values(task):
+            # The second row breaks the NOT NULL title column
+            row = list(values(task))
+            if task["id"] == "b":
+                row[sqlite_store.COLUMNS.index("title")] = None
+            return tuple(row)
+
+        with mock.patch.object(sqlite_store, "_insert_values", insert_values):
+            with self.assertRaises(sqlite3.IntegrityError):
+                sqlite_store.get_connection()
+        conn = sqlite3.connect(sqlite_store.db_file())
+        try:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0], 0)
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], 0)
+        finally:
+            conn.close()
+        self.assertEqual([t["title"] for t in sqlite_store.load_tasks()], ["One", "Two"])
+
+    def test_migration_only_reads_the_json_store(self):
+        # No ids (load_tasks would assign and persist them) and a pending journal add
+        self.write_tasks([{"title": "One"}, {"id": "b", "title": "Two"}])
+        digest = storage._digest(self.read_files("tasks.json")["tasks.json"])
+        with open(storage.JOURNAL_FILE, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"op": "base", "digest": digest}) + "\n")
+            f.write(json.dumps({"op": "add", "task": {"id": "c", "title": "Three"}}) + "\n")
+        before = self.read_files("tasks.json", "tasks.journal")
+        self.assertEqual([t["title"] for t in sqlite_store.load_tasks()], ["One", "Two", "Three"])
+        self.assertEqual(self.read_files("tasks.json", "tasks.journal"), before)
+        self.assertFalse(os.path.exists(storage.CACHE_FILE))
+
+    def test_unreadable_json_is_not_migrated(self):
+        with open(storage.DATA_FILE, "w", encoding="utf-8") as f:
+            f.write("[{")
+        with self.assertRaises(ValueError):
+            sqlite_store.get_connection()
+        self.write_tasks([{"id": "a", "title": "One"}])
+        self.assertEqual([t["title"] for t in sqlite_store.load_tasks()], ["One"])
+
+    def test_database_follows_the_data_dir(self):
+        sqlite_store.load_tasks()
+        self.assertEqual(sqlite_store.db_file(), os.path.join(self.data_dir, "tasks.db"))
+        self.assertTrue(os.path.exists(os.path.join(self.data_dir, "tasks.db")))
+
+
+class IdTest(SqliteStoreTestCase):
+    def test_ids_and_extra_keys_match_tasks_json(self):
+        self.write_tasks([
+            {"id": "bench-0000000", "title": "One", "priority": "high"},
+            {"id": "abc", "title": "Two", "tags": ["x"]},
+        ])
+        expected = [t.to_dict() for t in storage.load_tasks()]
+        tasks = sqlite_store.load_tasks()
+        self.assertEqual([t.to_dict() for t in tasks], expected)
+
+        added = sqlite_store.add_task(tasks, "Three")
+        self.assertIsInstance(added["id"], str)
+        sqlite_store.update_task(tasks, "abc", tags=["y"], title="Two!")
+        sqlite_store.delete_task(tasks, "bench-0000000")
+        sqlite_store.close()
+        reloaded = sqlite_store.load_tasks()
+        self.assertEqual([t["id"] for t in reloaded], ["abc", added["id"]])
+        self.assertEqual(reloaded.get("abc").to_dict(), {"id": "abc", "title": "Two!", "done": False, "deadline": None,
+                                                         "mata_kuliah": "", "deskripsi": "", "tags": ["y"]})
+
+    def test_version_1_database_is_upgraded_in_place(self):
+        conn = sqlite3.connect(sqlite_store.db_file())
+        conn.executescript("""
+            CREATE TABLE tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL DEFAULT 'Untitled',
+                done INTEGER NOT NULL DEFAULT 0, deadline TEXT, mata_kuliah TEXT NOT NULL DEFAULT '',
+                deskripsi TEXT NOT NULL DEFAULT '');
+            CREATE INDEX idx_tasks_deadline ON tasks(deadline);
+            INSERT INTO tasks (title, deadline) VALUES ('First', '2025-06-01'), ('Second', NULL);
+            PRAGMA user_version = 1;
+        """)
+        conn.close()
+        tasks = sqlite_store.load_tasks()
+        self.assertEqual([(t["id"], t["title"]) for t in tasks], [("1", "First"), ("2", "Second")])
+        self.assertEqual(sqlite_store.get_deadlines(), ["2025-06-01", "No deadline"])
+        version = sqlite_store.get_connection().execute("PRAGMA user_version").fetchone()[0]
+        self.assertEqual(version, sqlite_store.SCHEMA_VERSION)
+
+
+if __name__ == "__main__":
+    unittest.main()
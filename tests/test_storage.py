@@ -0,0 +1,194 @@
+"""Regression tests for core.storage, run in a temporary data directory."""
+import io
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks.fixtures import make_tasks, write_store
+from core import storage
+from tests.helpers import StorageTestCase
+
+
+class CorruptSnapshotTest(StorageTestCase):
+    def test_add_after_corrupt_snapshot_survives_reload(self):
+        self.write_raw(b'[{"id": "a", "title": "Kept?"')
+        tasks = storage.load_tasks()
+        self.assertEqual(len(tasks), 0)
+        storage.add_task(tasks, "Added after", mata_kuliah="Fisika")
+        storage.flush_tasks()
+
+        reloaded = storage.load_tasks()
+        self.assertEqual([t["title"] for t in reloaded], ["Added after"])
+        damaged = [name for name in os.listdir(self.data_dir) if name.startswith("tasks.json.damaged-")]
+        self.assertEqual(len(damaged), 1)
+
+    def test_corrupt_snapshot_keeps_journaled_adds(self):
+        tasks = storage.load_tasks()
+        storage.add_task(tasks, "Journaled")
+        storage.flush_tasks()
+        self.write_raw(b"{not json")
+        # The journal no longer matches the snapshot's digest; re-base it on the damaged file
+        with open(storage.DATA_FILE, "rb") as f:
+            digest = storage._digest(f.read())
+        with open(storage.JOURNAL_FILE, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        lines[0] = '{"op": "base", "digest": "%s"}' % digest
+        with open(storage.JOURNAL_FILE, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+        self.assertEqual([t["title"] for t in storage.load_tasks()], ["Journaled"])
+        self.assertEqual([t["title"] for t in storage.load_tasks()], ["Journaled"])
+
+    def test_incremental_load_of_corrupt_snapshot_writes_a_valid_one(self):
+        self.write_raw(b'[{"id": "a", "title": "First"}, {"id": "b", "title": ')
+        tasks = storage.TaskList()
+        for _ in storage.load_tasks_incrementally(tasks, first_batch=1, batch_size=1):
+            pass
+        self.assertEqual([t["id"] for t in tasks], ["a"])
+        storage.add_task(tasks, "Second")
+        storage.flush_tasks()
+        self.assertEqual([t["title"] for t in storage.load_tasks()], ["First", "Second"])
+
+
+class TaskRecordTest(StorageTestCase):
+    ITEM = {"id": "a", "title": "Laporan", "done": False, "deadline": "2025-06-01", "mata_kuliah": "Data Sains",
+            "deskripsi": "", "priority": "high"}
+
+    def test_reads_like_the_task_dict(self):
+        task = storage.Task.from_mapping(self.ITEM)
+        self.assertEqual(task, self.ITEM)
+        self.assertEqual(dict(task), self.ITEM)
+        self.assertEqual(list(task), list(self.ITEM))
+        self.assertEqual((task["priority"], task.get("missing", 1), len(task)), ("high", 1, 7))
+        self.assertIn("priority", task)
+        with self.assertRaises(KeyError):
+            task["missing"]
+        self.assertFalse(hasattr(task, "__dict__"))
+
+    def test_writes_like_the_task_dict(self):
+        task = storage.Task.from_mapping({"id": "a"})
+        task.update(title="New", tags=["x"])
+        task["mata_kuliah"] = "".join(["Data ", "Sains"])
+        self.assertIs(task["mata_kuliah"], storage.Task.from_mapping(self.ITEM)["mata_kuliah"])
+        del task["tags"]
+        self.assertEqual(task.to_dict(), {"id": "a", "title": "New", "done": False, "deadline": None,
+                                          "mata_kuliah": "Data Sains", "deskripsi": ""})
+        with self.assertRaises(KeyError):
+            del task["title"]
+
+    def test_extra_keys_round_trip(self):
+        task = storage.Task.from_mapping(self.ITEM)
+        self.assertEqual(pickle.loads(pickle.dumps(task)), self.ITEM)
+        write_store([self.ITEM])
+        tasks = storage.load_tasks()
+        storage.update_task(tasks, "a", priority="low")
+        storage.flush_tasks()
+        self.assertEqual(storage.load_tasks().get("a").to_dict(), dict(self.ITEM, priority="low"))
+        self.assertEqual(json.loads(json.dumps(tasks.to_dicts())), [dict(self.ITEM, priority="low")])
+
+
+class SnapshotCacheTest(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        write_store([{"id": "a", "title": "AAAA"}])
+        storage.load_tasks()  # writes the cache
+
+    def load_titles(self):
+        """Titles after a load, and whether the cache served it."""
+        read_cache, hits = storage._read_cache, []
+
+        def spy(stat):
+            cached = read_cache(stat)
+            hits.append(cached is not None)
+            return cached
+
+        with mock.patch.object(storage, "_read_cache", spy):
+            titles = [t["title"] for t in storage.load_tasks()]
+        return titles, hits == [True]
+
+    def touch(self):
+        """Move tasks.json's mtime forward."""
+        stat = os.stat(storage.DATA_FILE)
+        os.utime(storage.DATA_FILE, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def rewrite(self, title):
+        """Rewrite tasks.json in place with another title, keeping the cache."""
+        with open(storage.DATA_FILE, "w", encoding="utf-8") as f:
+            json.dump([{"id": "a", "title": title}], f, ensure_ascii=False, indent=2)
+        self.touch()
+
+    def test_unchanged_file_loads_from_the_cache(self):
+        self.assertEqual(self.load_titles(), (["AAAA"], True))
+
+    def test_size_change_invalidates(self):
+        self.rewrite("AAAAA")
+        self.assertEqual(self.load_titles(), (["AAAAA"], False))
+        # Rewritten for the new file
+        self.assertEqual(self.load_titles(), (["AAAAA"], True))
+
+    def test_same_size_new_content_is_caught_by_the_digest(self):
+        self.rewrite("BBBB")
+        self.assertEqual(self.load_titles(), (["BBBB"], False))
+
+    def test_touched_file_with_the_same_content_still_uses_the_cache(self):
+        self.touch()
+        self.assertEqual(self.load_titles(), (["AAAA"], True))
+
+    def test_damaged_or_outdated_cache_is_ignored(self):
+        with open(storage.CACHE_FILE, "wb") as f:
+            f.write(b"not a pickle")
+        self.assertEqual(self.load_titles(), (["AAAA"], False))
+        with mock.patch.object(storage, "CACHE_VERSION", storage.CACHE_VERSION + 1):
+            self.assertEqual(self.load_titles(), (["AAAA"], False))
+
+
+class StreamTest(unittest.TestCase):
+    DOC = '\ufeff [ {"id": "a", "title": "Tugas ✓ ]", "n": [1, {"x": "}"}]} ,\n 12345, "é,]", null, true ]'.encode("utf-8")
+
+    def test_any_chunk_split_parses_like_json_loads(self):
+        expected = json.loads(self.DOC.decode("utf-8-sig"))
+        for size in range(1, len(self.DOC) + 1):
+            self.assertEqual(list(storage._iter_array(io.BytesIO(self.DOC), size)), expected, size)
+
+    def test_truncated_input_raises(self):
+        end = self.DOC.rindex(b"]")
+        for cut in range(0, end):
+            with self.assertRaises(json.JSONDecodeError, msg=cut):
+                list(storage._iter_array(io.BytesIO(self.DOC[:cut]), 7))
+
+    def test_top_level_must_be_an_array(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(storage._iter_array(io.BytesIO(b'{"id": "a"}')))
+
+    def test_iter_tasks_yields_records(self):
+        path = os.path.join(tempfile.mkdtemp(prefix="productivity-test-"), "tasks.json")
+        self.addCleanup(shutil.rmtree, os.path.dirname(path))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([{"id": "a", "title": "One"}, "skipped", {"title": "No id"}], f)
+        tasks = list(storage.iter_tasks(path, chunk_size=5))
+        self.assertEqual([(t.id, t["title"]) for t in tasks], [("a", "One"), (None, "No id")])
+
+
+class IncrementalLoadTest(StorageTestCase):
+    def test_tasks_added_while_loading_follow_the_journal_adds(self):
+        write_store(make_tasks(30))
+        storage.add_task(storage.load_tasks(), "Journaled")
+        storage.flush_tasks()
+        tasks = storage.TaskList()
+        batches = storage.load_tasks_incrementally(tasks, first_batch=10, batch_size=10)
+        next(batches)
+        storage.add_task(tasks, "Added while loading")
+        for _ in batches:
+            pass
+        titles = [t["title"] for t in tasks]
+        self.assertEqual(titles[-2:], ["Journaled", "Added while loading"])
+        storage.flush_tasks()
+        self.assertEqual([t["title"] for t in storage.load_tasks()], titles)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Tests for the shared task store (core.store), run in a temporary data directory."""
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from benchmarks.fixtures import make_tasks, write_store
+from benchmarks.stub import StubPubSub
+from core import storage
+from core.store import TaskStore
+from tests.helpers import FakePage, StorageTestCase
+
+
+class LoadFailureTest(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        StubPubSub.reset()
+        self.store = TaskStore()
+
+    def tearDown(self):
+        storage.unwatch_tasks(self.store.publish)
+        super().tearDown()
+
+    def connect(self):
+        page, seen = FakePage(), []
+        self.store.connect(page, seen.append)
+        return seen
+
+    def test_failed_load_is_reported_and_retried(self):
+        write_store(make_tasks(30))
+        load = storage.load_tasks_incrementally
+
+        def broken_load(tasks, **kwargs):
+            # The first batch arrives, then the file cannot be read any further
+            batches = load(tasks, first_batch=10, batch_size=10, **kwargs)
+            yield next(batches)
+            batches.close()
+            raise OSError("disk went away")
+
+        with mock.patch.object(storage, "load_tasks_incrementally", broken_load), \
+                contextlib.redirect_stderr(io.StringIO()) as err:
+            seen = self.connect()
+        self.assertIn("disk went away", err.getvalue())
+        self.assertTrue(self.store.loaded.is_set())
+        self.assertIn("disk went away", self.store.error)
+        self.assertEqual(len(self.store.tasks), 0)
+        self.assertEqual(seen[-1], None)
+
+        # The next session to connect loads again, without the partial batch twice
+        self.connect()
+        self.assertIsNone(self.store.error)
+        self.assertEqual(len(self.store.tasks), 30)
+
+    def test_failed_watch_is_retried_without_reloading(self):
+        write_store(make_tasks(5))
+        with mock.patch.object(storage, "watch_tasks", side_effect=OSError("no watcher")), \
+                contextlib.redirect_stderr(io.StringIO()):
+            self.connect()
+        self.assertIsNone(self.store.error)
+        self.assertEqual(len(self.store.tasks), 5)
+        with mock.patch.object(storage, "load_tasks_incrementally") as load:
+            self.connect()
+        load.assert_not_called()
+        self.assertEqual(len(self.store.tasks), 5)
+        self.assertIn(self.store.publish, storage._watch_listeners)
+
+    def test_partial_list_is_not_compacted(self):
+        write_store(make_tasks(30))
+        tasks = storage.TaskList()
+        batches = storage.load_tasks_incrementally(tasks, first_batch=10, batch_size=10)
+        next(batches)
+        batches.close()
+        storage.add_task(tasks, "Added after the abandoned load")
+        with mock.patch.object(storage, "JOURNAL_COMPACT_BYTES", 0):
+            storage.flush_tasks()
+        self.assertEqual(len(storage.load_tasks()), 31)
+
+
+if __name__ == "__main__":
+    unittest.main()
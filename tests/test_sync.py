@@ -0,0 +1,172 @@
+"""Tests for merging other writers' changes (core.storage.sync_tasks / watch_tasks) and core.watcher."""
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from benchmarks.fixtures import write_store
+from core import storage, watcher
+from core.indexes import GroupIndex
+from core.watcher import FileWatcher
+from tests.helpers import StorageTestCase
+
+TASKS = [
+    {"id": "a", "title": "Laporan", "mata_kuliah": "Data Sains"},
+    {"id": "b", "title": "Kuis", "mata_kuliah": "Sistem Tertanam"},
+    {"id": "c", "title": "Review", "mata_kuliah": "Data Sains", "priority": "high"},
+]
+
+
+def ids(tasks):
+    return [task["id"] for task in tasks]
+
+
+class SyncTestCase(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        write_store(TASKS)
+        self.tasks = storage.load_tasks()
+
+    def write_external(self, items) -> None:
+        """Replace tasks.json the way another process would (temp file + rename)."""
+        tmp = os.path.join(self.data_dir, "external.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(items, f)
+        os.replace(tmp, storage.DATA_FILE)
+
+    def append_external(self, *records) -> None:
+        with open(storage.JOURNAL_FILE, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+
+class MergeTest(SyncTestCase):
+    def test_external_add_keeps_the_disk_order(self):
+        index = GroupIndex(lambda t: t["mata_kuliah"])
+        self.tasks.add_index(index)
+        inserted = {"id": "x", "title": "Inserted", "mata_kuliah": "Data Sains"}
+        self.write_external([TASKS[0], inserted, TASKS[1], TASKS[2]])
+        self.assertEqual(storage.sync_tasks(self.tasks), {"x"})
+        self.assertEqual(ids(self.tasks), ["a", "x", "b", "c"])
+        self.assertEqual(ids(index.get("Data Sains")), ["a", "x", "c"])
+        self.assertEqual(ids(storage.load_tasks()), ["a", "x", "b", "c"])
+
+    def test_external_journal_add_is_appended(self):
+        storage.add_task(self.tasks, "Local")
+        storage.flush_tasks()
+        self.append_external({"op": "add", "task": {"id": "y", "title": "From a script"}})
+        self.assertEqual(storage.sync_tasks(self.tasks), {"y"})
+        self.assertEqual(ids(self.tasks)[-1], "y")
+        self.assertEqual(ids(self.tasks), ids(storage.load_tasks()))
+
+    def test_external_delete(self):
+        self.write_external([TASKS[0], TASKS[2]])
+        self.assertEqual(storage.sync_tasks(self.tasks), {"b"})
+        self.assertEqual(ids(self.tasks), ["a", "c"])
+
+    def test_external_key_removal_reaches_the_record(self):
+        self.write_external([TASKS[0], TASKS[1], {"id": "c", "title": "Review", "mata_kuliah": "Data Sains"}])
+        self.assertEqual(storage.sync_tasks(self.tasks), {"c"})
+        self.assertNotIn("priority", self.tasks.get("c"))
+
+    def test_pending_local_edit_wins(self):
+        with storage._saver.paused():
+            storage.update_task(self.tasks, "a", title="Ours")
+            theirs = dict(TASKS[0], title="Theirs")
+            self.write_external([theirs, dict(TASKS[1], done=True), TASKS[2]])
+            self.assertEqual(storage.sync_tasks(self.tasks), {"b"})
+        self.assertEqual(self.tasks.get("a")["title"], "Ours")
+        self.assertTrue(self.tasks.get("b")["done"])
+        storage.flush_tasks()
+        reloaded = storage.load_tasks()
+        self.assertEqual((reloaded.get("a")["title"], reloaded.get("b")["done"]), ("Ours", True))
+
+    def test_snapshot_rewrite_drops_the_stale_journal(self):
+        added = storage.add_task(self.tasks, "Journaled")
+        storage.flush_tasks()
+        self.assertTrue(os.path.exists(storage.JOURNAL_FILE))
+        # Another process folded our journal into a new snapshot and renamed a task,
+        # leaving the journal (based on the old snapshot) behind
+        self.write_external([TASKS[0], dict(TASKS[1], title="Renamed"), TASKS[2], added.to_dict()])
+        self.assertEqual(storage.sync_tasks(self.tasks), {"b"})
+        self.assertFalse(os.path.exists(storage.JOURNAL_FILE))
+        storage.toggle_task(self.tasks, "a")
+        storage.flush_tasks()
+        self.assertEqual(storage.load_tasks().to_dicts(), self.tasks.to_dicts())
+
+
+class WatchTest(SyncTestCase):
+    def test_watch_tasks_merges_by_polling(self):
+        changed, done = [], threading.Event()
+
+        def on_change(task_ids):
+            changed.append(task_ids)
+            done.set()
+
+        with mock.patch.object(storage, "WATCH_USE_INOTIFY", False), mock.patch.object(storage, "WATCH_POLL_INTERVAL", 0.02):
+            storage.watch_tasks(self.tasks, on_change)
+            try:
+                self.assertEqual(storage._watcher.mode, "poll")
+                self.write_external(TASKS[:2])
+                self.assertTrue(done.wait(2))
+            finally:
+                storage.unwatch_tasks(on_change)
+        self.assertEqual(changed, [{"c"}])
+        self.assertEqual(ids(self.tasks), ["a", "b"])
+
+
+class FileWatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="productivity-watch-")
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.path = os.path.join(self.directory, "tasks.json")
+        self.seen = []
+        self.event = threading.Event()
+
+    def callback(self, names):
+        self.seen.append(names)
+        self.event.set()
+
+    def touch(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def wait(self):
+        self.assertTrue(self.event.wait(2))
+        self.event.clear()
+
+    def test_polling(self):
+        w = FileWatcher(self.directory, ["tasks.json"], self.callback, interval=0.02, use_inotify=False)
+        w.start()
+        self.addCleanup(w.stop)
+        self.assertEqual(w.mode, "poll")
+        self.touch("[]")
+        self.wait()
+        self.assertEqual(self.seen, [{"tasks.json"}])
+
+    @unittest.skipUnless(watcher._load_inotify(), "inotify not available")
+    def test_inotify_falls_back_to_polling(self):
+        w = FileWatcher(self.directory, ["tasks.json"], self.callback, interval=0.02)
+        w.start()
+        self.addCleanup(w.stop)
+        self.assertEqual(w.mode, "inotify")
+        self.touch("[]")
+        self.wait()
+        w._read_events = mock.Mock(side_effect=OSError("inotify fd went bad"))
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            self.touch("[1]")
+            self.wait()
+        self.assertIn("inotify fd went bad", err.getvalue())
+        self.assertEqual(w.mode, "poll")
+        self.touch("[1, 2]")
+        self.wait()
+        self.assertEqual(self.seen, [{"tasks.json"}] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
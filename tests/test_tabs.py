@@ -0,0 +1,57 @@
+"""Tests for lazy tab construction (ui.tabs), run in a temporary data directory."""
+import unittest
+from unittest import mock
+
+from benchmarks.fixtures import make_tasks, write_store
+from tests.helpers import FakePage, StorageTestCase, new_store
+from ui import tabs as tabs_ui
+from ui.theme import LiveTheme
+
+
+class LazyTabsTest(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        write_store(make_tasks(50))
+        new_store()
+        self.page = FakePage()
+        self.pomodoro = mock.patch.object(tabs_ui, "build_pomodoro_section", wraps=tabs_ui.build_pomodoro_section)
+        self.settings = mock.patch.object(tabs_ui, "build_diagnostics_section", wraps=tabs_ui.build_diagnostics_section)
+        self.build_pomodoro = self.pomodoro.start()
+        self.build_settings = self.settings.start()
+        self.addCleanup(self.pomodoro.stop)
+        self.addCleanup(self.settings.stop)
+        self.tabs = tabs_ui.build_tabs(self.page, {"theme": LiveTheme("light_blue"), "current_theme": "light_blue"})
+        self.page.add(self.tabs)
+        self.addCleanup(self.page.close)
+
+    def select(self, index):
+        self.tabs.selected_index = index
+        self.tabs.on_change(None)
+
+    def test_only_the_tasks_tab_is_built_up_front(self):
+        self.build_pomodoro.assert_not_called()
+        self.build_settings.assert_not_called()
+        self.assertEqual(self.tabs.tabs[1].content.content, None)
+
+    def test_tab_is_built_once_on_first_selection(self):
+        self.select(1)
+        self.build_pomodoro.assert_called_once()
+        self.build_settings.assert_not_called()
+        content = self.tabs.tabs[1].content
+        self.select(0)
+        self.select(1)
+        self.build_pomodoro.assert_called_once()
+        self.assertIs(self.tabs.tabs[1].content, content)
+
+    def test_selection_sends_only_the_new_tab(self):
+        sent = []
+        self.page.update = lambda *controls: sent.append(controls)
+        self.select(2)
+        self.build_settings.assert_called_once()
+        self.assertEqual(sent, [(self.tabs.tabs[2],)])
+        self.select(0)
+        self.assertEqual(len(sent), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
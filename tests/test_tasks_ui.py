@@ -0,0 +1,289 @@
+"""Tests for the Tasks section (ui.tasks) mounted on a stub page, run in a temporary data directory."""
+import unittest
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+import flet as ft
+
+from benchmarks.fixtures import make_tasks, write_store
+from core import instrument, utils
+from core import storage
+from core.store import TOPIC, get_task_store
+from tests.helpers import FakePage, StorageTestCase, mount_task_section, new_store, walk
+from ui import tasks as tasks_ui
+from ui.theme import LiveTheme
+
+
+class TaskSectionTestCase(StorageTestCase):
+    def mount(self, size=0, items=None):
+        write_store(make_tasks(size) if items is None else items)
+        new_store()
+        self.page = FakePage()
+        self.theme = LiveTheme("light_blue")
+        self.task_list, self.handlers = mount_task_section(self.page, self.theme)
+        self.addCleanup(self.page.close)
+
+    def texts(self):
+        return [c.value for c in walk(self.task_list) if isinstance(c, ft.Text)]
+
+    def checkboxes(self):
+        return [c for c in walk(self.task_list) if isinstance(c, ft.Checkbox)]
+
+    def cards(self):
+        """The outer container of each rendered card, by task title."""
+        cards = {}
+        for control in walk(self.task_list):
+            if isinstance(control, ft.Container) and control.margin is not None and control.margin.bottom == 10:
+                # Skeleton placeholders have the same margin but no title
+                title = next((c for c in walk(control) if isinstance(c, ft.Text) and c.weight == "bold"), None)
+                if title is not None:
+                    cards[title.value] = control
+        return cards
+
+    def viewport(self):
+        return next(c for c in walk(self.task_list) if isinstance(c, ft.Column) and c.on_scroll is not None)
+
+
+class ThemeSwitchTest(TaskSectionTestCase):
+    def test_switch_restyles_cards_in_place(self):
+        self.mount(20)
+        before = self.checkboxes()
+        self.theme.switch("dark_blue")
+        after = self.checkboxes()
+        self.assertEqual([id(c) for c in after], [id(c) for c in before])
+        self.assertEqual({c.fill_color for c in after}, {self.theme["primary"]})
+        surfaces = [c for c in walk(self.task_list) if isinstance(c, ft.Container) and c.height == tasks_ui.CARD_HEIGHT]
+        texts = [c for c in walk(self.task_list) if isinstance(c, ft.Text) and c.value[:2] in ("📅 ", "📌 ")]
+        self.assertTrue(all(c.bgcolor == self.theme["surface"] for c in surfaces))
+        self.assertTrue(texts)
+        palette = {self.theme[key] for key in ("primary", "danger", "text_secondary")}
+        self.assertTrue(all(c.color in palette for c in texts))
+
+    def test_pruned_cards_are_unbound(self):
+        self.mount(tasks_ui.VIRTUALIZE_THRESHOLD * 2)
+        viewport = self.viewport()
+        bound = len(self.theme._bindings)
+        for pixels in range(0, 40000, 2000):
+            viewport.on_scroll(SimpleNamespace(pixels=pixels, viewport_dimension=tasks_ui.VIEWPORT_HEIGHT))
+        viewport.on_scroll(SimpleNamespace(pixels=0, viewport_dimension=tasks_ui.VIEWPORT_HEIGHT))
+        self.assertLessEqual(len(self.theme._bindings), bound + 2)
+        self.theme.switch("pink")
+        self.assertEqual({c.fill_color for c in self.checkboxes()}, {self.theme["primary"]})
+
+
+class KeyedCardTest(TaskSectionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mount(20)
+        self.store = get_task_store()
+        self.before = self.cards()
+
+    def task_id(self, title):
+        return next(t["id"] for t in self.store.tasks if t["title"] == title)
+
+    def assertReused(self, *skip):
+        after = self.cards()
+        for title, card in self.before.items():
+            if title not in skip:
+                self.assertIs(after[title], card, title)
+
+    def test_toggle_patches_the_card_in_place(self):
+        title = next(iter(self.before))
+        checkbox = next(c for c in walk(self.before[title]) if isinstance(c, ft.Checkbox))
+        done = checkbox.value
+        self.handlers["toggle_task"](self.task_id(title))
+        self.assertReused()
+        self.assertIs(next(c for c in walk(self.before[title]) if isinstance(c, ft.Checkbox)), checkbox)
+        self.assertEqual(checkbox.value, not done)
+        # Only the patched card is sent, not the list
+        self.assertLess(self.page.updates[-1], len(list(walk(self.before[title]))) + 1)
+
+    def test_edit_rerenders_only_that_card(self):
+        title = next(iter(self.before))
+        self.store.update_task(self.task_id(title), deskripsi="changed")
+        after = self.cards()
+        self.assertIs(after[title], self.before[title])
+        self.assertIn("changed", [c.value for c in walk(after[title]) if isinstance(c, ft.Text)])
+        self.assertReused()
+
+    def test_add_and_delete_keep_the_other_cards(self):
+        first = next(iter(self.before))
+        self.handlers["delete_task"](self.task_id(first))
+        self.store.add_task("Brand new", deadline="No deadline")
+        after = self.cards()
+        self.assertNotIn(first, after)
+        self.assertIn("Brand new", after)
+        self.assertReused(first)
+
+
+class VirtualListTest(TaskSectionTestCase):
+    def scroll(self, pixels):
+        self.viewport().on_scroll(SimpleNamespace(pixels=pixels, viewport_dimension=tasks_ui.VIEWPORT_HEIGHT))
+
+    def extent(self):
+        """Spacers plus rendered rows: the full scroll height of the list."""
+        controls = self.viewport().controls
+        rows = controls[1:-1]
+        cards = sum(1 for c in rows if isinstance(c, ft.Container) and c.height == tasks_ui.CARD_HEIGHT)
+        return (controls[0].height + controls[-1].height + cards * tasks_ui.CARD_EXTENT
+                + (len(rows) - cards) * tasks_ui.HEADER_EXTENT)
+
+    def test_only_the_scroll_window_is_built(self):
+        self.mount(2000)
+        window = tasks_ui.VIEWPORT_HEIGHT // tasks_ui.CARD_EXTENT + 2 + 2 * tasks_ui.OVERSCAN_ROWS
+        self.assertLessEqual(len(self.cards()), window)
+        top = set(self.cards())
+        total = self.extent()
+        self.scroll(100000)
+        self.assertLessEqual(len(self.cards()), window)
+        self.assertFalse(top & set(self.cards()))
+        self.assertEqual(self.extent(), total)
+        self.assertLessEqual(self.viewport().controls[0].height, 100000)
+        self.assertGreater(self.viewport().controls[0].height, 100000 - tasks_ui.OVERSCAN_ROWS * tasks_ui.CARD_EXTENT - tasks_ui.VIEWPORT_HEIGHT)
+
+    def test_small_scroll_reuses_the_cards(self):
+        self.mount(1000)
+        self.scroll(20000)
+        before = self.cards()
+        self.scroll(20000 + tasks_ui.CARD_EXTENT)
+        after = self.cards()
+        shared = set(before) & set(after)
+        self.assertGreater(len(shared), len(before) // 2)
+        self.assertTrue(all(before[title] is after[title] for title in shared))
+
+    def test_sticky_header_names_the_first_visible_group(self):
+        self.mount(1000)
+        self.scroll(50000)
+        viewport = self.viewport()
+        sticky = next(c for c in walk(self.task_list) if isinstance(c, ft.Column) and viewport in c.controls).controls[0]
+        y = viewport.controls[0].height
+        for row in viewport.controls[1:-1]:
+            is_card = row.height == tasks_ui.CARD_HEIGHT
+            y += tasks_ui.CARD_EXTENT if is_card else tasks_ui.HEADER_EXTENT
+            if y > 50000:
+                break
+        if is_card:
+            title = next(c for c in walk(row) if isinstance(c, ft.Text) and c.weight == "bold").value
+            deadline = next(t["deadline"] for t in get_task_store().tasks if t["title"] == title)
+            self.assertEqual(sticky.value, f"📅 {deadline}")
+        else:
+            self.assertEqual(sticky.value, row.content.value)
+
+    def test_shrinking_below_the_threshold_renders_every_card(self):
+        self.mount(tasks_ui.VIRTUALIZE_THRESHOLD + 1)
+        self.assertLess(len(self.cards()), tasks_ui.VIRTUALIZE_THRESHOLD)
+        store = get_task_store()
+        self.handlers["delete_task"](next(iter(store.tasks))["id"])
+        self.assertEqual(len(self.cards()), tasks_ui.VIRTUALIZE_THRESHOLD)
+
+
+class RenderCountTest(TaskSectionTestCase):
+    def setUp(self):
+        super().setUp()
+        was_enabled = instrument.is_enabled()
+        instrument.reset()
+        instrument.set_enabled(True)
+        self.addCleanup(instrument.reset)
+        self.addCleanup(instrument.set_enabled, was_enabled)
+
+    def counts(self, name):
+        return instrument.snapshot()["controls_per_render"][name]
+
+    def test_first_render_counts_every_card_and_header(self):
+        self.mount(20)
+        groups = len(list(get_task_store().index("deadline", None).groups()))
+        self.assertEqual(self.counts("tasks.build_task_ui")["max"], 20 + groups)
+
+    def test_toggle_counts_only_the_patched_card(self):
+        self.mount(20)
+        instrument.reset()
+        self.handlers["toggle_task"](next(iter(get_task_store().tasks))["id"])
+        stats = self.counts("tasks.build_task_ui")
+        self.assertEqual((stats["count"], stats["max"]), (1, 1))
+
+    def test_scrolling_counts_the_rows_it_builds(self):
+        self.mount(tasks_ui.VIRTUALIZE_THRESHOLD * 2)
+        viewport = self.viewport()
+        viewport.on_scroll(SimpleNamespace(pixels=0, viewport_dimension=tasks_ui.VIEWPORT_HEIGHT))
+        viewport.on_scroll(SimpleNamespace(pixels=20000, viewport_dimension=tasks_ui.VIEWPORT_HEIGHT))
+        stats = self.counts("tasks.scroll")
+        self.assertEqual((stats["count"], stats["min"]), (2, 0))
+        self.assertGreater(stats["max"], 0)
+
+
+class BackgroundLoadTest(TaskSectionTestCase):
+    def mount_deferred(self, size):
+        write_store(make_tasks(size))
+        new_store()
+        self.page = FakePage(defer_threads=True)
+        self.theme = LiveTheme("light_blue")
+        self.task_list, self.handlers = mount_task_section(self.page, self.theme)
+        self.addCleanup(self.page.close)
+
+    def skeletons(self):
+        return [c for c in walk(self.task_list) if isinstance(c, ft.Container) and c.height == tasks_ui.CARD_HEIGHT
+                and not any(isinstance(t, ft.Text) for t in walk(c))]
+
+    def loading_row(self):
+        return next(c for c in walk(self.task_list) if isinstance(c, ft.Column) and any(isinstance(p, ft.ProgressBar) for p in c.controls))
+
+    def test_skeleton_until_the_worker_loads(self):
+        with mock.patch.object(storage, "load_tasks_incrementally", wraps=storage.load_tasks_incrementally) as load:
+            self.mount_deferred(30)
+            # Mounting only queues the load: nothing is read on the UI thread
+            load.assert_not_called()
+            self.assertEqual(self.cards(), {})
+            self.assertEqual(len(self.skeletons()), tasks_ui.SKELETON_CARDS)
+            self.assertGreaterEqual(len(self.page.threads), 1)
+            self.page.run_threads()
+            load.assert_called_once()
+        self.assertEqual(len(self.cards()), 30)
+        self.assertEqual(self.skeletons(), [])
+        self.assertFalse(self.loading_row().visible)
+
+    def test_first_batch_replaces_the_skeleton_while_the_rest_loads(self):
+        self.mount_deferred(3000)
+        seen = []
+        other = FakePage()
+        other.pubsub.subscribe_topic(TOPIC, lambda topic, ids: seen.append((len(self.cards()), self.loading_row().visible)))
+        self.page.run_threads()
+        first_cards, loading = seen[0]
+        self.assertGreater(first_cards, 0)
+        self.assertTrue(loading)
+        self.assertFalse(seen[-1][1])
+        self.assertEqual(len(get_task_store().tasks), 3000)
+
+    def test_later_sessions_render_from_memory(self):
+        self.mount_deferred(30)
+        self.page.run_threads()
+        page = FakePage(defer_threads=True)
+        task_list, _ = mount_task_section(page)
+        self.addCleanup(page.close)
+        self.assertEqual(page.threads, [])
+        self.assertEqual(sum(1 for c in walk(task_list) if isinstance(c, ft.Checkbox)), 30)
+
+
+class DeadlineTest(TaskSectionTestCase):
+    def test_cards_and_headers_show_the_stored_deadline(self):
+        self.mount(items=[
+            {"id": "due", "title": "Due", "deadline": "2025-03-01"},
+            {"id": "open", "title": "Open", "deadline": "No deadline"},
+        ])
+        texts = self.texts()
+        # Group header and card each
+        self.assertEqual((texts.count("📅 2025-03-01"), texts.count("📅 No deadline")), (2, 2))
+        card_texts = [c for c in walk(self.cards()["Due"]) if isinstance(c, ft.Text) and c.value.startswith("📅")]
+        self.assertEqual([c.color for c in card_texts], [self.theme["danger"]])
+
+    def test_day_rolling_over_does_not_rerender_cards(self):
+        today = utils.get_today()
+        self.mount(items=[{"id": "due", "title": "Due", "deadline": (today + timedelta(days=1)).isoformat()}])
+        card = self.cards()["Due"]
+        with mock.patch.object(utils, "get_today", return_value=today + timedelta(days=1)):
+            self.assertEqual(self.handlers["build_task_ui"](), [])
+        self.assertIs(self.cards()["Due"], card)
+
+
+if __name__ == "__main__":
+    unittest.main()
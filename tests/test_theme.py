@@ -0,0 +1,58 @@
+"""Tests for in-place theme switching (ui.theme)."""
+import unittest
+
+import flet as ft
+
+from ui.theme import LIGHT_BLUE_THEME, LiveTheme, bind, get_theme, on_theme_change, unbind
+
+
+class LiveThemeTest(unittest.TestCase):
+    def setUp(self):
+        self.theme = LiveTheme("light_blue")
+
+    def test_switch_restyles_bound_controls(self):
+        text = ft.Text("x", color=self.theme["text_primary"])
+        box = ft.Container()
+        self.assertIs(bind(self.theme, text, color="text_primary"), text)
+        bind(self.theme, box, bgcolor="surface", border=lambda t: ft.border.all(1, t["border"]))
+        self.theme.switch("dark_blue")
+        dark = get_theme("dark_blue")
+        self.assertEqual((self.theme.key, self.theme["surface"]), ("dark_blue", dark["surface"]))
+        self.assertEqual(text.color, dark["text_primary"])
+        self.assertEqual(box.bgcolor, dark["surface"])
+        self.assertEqual(box.border.top.color, dark["border"])
+
+    def test_binding_a_control_again_adds_properties(self):
+        box = ft.Container()
+        bind(self.theme, box, bgcolor="surface")
+        bind(self.theme, box, border=lambda t: ft.border.all(1, t["border"]))
+        self.theme.switch("pink")
+        self.assertEqual(len(self.theme._bindings), 1)
+        self.assertEqual((box.bgcolor, box.border.top.color), (self.theme["surface"], self.theme["border"]))
+
+    def test_unbound_controls_are_left_alone(self):
+        text = bind(self.theme, ft.Text("x"), color="primary")
+        unbind(self.theme, text, ft.Text("never bound"))
+        self.theme.switch("pink")
+        self.assertIsNone(text.color)
+        self.assertEqual(self.theme._bindings, {})
+
+    def test_hooks_run_after_the_controls_are_restyled(self):
+        text = bind(self.theme, ft.Text("x"), color="primary")
+        seen = []
+        on_theme_change(self.theme, lambda: seen.append(text.color))
+        self.theme.switch("pink")
+        self.assertEqual(seen, [self.theme["primary"]])
+
+    def test_plain_palettes_and_unknown_keys(self):
+        palette = dict(LIGHT_BLUE_THEME)
+        text = ft.Text("x")
+        self.assertIs(bind(palette, text, color="primary"), text)
+        unbind(palette, text)
+        on_theme_change(palette, lambda: None)
+        self.theme.switch("no-such-theme")
+        self.assertEqual(dict(self.theme), LIGHT_BLUE_THEME)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Tests for bulk import (core.transfer) and its single write, run in a temporary data directory."""
+import csv
+import os
+import time
+import unittest
+from unittest import mock
+
+from core import storage, transfer
+from tests.helpers import StorageTestCase
+
+
+class ImportWriteTest(StorageTestCase):
+    def write_csv(self, count: int) -> str:
+        path = os.path.join(self.data_dir, "import.csv")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["title", "deadline", "mata_kuliah"])
+            writer.writerows((f"Task {i}", "2025-06-01", "Fisika") for i in range(count))
+        return path
+
+    def test_small_import_is_one_journal_append(self):
+        path = self.write_csv(100)
+        tasks = storage.load_tasks()
+        storage.flush_tasks()
+        writes = storage.get_save_stats()["writes"]
+        submit = storage._saver.submit
+
+        def submit_and_yield(item):
+            # No debounce and a pause after each item: the worker writes whatever is queued so far
+            submit(item)
+            time.sleep(0.002)
+
+        with mock.patch.object(storage, "_append_records", wraps=storage._append_records) as append, \
+                mock.patch.object(storage._saver, "delay", 0), \
+                mock.patch.object(storage._saver, "submit", submit_and_yield):
+            result = transfer.import_tasks(path, tasks)
+            storage.flush_tasks()
+        self.assertEqual(result["imported"], 100)
+        self.assertEqual(append.call_count, 1)
+        self.assertEqual(len(append.call_args[0][0]), 100)
+        self.assertEqual(storage.get_save_stats()["writes"] - writes, 1)
+        self.assertEqual(len(storage.load_tasks()), 100)
+
+    def test_large_import_is_one_snapshot(self):
+        path = self.write_csv(storage.BULK_SNAPSHOT_TASKS)
+        tasks = storage.load_tasks()
+        with mock.patch.object(storage, "_append_records", wraps=storage._append_records) as append, \
+                mock.patch.object(storage, "_write_snapshot", wraps=storage._write_snapshot) as snapshot:
+            transfer.import_tasks(path, tasks)
+            storage.flush_tasks()
+        self.assertEqual((append.call_count, snapshot.call_count), (0, 1))
+        self.assertEqual(len(storage.load_tasks()), storage.BULK_SNAPSHOT_TASKS)
+
+
+if __name__ == "__main__":
+    unittest.main()
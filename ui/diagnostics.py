@@ -0,0 +1,146 @@
+"""Diagnostics section for Productivity Tracker (Settings tab): performance instrumentation."""
+import os
+import time
+
+import flet as ft
+from core import instrument, storage
+from ui.theme import bind, on_theme_change
+
+BORDER_RADIUS = 12
+
+
+def _format_bytes(count: int) -> str:
+    """Format a byte count as "812 B" / "14.2 KB" / "3.1 MB"."""
+    for unit in ("B", "KB", "MB"):
+        if count < 1024 or unit == "MB":
+            return f"{count} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+
+
+def build_diagnostics_section(page: ft.Page, theme: dict):
+    """
+    Build the Diagnostics view: a switch for core.instrument, latency and
+    render-size tables, bytes written, and JSON export.
+
+    Args:
+        page: The Flet page instance.
+        theme: Theme palette (a LiveTheme keeps it restyled).
+
+    Returns:
+        tuple: (diagnostics_container, handler_dict)
+        where handler_dict contains: refresh_diagnostics, export_diagnostics
+    """
+    enabled_switch = ft.Switch(label="Record measurements", value=instrument.is_enabled(), label_style=ft.TextStyle(size=13, color=theme["text_primary"]))
+    bind(theme, enabled_switch, label_style=lambda t: ft.TextStyle(size=13, color=t["text_primary"]))
+    metrics_column = ft.Column(spacing=4)
+    status_text = bind(theme, ft.Text("", size=11, color=theme["text_secondary"]), color="text_secondary")
+
+    def cell(value, width=None, bold=False, secondary=False):
+        return ft.Text(
+            value,
+            size=11,
+            width=width,
+            expand=width is None,
+            weight="bold" if bold else None,
+            color=theme["text_secondary"] if secondary else theme["text_primary"],
+        )
+
+    def table(title, header, rows):
+        controls = [ft.Text(title, size=13, weight="w500", color=theme["text_secondary"])]
+        if not rows:
+            return controls + [cell("Nothing recorded yet", secondary=True)]
+        controls.append(ft.Row([cell(header[0], bold=True)] + [cell(h, width=64, bold=True) for h in header[1:]], spacing=6))
+        for name, *values in rows:
+            controls.append(ft.Row([cell(name)] + [cell(v, width=64) for v in values], spacing=6))
+        return controls
+
+    def render():
+        """Fill the view from the current measurements; return the controls that changed."""
+        data = instrument.snapshot()
+        latency = [
+            (name, str(h["count"]), f"{h['p50']:.2f}", f"{h['p95']:.2f}", f"{h['max']:.2f}")
+            for name, h in data["latency_ms"].items()
+        ]
+        controls = [
+            (name, str(h["count"]), f"{h['mean']:.0f}", f"{h['p95']:.0f}", f"{h['max']:.0f}")
+            for name, h in data["controls_per_render"].items()
+        ]
+        written = [(name, _format_bytes(count)) for name, count in data["bytes_written"].items()]
+        metrics_column.controls = (
+            table("Latency (ms)", ("Operation", "Calls", "p50", "p95", "Max"), latency)
+            + table("Controls built per render", ("Render", "Calls", "Mean", "p95", "Max"), controls)
+            + table("Bytes written", ("File", "Total"), written)
+        )
+        return [metrics_column]
+
+    def refresh(*controls):
+        controls = [c for c in controls if c.page is not None]
+        if controls:
+            page.update(*controls)
+
+    def refresh_diagnostics(e=None):
+        """Re-render the tables from the current measurements."""
+        status_text.value = "Recording" if instrument.is_enabled() else "Off"
+        refresh(status_text, *render())
+
+    def on_toggle(e):
+        instrument.set_enabled(enabled_switch.value)
+        refresh_diagnostics()
+
+    def reset_diagnostics(e):
+        instrument.reset()
+        refresh_diagnostics()
+
+    def export_diagnostics(e=None):
+        """Write the measurements to data/diagnostics-<timestamp>.json; return the path."""
+        path = os.path.join(storage.DATA_DIR, f"diagnostics-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        try:
+            instrument.export_json(path, extra={"save_stats": storage.get_save_stats()})
+            status_text.value = f"Exported to {os.path.normpath(path)}"
+        except OSError as err:
+            path = None
+            status_text.value = f"Export failed: {err}"
+        refresh(status_text)
+        return path
+
+    enabled_switch.on_change = on_toggle
+
+    def button(text, icon, on_click):
+        return bind(theme, ft.OutlinedButton(text, icon=icon, on_click=on_click, icon_color=theme["primary"]), icon_color="primary")
+
+    render()
+    status_text.value = "Recording" if instrument.is_enabled() else "Off"
+    # Table text uses theme colors directly; rebuild it with the new palette
+    on_theme_change(theme, render)
+
+    diagnostics_container = ft.Container(
+        content=ft.Column(
+            [
+                bind(theme, ft.Text("Diagnostics", size=15, weight="bold", color=theme["text_primary"]), color="text_primary"),
+                bind(theme, ft.Divider(height=1, color=theme["border"]), color="border"),
+                enabled_switch,
+                ft.Row(
+                    [
+                        button("Refresh", ft.Icons.REFRESH, refresh_diagnostics),
+                        button("Reset", ft.Icons.RESTART_ALT, reset_diagnostics),
+                        button("Export JSON", ft.Icons.DOWNLOAD, export_diagnostics),
+                    ],
+                    spacing=8,
+                    wrap=True,
+                ),
+                status_text,
+                metrics_column,
+            ],
+            spacing=12,
+        ),
+        padding=20,
+        bgcolor=theme["surface"],
+        border_radius=BORDER_RADIUS,
+        margin=ft.margin.only(left=16, right=16, bottom=16),
+        border=ft.border.all(1, theme["border"]),
+    )
+    bind(theme, diagnostics_container, bgcolor="surface", border=lambda t: ft.border.all(1, t["border"]))
+
+    handler_dict = {"refresh_diagnostics": refresh_diagnostics, "export_diagnostics": export_diagnostics}
+
+    return diagnostics_container, handler_dict
@@ -1,6 +1,7 @@
 """Header section with greeting for Productivity Tracker - Modernized."""
 import flet as ft
 from core.utils import get_greeting
+from ui.theme import bind
 
 
 def build_header(theme: dict) -> ft.Container:
@@ -14,15 +15,16 @@ def build_header(theme: dict) -> ft.Container:
         ft.Container: The greeting section with modern design.
     """
     greeting = ft.Container(
-        content=ft.Text(
+        content=bind(theme, ft.Text(
             get_greeting(),
             size=20,
             weight="bold",
             color=theme["header_text"],
-        ),
+        ), color="header_text"),
         padding=ft.padding.symmetric(horizontal=20, vertical=24),
         bgcolor=theme["header_bg"],
         border_radius=0,
         margin=0,
     )
+    bind(theme, greeting, bgcolor="header_bg")
     return greeting
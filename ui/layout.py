@@ -2,7 +2,7 @@
 import flet as ft
 from ui.header import build_header
 from ui.tabs import build_tabs
-from ui.theme import get_theme
+from ui.theme import LiveTheme
 
 
 def build_page_layout(page: ft.Page, theme_state: dict):
@@ -16,8 +16,9 @@ def build_page_layout(page: ft.Page, theme_state: dict):
     Returns:
         ft.Column: The main layout column with header and tabs.
     """
-    # Get current theme
-    theme = get_theme(theme_state.get("current_theme", "light_blue"))
+    # Live theme shared by every section so theme switches restyle in place
+    theme = LiveTheme(theme_state.get("current_theme", "light_blue"))
+    theme_state["theme"] = theme
     
     # Build header
     header = build_header(theme)
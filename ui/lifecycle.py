@@ -0,0 +1,35 @@
+"""Session lifecycle hooks for Productivity Tracker: cleanup when a page's session closes."""
+import traceback
+
+import flet as ft
+
+
+def on_session_close(page: ft.Page, hook) -> None:
+    """
+    Call ``hook()`` once the page's session closes (the client is gone for good).
+
+    Flet keeps a single ``page.on_close`` handler; this chains the hooks of
+    every section on it (and any handler set before). A failing hook is
+    reported and does not stop the others.
+
+    Args:
+        page: The Flet page instance.
+        hook: Callable taking no arguments, e.g. an unsubscribe function.
+    """
+    hooks = getattr(page, "close_hooks", None)
+    if hooks is None:
+        hooks = page.close_hooks = []
+        previous = getattr(page, "on_close", None)
+
+        def run_close_hooks(e):
+            for close_hook in hooks:
+                try:
+                    close_hook()
+                except Exception:
+                    traceback.print_exc()
+            hooks.clear()
+            if previous is not None:
+                previous(e)
+
+        page.on_close = run_close_hooks
+    hooks.append(hook)
@@ -1,10 +1,17 @@
 """Pomodoro timer UI section for Productivity Tracker - Modernized."""
 import flet as ft
-from core.pomodoro import PomodoroTimer
+from core import instrument
+from core.pomodoro import AsyncPomodoroTimer, PomodoroTimer
+from core.sessions import ABORTED, COMPLETED, log_session
+from ui.lifecycle import on_session_close
+from ui.theme import bind
 
 # Modern color palette
 BORDER_RADIUS = 12
 
+# Seconds between display updates during breaks (work sessions tick every second)
+BREAK_TICK_SECONDS = 5
+
 
 def build_pomodoro_section(page: ft.Page, theme: dict):
     """
@@ -25,6 +32,7 @@ def build_pomodoro_section(page: ft.Page, theme: dict):
         color=theme.get("primary", "#007bff"),
         text_align="center",
     )
+    bind(theme, timer_display, color="primary")
 
     timer_status = ft.Text(
         "",
@@ -33,6 +41,7 @@ def build_pomodoro_section(page: ft.Page, theme: dict):
         text_align="center",
         weight="w500",
     )
+    bind(theme, timer_status, color="success")
 
     start_button = ft.ElevatedButton(
         "▶ Start",
@@ -42,6 +51,7 @@ def build_pomodoro_section(page: ft.Page, theme: dict):
         color="white",
         elevation=2,
     )
+    bind(theme, start_button, bgcolor="primary")
 
     stop_button = ft.ElevatedButton(
         "⏹ Stop",
@@ -51,38 +61,67 @@ def build_pomodoro_section(page: ft.Page, theme: dict):
         color="white",
         elevation=2,
     )
-
-    # Initialize timer
-    timer = PomodoroTimer()
-
+    bind(theme, stop_button, bgcolor="danger")
+
+    # Initialize timer: run it on the page's event loop when possible, so ticks
+    # never touch controls from another thread
+    if hasattr(page, "run_task"):
+        timer = AsyncPomodoroTimer(break_tick_seconds=BREAK_TICK_SECONDS, run_task=page.run_task)
+    else:
+        timer = PomodoroTimer(break_tick_seconds=BREAK_TICK_SECONDS)
+
+    def update_controls(*controls):
+        """Send only the given controls (page.update is locked, so also safe from a timer thread)."""
+        mounted = [c for c in controls if c.page is not None]
+        if mounted:
+            page.update(*mounted)
+
+    @instrument.timed("pomodoro.tick")
     def on_timer_tick(time_str):
         """Update timer display."""
+        if timer_display.value == time_str:
+            return
         timer_display.value = time_str
-        page.update()
+        update_controls(timer_display)
 
     def on_timer_complete(session_type):
         """Handle timer completion."""
+        log_session(session_type, COMPLETED, timer.duration_of(session_type) / 60)
         timer_status.value = f"✨ {session_type} Complete!"
-        page.update()
+        controls = [timer_status]
+        if not timer.running:
+            # The break ended the run; let the user start the next session
+            start_button.disabled = False
+            stop_button.disabled = True
+            controls += [start_button, stop_button]
+        update_controls(*controls)
 
     timer.on_tick = on_timer_tick
     timer.on_complete = on_timer_complete
+    # A closed session's timer must not keep ticking into its dead page
+    on_session_close(page, timer.stop)
 
-    def start_timer(e):
-        """Start the Pomodoro timer."""
+    async def start_timer(e):
+        """Start the Pomodoro timer (async so it runs on the event loop)."""
         timer.start()
+        timer_status.value = ""
         start_button.disabled = True
         stop_button.disabled = False
-        page.update()
-
-    def stop_timer(e):
-        """Stop the Pomodoro timer."""
+        update_controls(timer_status, start_button, stop_button)
+
+    async def stop_timer(e):
+        """Stop the Pomodoro timer (async so it runs on the event loop)."""
+        if timer.running:
+            # Record the interrupted session with the time actually spent in it
+            elapsed = timer.duration_of(timer.phase) - timer.remaining()
+            if elapsed >= 1:
+                log_session(timer.phase, ABORTED, elapsed / 60)
         timer.stop()
         timer_display.value = "25:00"
         timer_status.value = ""
         start_button.disabled = False
         stop_button.disabled = True
-        page.update()
+        update_controls(timer_display, timer_status, start_button, stop_button)
 
     start_button.on_click = start_timer
     stop_button.on_click = stop_timer
@@ -94,8 +133,8 @@ def build_pomodoro_section(page: ft.Page, theme: dict):
     pomodoro_container = ft.Container(
         content=ft.Column(
             [
-                ft.Text("⏲️ Pomodoro Timer", size=18, weight="bold", color=theme.get("text_primary", "#1a1a1a")),
-                ft.Divider(height=1, color=theme.get("border", "#e0e0e0")),
+                bind(theme, ft.Text("⏲️ Pomodoro Timer", size=18, weight="bold", color=theme.get("text_primary", "#1a1a1a")), color="text_primary"),
+                bind(theme, ft.Divider(height=1, color=theme.get("border", "#e0e0e0")), color="border"),
                 timer_display,
                 timer_status,
                 ft.Row(
@@ -119,6 +158,7 @@ def build_pomodoro_section(page: ft.Page, theme: dict):
             offset=ft.Offset(0, 2),
         ),
     )
+    bind(theme, pomodoro_container, bgcolor="surface", border=lambda t: ft.border.all(1, t["border"]))
 
     handler_dict = {
         "start_timer": start_timer,
@@ -0,0 +1,127 @@
+"""Focus statistics section for Productivity Tracker (Pomodoro tab)."""
+import flet as ft
+from core.sessions import get_stats, on_session_logged
+from ui.lifecycle import on_session_close
+from ui.theme import bind, on_theme_change
+
+BORDER_RADIUS = 12
+BAR_MAX_HEIGHT = 60
+TOP_SUBJECTS = 5
+
+
+def _format_minutes(minutes: float) -> str:
+    """Format minutes as "1h 05m" / "25m"."""
+    hours, mins = divmod(int(round(minutes)), 60)
+    return f"{hours}h {mins:02d}m" if hours else f"{mins}m"
+
+
+def build_stats_section(page: ft.Page, theme: dict):
+    """
+    Build the focus statistics view. Figures come from the precomputed
+    session aggregates (core.sessions), so rendering never scans the log.
+
+    Args:
+        page: The Flet page instance.
+        theme: Theme palette (a LiveTheme keeps it restyled).
+
+    Returns:
+        tuple: (stats_container, handler_dict)
+        where handler_dict contains: refresh_stats
+    """
+    summary_row = ft.Row(spacing=12, wrap=True)
+    bars_row = ft.Row(spacing=8, alignment="center", vertical_alignment="end")
+    subjects_column = ft.Column(spacing=6)
+
+    def stat_tile(label, value):
+        return ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text(value, size=18, weight="bold", color=theme["primary"]),
+                    ft.Text(label, size=11, color=theme["text_secondary"]),
+                ],
+                spacing=2,
+                horizontal_alignment="center",
+            ),
+            padding=ft.padding.symmetric(horizontal=14, vertical=10),
+            bgcolor=theme["primary_light"],
+            border_radius=8,
+        )
+
+    def render():
+        """Fill the view from the aggregates; return the controls that changed."""
+        stats = get_stats()
+        summary_row.controls = [
+            stat_tile("Today", _format_minutes(stats["today_minutes"])),
+            stat_tile("Last 7 days", _format_minutes(stats["week_minutes"])),
+            stat_tile("Streak", f"{stats['current_streak']} d"),
+            stat_tile("Best streak", f"{stats['longest_streak']} d"),
+            stat_tile("Sessions", f"{stats['completed']} ✓ / {stats['aborted']} ✗"),
+        ]
+
+        peak = max((m for _, m in stats["last_7_days"]), default=0) or 1
+        bars_row.controls = [
+            ft.Column(
+                [
+                    ft.Container(
+                        width=22,
+                        height=max(2, BAR_MAX_HEIGHT * minutes / peak),
+                        bgcolor=theme["primary"] if minutes else theme["border"],
+                        border_radius=4,
+                        tooltip=f"{day}: {_format_minutes(minutes)}",
+                    ),
+                    ft.Text(day[5:], size=10, color=theme["text_secondary"]),
+                ],
+                spacing=4,
+                horizontal_alignment="center",
+            )
+            for day, minutes in stats["last_7_days"]
+        ]
+
+        subjects = stats["by_subject"][:TOP_SUBJECTS]
+        subjects_column.controls = [
+            ft.Row(
+                [
+                    ft.Text(subject or "Uncategorized", size=12, color=theme["text_primary"], expand=True),
+                    ft.Text(_format_minutes(minutes), size=12, weight="w500", color=theme["text_secondary"]),
+                ]
+            )
+            for subject, minutes in subjects
+        ] or [ft.Text("No focus sessions yet", size=12, color=theme["text_secondary"])]
+        return [summary_row, bars_row, subjects_column]
+
+    def refresh_stats(record=None):
+        """Re-render after a session is logged (may run on a timer thread)."""
+        controls = [c for c in render() if c.page is not None]
+        if controls:
+            page.update(*controls)
+
+    render()
+    # Listeners are process-wide: drop this session's when it closes
+    on_session_close(page, on_session_logged(refresh_stats))
+    # Tiles use theme colors directly; rebuild them with the new palette
+    on_theme_change(theme, render)
+
+    stats_container = ft.Container(
+        content=ft.Column(
+            [
+                bind(theme, ft.Text("📊 Focus Statistics", size=16, weight="bold", color=theme["text_primary"]), color="text_primary"),
+                bind(theme, ft.Divider(height=1, color=theme["border"]), color="border"),
+                summary_row,
+                bind(theme, ft.Text("Last 7 days", size=13, weight="w500", color=theme["text_secondary"]), color="text_secondary"),
+                bars_row,
+                bind(theme, ft.Text("By subject", size=13, weight="w500", color=theme["text_secondary"]), color="text_secondary"),
+                subjects_column,
+            ],
+            spacing=12,
+        ),
+        padding=20,
+        bgcolor=theme["surface"],
+        border_radius=BORDER_RADIUS,
+        margin=ft.margin.only(left=16, right=16, bottom=16),
+        border=ft.border.all(1, theme["border"]),
+    )
+    bind(theme, stats_container, bgcolor="surface", border=lambda t: ft.border.all(1, t["border"]))
+
+    handler_dict = {"refresh_stats": refresh_stats}
+
+    return stats_container, handler_dict
@@ -2,7 +2,9 @@
 import flet as ft
 from ui.tasks import build_task_section
 from ui.pomodoro import build_pomodoro_section
-from ui.theme import get_theme, THEME_NAMES, THEME_KEYS
+from ui.stats import build_stats_section
+from ui.diagnostics import build_diagnostics_section
+from ui.theme import get_theme, bind, THEME_NAMES, THEME_KEYS
 
 
 def build_tabs(page: ft.Page, theme_state: dict):
@@ -16,21 +18,18 @@ def build_tabs(page: ft.Page, theme_state: dict):
     Returns:
         ft.Tabs: The tabs component with all sections.
     """
-    # Get current theme
-    theme = get_theme(theme_state.get("current_theme", "light_blue"))
+    # Live theme from the layout (falls back to a static palette)
+    theme = theme_state.get("theme") or get_theme(theme_state.get("current_theme", "light_blue"))
     
     # Build task section
     input_container, task_list_container, date_display, task_handlers = build_task_section(page, theme)
 
-    # Build pomodoro section
-    pomodoro_container, timer, pomodoro_handlers = build_pomodoro_section(page, theme)
-
     # Tasks tab content
     tasks_content = ft.Column(
         [
             input_container,
             ft.Container(
-                content=ft.Text("📝 Your Tasks", size=18, weight="bold", color=theme["text_primary"]),
+                content=bind(theme, ft.Text("📝 Your Tasks", size=18, weight="bold", color=theme["text_primary"]), color="text_primary"),
                 padding=ft.padding.symmetric(horizontal=16, vertical=12),
                 bgcolor="transparent",
                 border_radius=0,
@@ -42,127 +41,146 @@ def build_tabs(page: ft.Page, theme_state: dict):
         scroll=ft.ScrollMode.AUTO,
     )
 
-    # Pomodoro tab content
-    pomodoro_content = ft.Column(
-        [
-            ft.Container(
-                content=ft.Text("⏲️ Pomodoro Timer", size=18, weight="bold", color=theme["text_primary"]),
-                padding=ft.padding.symmetric(horizontal=16, vertical=12),
-                bgcolor="transparent",
-                border_radius=0,
-                margin=ft.margin.only(left=16, right=16, top=20, bottom=12),
-            ),
-            pomodoro_container,
-        ],
-        spacing=0,
-        scroll=ft.ScrollMode.AUTO,
-    )
+    def build_pomodoro_content():
+        """Pomodoro tab: timer plus focus statistics (built on first selection)."""
+        # Build pomodoro section
+        pomodoro_container, timer, pomodoro_handlers = build_pomodoro_section(page, theme)
+        stats_container, stats_handlers = build_stats_section(page, theme)
 
-    # Theme selector dropdown
-    theme_dropdown = ft.Dropdown(
-        label="Theme",
-        options=[ft.dropdown.Option(name) for name in THEME_NAMES],
-        value=THEME_NAMES[THEME_KEYS.index(theme_state.get("current_theme", "light_blue"))],
-        width=150,
-        filled=True,
-        bgcolor=theme["surface"],
-        border_color=theme["border"],
-        text_size=13,
-    )
+        # Pomodoro tab content
+        pomodoro_content = ft.Column(
+            [
+                ft.Container(
+                    content=bind(theme, ft.Text("⏲️ Pomodoro Timer", size=18, weight="bold", color=theme["text_primary"]), color="text_primary"),
+                    padding=ft.padding.symmetric(horizontal=16, vertical=12),
+                    bgcolor="transparent",
+                    border_radius=0,
+                    margin=ft.margin.only(left=16, right=16, top=20, bottom=12),
+                ),
+                pomodoro_container,
+                stats_container,
+            ],
+            spacing=0,
+            scroll=ft.ScrollMode.AUTO,
+        )
+        return pomodoro_content
 
-    def on_theme_change(e):
-        """Handle theme change."""
-        selected_name = theme_dropdown.value
-        theme_index = THEME_NAMES.index(selected_name)
-        theme_key = THEME_KEYS[theme_index]
-        if hasattr(page, 'apply_theme'):
-            page.apply_theme(theme_key)
+    def build_settings_content():
+        """Settings tab: appearance, Pomodoro durations and diagnostics (built on first selection)."""
+        diagnostics_container, diagnostics_handlers = build_diagnostics_section(page, theme)
 
-    theme_dropdown.on_change = on_theme_change
+        # Theme selector dropdown
+        theme_dropdown = ft.Dropdown(
+            label="Theme",
+            options=[ft.dropdown.Option(name) for name in THEME_NAMES],
+            value=THEME_NAMES[THEME_KEYS.index(theme_state.get("current_theme", "light_blue"))],
+            width=150,
+            filled=True,
+            bgcolor=theme["surface"],
+            border_color=theme["border"],
+            text_size=13,
+        )
+        bind(theme, theme_dropdown, bgcolor="surface", border_color="border")
 
-    # Settings tab content
-    settings_content = ft.Column(
-        [
-            ft.Container(
-                content=ft.Text("⚙️ Settings", size=18, weight="bold", color=theme["text_primary"]),
-                padding=ft.padding.symmetric(horizontal=16, vertical=12),
-                bgcolor="transparent",
-                border_radius=0,
-                margin=ft.margin.only(left=16, right=16, top=20, bottom=12),
-            ),
-            ft.Container(
-                content=ft.Column(
-                    [
-                        ft.Text("Appearance", size=15, weight="bold", color=theme["text_primary"]),
-                        ft.Divider(height=1, color=theme["border"]),
-                        ft.Row(
-                            [
-                                ft.Text("Theme", size=13, color=theme["text_secondary"]),
-                                theme_dropdown,
-                            ],
-                            alignment="spaceBetween",
-                            spacing=10,
-                        ),
-                        ft.Divider(height=1, color=theme["border"]),
-                        ft.Text("Pomodoro Duration", size=15, weight="bold", color=theme["text_primary"]),
-                        ft.Divider(height=1, color=theme["border"]),
-                        ft.Row(
-                            [
-                                ft.Text("Work (minutes):", size=12, color=theme["text_secondary"]),
-                                ft.TextField(
-                                    value="25",
-                                    width=80,
-                                    input_filter=ft.NumbersOnlyInputFilter(),
-                                    border_color=theme["border"],
-                                    focused_border_color=theme["primary"],
-                                    bgcolor=theme["surface"],
-                                    text_size=12,
-                                ),
-                            ],
-                            spacing=10,
-                        ),
-                        ft.Row(
-                            [
-                                ft.Text("Break (minutes):", size=12, color=theme["text_secondary"]),
-                                ft.TextField(
-                                    value="5",
-                                    width=80,
-                                    input_filter=ft.NumbersOnlyInputFilter(),
-                                    border_color=theme["border"],
-                                    focused_border_color=theme["primary"],
-                                    bgcolor=theme["surface"],
-                                    text_size=12,
-                                ),
-                            ],
-                            spacing=10,
-                        ),
-                        ft.Divider(height=1, color=theme["border"]),
-                        ft.ElevatedButton(
-                            "Save Settings",
-                            width=200,
-                            bgcolor=theme["primary"],
-                            color="white",
-                            elevation=2,
-                        ),
-                    ],
-                    spacing=14,
-                ),
-                padding=20,
-                bgcolor=theme["surface"],
-                border_radius=12,
-                margin=ft.margin.only(left=16, right=16, bottom=16),
-                border=ft.border.all(1, theme["border"]),
-                shadow=ft.BoxShadow(
-                    spread_radius=0,
-                    blur_radius=4,
-                    color="rgba(0, 0, 0, 0.08)",
-                    offset=ft.Offset(0, 2),
+        def on_theme_change(e):
+            """Handle theme change."""
+            selected_name = theme_dropdown.value
+            theme_index = THEME_NAMES.index(selected_name)
+            theme_key = THEME_KEYS[theme_index]
+            if hasattr(page, 'apply_theme'):
+                page.apply_theme(theme_key)
+
+        theme_dropdown.on_change = on_theme_change
+
+        # Settings tab content
+        settings_content = ft.Column(
+            [
+                ft.Container(
+                    content=bind(theme, ft.Text("⚙️ Settings", size=18, weight="bold", color=theme["text_primary"]), color="text_primary"),
+                    padding=ft.padding.symmetric(horizontal=16, vertical=12),
+                    bgcolor="transparent",
+                    border_radius=0,
+                    margin=ft.margin.only(left=16, right=16, top=20, bottom=12),
                 ),
-            ),
-        ],
-        spacing=0,
-        scroll=ft.ScrollMode.AUTO,
-    )
+                bind(theme, ft.Container(
+                    content=ft.Column(
+                        [
+                            bind(theme, ft.Text("Appearance", size=15, weight="bold", color=theme["text_primary"]), color="text_primary"),
+                            bind(theme, ft.Divider(height=1, color=theme["border"]), color="border"),
+                            ft.Row(
+                                [
+                                    bind(theme, ft.Text("Theme", size=13, color=theme["text_secondary"]), color="text_secondary"),
+                                    theme_dropdown,
+                                ],
+                                alignment="spaceBetween",
+                                spacing=10,
+                            ),
+                            bind(theme, ft.Divider(height=1, color=theme["border"]), color="border"),
+                            bind(theme, ft.Text("Pomodoro Duration", size=15, weight="bold", color=theme["text_primary"]), color="text_primary"),
+                            bind(theme, ft.Divider(height=1, color=theme["border"]), color="border"),
+                            ft.Row(
+                                [
+                                    bind(theme, ft.Text("Work (minutes):", size=12, color=theme["text_secondary"]), color="text_secondary"),
+                                    bind(theme, ft.TextField(
+                                        value="25",
+                                        width=80,
+                                        input_filter=ft.NumbersOnlyInputFilter(),
+                                        border_color=theme["border"],
+                                        focused_border_color=theme["primary"],
+                                        bgcolor=theme["surface"],
+                                        text_size=12,
+                                    ), border_color="border", focused_border_color="primary", bgcolor="surface"),
+                                ],
+                                spacing=10,
+                            ),
+                            ft.Row(
+                                [
+                                    bind(theme, ft.Text("Break (minutes):", size=12, color=theme["text_secondary"]), color="text_secondary"),
+                                    bind(theme, ft.TextField(
+                                        value="5",
+                                        width=80,
+                                        input_filter=ft.NumbersOnlyInputFilter(),
+                                        border_color=theme["border"],
+                                        focused_border_color=theme["primary"],
+                                        bgcolor=theme["surface"],
+                                        text_size=12,
+                                    ), border_color="border", focused_border_color="primary", bgcolor="surface"),
+                                ],
+                                spacing=10,
+                            ),
+                            bind(theme, ft.Divider(height=1, color=theme["border"]), color="border"),
+                            bind(theme, ft.ElevatedButton(
+                                "Save Settings",
+                                width=200,
+                                bgcolor=theme["primary"],
+                                color="white",
+                                elevation=2,
+                            ), bgcolor="primary"),
+                        ],
+                        spacing=14,
+                    ),
+                    padding=20,
+                    bgcolor=theme["surface"],
+                    border_radius=12,
+                    margin=ft.margin.only(left=16, right=16, bottom=16),
+                    border=ft.border.all(1, theme["border"]),
+                    shadow=ft.BoxShadow(
+                        spread_radius=0,
+                        blur_radius=4,
+                        color="rgba(0, 0, 0, 0.08)",
+                        offset=ft.Offset(0, 2),
+                    ),
+                ), bgcolor="surface", border=lambda t: ft.border.all(1, t["border"])),
+                diagnostics_container,
+            ],
+            spacing=0,
+            scroll=ft.ScrollMode.AUTO,
+        )
+        return settings_content
+
+    # Only the Tasks tab is built up front; the others are built on first
+    # selection and kept, so they stay off the path to the first frame
+    lazy_builders = {1: build_pomodoro_content, 2: build_settings_content}
 
     # Create tabs with modern styling
     tabs = ft.Tabs(
@@ -178,15 +196,28 @@ def build_tabs(page: ft.Page, theme_state: dict):
             ),
             ft.Tab(
                 text="⏲️ Pomodoro",
-                content=pomodoro_content,
+                content=ft.Container(),
             ),
             ft.Tab(
                 text="⚙️ Settings",
-                content=settings_content,
+                content=ft.Container(),
             ),
         ],
         expand=True,
     )
+    bind(theme, tabs, indicator_color="primary", label_color="text_secondary", unselected_label_color="text_secondary")
+
+    def on_tab_change(e):
+        """Build a tab's content the first time it is selected."""
+        builder = lazy_builders.pop(tabs.selected_index, None)
+        if builder is None:
+            return
+        tab = tabs.tabs[tabs.selected_index]
+        tab.content = builder()
+        # Send just this tab, not the task list in the other one
+        page.update(tab)
+
+    tabs.on_change = on_tab_change
 
     return tabs
     return tabs
@@ -2,26 +2,28 @@
 Task list UI component: displays tasks in elegant cards with date info.
 """
 import flet as ft
-from typing import Callable, List, Dict, Any
-from core.utils import format_date, is_overdue, is_today
+from typing import Any, Callable, Dict, Iterable, Optional
+from core.utils import OVERDUE, TODAY, classify_deadlines, deadline_status, format_date
 
 
 def build_task_card(
     task: Dict[str, Any],
-    index: int,
-    on_toggle: Callable[[int, bool], None],
-    on_delete: Callable[[int], None],
-    on_click: Callable[[int], None],
+    task_id: Any,
+    on_toggle: Callable[[Any, bool], None],
+    on_delete: Callable[[Any], None],
+    on_click: Callable[[Any], None],
+    status: Optional[str] = None,
 ) -> ft.Container:
     """
     Build a single task card with modern styling.
     
     Args:
         task: task object
-        index: task index in list
+        task_id: stable task id passed to the callbacks
         on_toggle: callback when checkbox toggled
         on_delete: callback when delete button clicked
         on_click: callback when task card clicked (for dialog)
+        status: precomputed deadline status from classify_deadlines (computed if omitted)
     
     Returns:
         A styled Container representing the task card
@@ -33,10 +35,12 @@ def build_task_card(
     # Determine date display and color
     date_text = format_date(date)
     if date:
-        if is_overdue(date):
+        if status is None:
+            status = deadline_status(date)
+        if status == OVERDUE:
             date_color = "#ef5350"  # red for overdue
             date_label = f"📌 {date_text} (Overdue)"
-        elif is_today(date):
+        elif status == TODAY:
             date_color = "#42a5f5"  # blue for today
             date_label = f"📅 {date_text} (Today)"
         else:
@@ -59,7 +63,7 @@ def build_task_card(
                     [
                         ft.Checkbox(
                             value=done,
-                            on_change=lambda e, i=index: on_toggle(i, e.control.value),
+                            on_change=lambda e, i=task_id: on_toggle(i, e.control.value),
                             fill_color="#7c3aed" if not done else "#a78bfa",
                         ),
                         ft.Column(
@@ -79,7 +83,7 @@ def build_task_card(
                                         color=date_color,
                                         weight="w400",
                                     ),
-                                    on_tap=lambda e, i=index: on_click(i),
+                                    on_tap=lambda e, i=task_id: on_click(i),
                                 ),
                             ],
                             expand=True,
@@ -89,7 +93,7 @@ def build_task_card(
                             icon=ft.Icons.DELETE_OUTLINE,
                             icon_color="#ef5350",
                             icon_size=18,
-                            on_click=lambda e, i=index: on_delete(i),
+                            on_click=lambda e, i=task_id: on_delete(i),
                         ),
                     ],
                     alignment="spaceBetween",
@@ -135,26 +139,29 @@ def _on_card_hover(e):
 
 
 def build_task_list(
-    tasks: List[Dict[str, Any]],
-    on_toggle: Callable[[int, bool], None],
-    on_delete: Callable[[int], None],
-    on_click: Callable[[int], None],
+    tasks: Iterable[Dict[str, Any]],
+    on_toggle: Callable[[Any, bool], None],
+    on_delete: Callable[[Any], None],
+    on_click: Callable[[Any], None],
 ) -> ft.Column:
     """
     Build the task list column with all task cards.
     
     Args:
         tasks: list of task objects
-        on_toggle: callback when task checkbox toggled
-        on_delete: callback when delete button clicked
-        on_click: callback when task clicked
+        on_toggle: callback when task checkbox toggled (receives task id, value)
+        on_delete: callback when delete button clicked (receives task id)
+        on_click: callback when task clicked (receives task id)
     
     Returns:
         A Column containing all task cards
     """
+    tasks = list(tasks)
+    # Classify every deadline in one pass against a single "today"
+    statuses = classify_deadlines(task.get("date") for task in tasks)
     task_cards = []
-    for i, task in enumerate(tasks):
-        card = build_task_card(task, i, on_toggle, on_delete, on_click)
+    for i, (task, status) in enumerate(zip(tasks, statuses)):
+        card = build_task_card(task, task.get("id", i), on_toggle, on_delete, on_click, status=status)
         task_cards.append(card)
 
     return ft.Column(
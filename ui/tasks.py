@@ -4,12 +4,50 @@ Features:
 - Preconfigured subject options (mata kuliah) as a Dropdown.
 - Subject-colored accents for task cards.
 - View switcher: "By Deadline" / "By Subject".
+- Virtualized list for large task sets: only the visible window is built.
+- Per-task focus timers: any number of cards can count down at once.
+- Search box filtering by title, description and subject (inverted index).
+- Background loading: the section shows placeholder cards until the tasks
+  (streamed in batches on a worker thread once it is mounted) arrive, with
+  a progress bar for large stores.
+- Shared store: every session (browser tab) shows the one process-wide task
+  list from core.store and re-renders when another session changes it.
 """
+import asyncio
+import threading
+from bisect import bisect_right
+
 import flet as ft
-from core.storage import load_tasks, save_tasks
+from core import instrument
+from core.indexes import GroupIndex
+from core.pomodoro import FocusTimers
+from core.search import SearchIndex
+from core.sessions import ABORTED, COMPLETED, log_session
+from core.store import get_task_store
+from ui.lifecycle import on_session_close
+from ui.theme import bind, unbind
 
 BORDER_RADIUS = 12
 
+# Virtualized list: above this many tasks only the rows in the scroll window
+# (plus OVERSCAN_ROWS on each side) exist as controls. Rows have fixed extents
+# so the window can be located by bisecting cumulative offsets.
+VIRTUALIZE_THRESHOLD = 200
+OVERSCAN_ROWS = 6
+VIEWPORT_HEIGHT = 640
+HEADER_EXTENT = 36
+CARD_HEIGHT = 118
+CARD_EXTENT = CARD_HEIGHT + 10  # card plus its bottom margin
+
+# Placeholder cards shown while the tasks load
+SKELETON_CARDS = 3
+
+# Length of a per-task focus timer (minutes)
+FOCUS_MINUTES = 25
+
+# Quiet period after the last keystroke before the search runs (seconds)
+SEARCH_DEBOUNCE = 0.15
+
 # Preconfigured subjects (mata kuliah)
 SUBJECT_OPTIONS = [
     "Data Sains",
@@ -33,12 +71,49 @@ SUBJECT_COLORS = {
     "Sistem Tertanam": "#8d6e63",
 }
 
+SUBJECT_ORDER = {s: i for i, s in enumerate(SUBJECT_OPTIONS)}
+
+
+def deadline_group(task):
+    """Group key for "By Deadline"."""
+    return task.get("deadline") or "No deadline"
+
+
+def deadline_sort_key(deadline):
+    """Dates ascending, "No deadline" last."""
+    return (1, "") if deadline == "No deadline" else (0, deadline)
+
+
+def subject_group(task):
+    """Group key for "By Subject" (None = Uncategorized)."""
+    subject = task.get("mata_kuliah", "")
+    return subject if subject in SUBJECT_ORDER else None
+
+
+def subject_sort_key(subject):
+    """SUBJECT_OPTIONS order, Uncategorized last."""
+    return SUBJECT_ORDER.get(subject, len(SUBJECT_ORDER))
+
 
 def build_task_section(page: ft.Page, theme: dict):
     """Build task input UI and task list with grouping options."""
-    tasks = load_tasks()
+    store = get_task_store()
+    tasks = store.tasks
     selected_deadline = None
 
+    # Groupings for both views, shared by every session and maintained by
+    # the task list on every mutation
+    deadline_index = store.index("deadline", lambda: GroupIndex(deadline_group, deadline_sort_key))
+    subject_index = store.index("subject", lambda: GroupIndex(subject_group, subject_sort_key))
+
+    # The first session to mount its section loads the store in batches on a
+    # worker thread; later sessions render from memory, so building the
+    # section never touches the disk. Records and indexes are copy-on-write,
+    # so renders read them without locking; render_lock only keeps this
+    # session's renders (handlers, scrolling, store broadcasts) apart.
+    render_lock = threading.RLock()
+    session = {"connected": False}
+
     # Fields
     task_title = ft.TextField(
         label="Task Title",
@@ -102,41 +177,157 @@ def build_task_section(page: ft.Page, theme: dict):
         text_size=13,
     )
 
+    search_field = ft.TextField(
+        hint_text="Search tasks",
+        prefix_icon=ft.Icons.SEARCH,
+        width=220,
+        height=40,
+        text_size=13,
+        filled=True,
+        fill_color=theme["surface"],
+        border_color=theme["border"],
+        focused_border_color=theme["primary"],
+        content_padding=ft.padding.symmetric(horizontal=10, vertical=6),
+    )
+
+    # Search state: the index is attached on the first query, so startup does
+    # not pay for tokenizing every description
+    search = {"query": "", "index": None, "generation": 0}
+
+    # Inputs follow theme switches in place
+    def input_text_style(t):
+        return ft.TextStyle(size=14, color=t["text_primary"])
+
+    def input_label_style(t):
+        return ft.TextStyle(color=t["text_secondary"], size=13)
+
+    for field in (task_title, deskripsi):
+        bind(theme, field, text_style=input_text_style, label_style=input_label_style, fill_color="surface",
+             border_color="border", focused_border_color="primary", color="text_primary")
+    bind(theme, mata_kuliah, text_style=input_text_style, fill_color="surface", border_color="border", focused_border_color="primary")
+    for option in mata_kuliah.options:
+        bind(theme, option, text_style=input_text_style)
+    bind(theme, deadline_display, color="text_primary")
+    bind(theme, add_button, bgcolor="primary")
+    bind(theme, view_dropdown, bgcolor="surface", border_color="border")
+    bind(theme, search_field, fill_color="surface", border_color="border", focused_border_color="primary")
+
     tasks_column = ft.Column(spacing=12)
 
+    # Loading state: placeholder cards until the first batch is in, then a
+    # progress bar while the rest of a large store loads
+    def skeleton_bar(width, height):
+        return bind(theme, ft.Container(width=width, height=height, bgcolor=theme["border"], border_radius=4), bgcolor="border")
+
+    def skeleton_card():
+        """Grey stand-in for a task card."""
+        card = ft.Container(
+            content=ft.Column([skeleton_bar(180, 14), skeleton_bar(120, 10), skeleton_bar(90, 10)], spacing=10),
+            height=CARD_HEIGHT,
+            padding=16,
+            margin=ft.margin.only(bottom=10),
+            border_radius=8,
+            bgcolor=theme["surface"],
+        )
+        return bind(theme, card, bgcolor="surface")
+
+    tasks_column.controls = [skeleton_card() for _ in range(SKELETON_CARDS)]
+    load_status = bind(theme, ft.Text("Loading tasks…", size=12, color=theme["text_secondary"]), color="text_secondary")
+    load_progress = bind(theme, ft.ProgressBar(value=None, color=theme["primary"], bgcolor=theme["border"]), color="primary", bgcolor="border")
+    loading_row = ft.Column([load_status, load_progress], spacing=4, visible=False)
+
+    # Keyed render caches: one card per task (keyed by task id) and one
+    # header per group, so a mutation only sends the controls that changed.
+    card_cache = {}
+    header_cache = {}
+    # Cards and headers built or patched by the current render pass (instrumentation)
+    rendered = {"controls": 0}
+
+    # Virtualized mode state: the groups plus, per group, its first row index
+    # and top scroll offset (rows have fixed extents); the viewport scrolls on its own.
+    virtual = {"enabled": False, "groups": [], "starts": [0], "tops": [0], "pixels": 0.0, "height": VIEWPORT_HEIGHT, "sticky": None}
+    top_spacer = ft.Container(height=0)
+    bottom_spacer = ft.Container(height=0)
+    sticky_header = ft.Text("", size=14, weight="bold")
+    bind(theme, sticky_header, color=lambda t: None if virtual["sticky"] is None else header_color(virtual["sticky"], t))
+    viewport = ft.Column(spacing=0, height=VIEWPORT_HEIGHT, scroll=ft.ScrollMode.AUTO, on_scroll_interval=50)
+
+    # Focus timers live on one timing wheel, keyed by task id; cards only
+    # display them, so a timer survives its card being re-rendered or pruned.
+    focus_timers = FocusTimers()
+    focus_done = set()  # task ids whose focus timer completed
+
     # Helpers
-    def render_task_card(i, task):
+    def task_signature(task):
+        """Values a card displays, done last; a changed signature means the card needs patching."""
+        return (
+            task.get("title", "Untitled"),
+            task.get("mata_kuliah", ""),
+            task.get("deadline", "No deadline"),
+            task.get("deskripsi", ""),
+            task.get("done", False),
+        )
+
+    def render_task_card(task):
         title_text = task.get("title", "Untitled")
         subject = task.get("mata_kuliah", "")
         deadline_text = task.get("deadline", "No deadline")
         desc = task.get("deskripsi", "")
         done = task.get("done", False)
 
-        accent = SUBJECT_COLORS.get(subject, theme.get("primary"))
+        # Card colors are bound to the live theme, so a theme switch restyles
+        # cached cards in place; unbind_card releases them when a card is dropped
+        themed = []
 
-        details = [
+        def themed_control(control, **attrs):
+            themed.append(control)
+            return bind(theme, control, **attrs)
+
+        def accent(t):
+            return SUBJECT_COLORS.get(subject, t["primary"])
+
+        checkbox = ft.Checkbox(value=done, on_change=lambda e: toggle_task(task_id), fill_color=theme["primary"])
+        # The checkbox holds the current done flag (get_card patches it)
+        title = themed_control(
             ft.Text(title_text, size=15, color=theme["text_secondary"] if done else theme["text_primary"], weight="bold"),
-        ]
+            color=lambda t: t["text_secondary"] if checkbox.value else t["text_primary"],
+        )
+        details = [title]
         if subject:
-            details.append(ft.Text(f"📚 {subject}", size=12, color=theme["text_secondary"], weight="w500"))
-        details.append(ft.Text(f"📅 {deadline_text}", size=12, color=theme["danger"], weight="w500"))
+            details.append(themed_control(ft.Text(f"📚 {subject}", size=12, color=theme["text_secondary"], weight="w500"), color="text_secondary"))
+        details.append(themed_control(ft.Text(f"📅 {deadline_text}", size=12, color=theme["danger"], weight="w500"), color="danger"))
         if desc:
-            details.append(ft.Text(desc, size=12, color=theme["text_secondary"], max_lines=2))
+            details.append(themed_control(ft.Text(desc, size=12, color=theme["text_secondary"], max_lines=2), color="text_secondary"))
+
+        # Callbacks capture the stable task id, so cards stay valid across unrelated mutations
+        task_id = task["id"]
+        focus_label = themed_control(ft.Text(focus_text(task_id), size=12, color=theme["primary"], weight="w500"), color="primary")
 
         task_details = ft.Column(details, expand=True, spacing=6)
 
-        delete_btn = ft.IconButton(icon=ft.Icons.DELETE_OUTLINE, icon_color=theme["danger"], on_click=lambda e, idx=i: delete_task(idx))
-        checkbox = ft.Checkbox(value=done, on_change=lambda e, idx=i: toggle_task(idx), fill_color=theme["primary"])
+        focus_btn = themed_control(ft.IconButton(
+            icon=ft.Icons.TIMER_OFF_OUTLINED if task_id in focus_timers else ft.Icons.TIMER_OUTLINED,
+            icon_color=theme["primary"],
+            tooltip="Focus timer",
+            on_click=lambda e: toggle_focus(task_id),
+        ), icon_color="primary")
+        delete_btn = themed_control(ft.IconButton(icon=ft.Icons.DELETE_OUTLINE, icon_color=theme["danger"], on_click=lambda e: delete_task(task_id)),
+                                    icon_color="danger")
+        themed_control(checkbox, fill_color="primary")
+
+        # Focus countdown sits under the action buttons so card height stays fixed
+        actions = ft.Column([ft.Row([focus_btn, delete_btn], spacing=0), focus_label], spacing=0, horizontal_alignment="end")
 
-        card_inner = ft.Row([checkbox, task_details, delete_btn], alignment="spaceBetween", spacing=12)
+        card_inner = ft.Row([checkbox, task_details, actions], alignment="spaceBetween", spacing=12)
 
         card = ft.Row([
-            ft.Container(width=6, bgcolor=accent),
-            ft.Container(content=card_inner, padding=12, bgcolor=theme["surface"], border_radius=BORDER_RADIUS, expand=True)
+            themed_control(ft.Container(width=6, bgcolor=accent(theme)), bgcolor=accent),
+            themed_control(ft.Container(content=card_inner, padding=12, bgcolor=theme["surface"], border_radius=BORDER_RADIUS, expand=True),
+                           bgcolor="surface"),
         ], spacing=0, alignment="start")
 
-        # Return each task wrapped in a container (boxed card style)
-        return ft.Container(
+        # Each task wrapped in a container (boxed card style)
+        container = ft.Container(
             content=card,
             padding=0,
             margin=ft.margin.only(bottom=10),
@@ -144,48 +335,235 @@ def build_task_section(page: ft.Page, theme: dict):
             bgcolor=theme["surface"],
             shadow=ft.BoxShadow(spread_radius=0, blur_radius=6, color="rgba(0, 0, 0, 0.06)", offset=ft.Offset(0, 2)),
         )
-
-    def build_task_ui():
-        tasks_column.controls.clear()
-        mode = view_dropdown.value
-
-        if mode == "By Deadline":
-            groups = {}
-            for idx, t in enumerate(tasks):
-                d = t.get("deadline", "No deadline")
-                groups.setdefault(d, []).append((idx, t))
-
-            def sort_key(d):
-                return (1, "") if d == "No deadline" else (0, d)
-
-            for d in sorted(groups.keys(), key=sort_key):
-                tasks_column.controls.append(ft.Text(f"📅 {d}", size=14, weight="bold", color=theme.get("primary")))
-                for idx, t in groups[d]:
-                    tasks_column.controls.append(render_task_card(idx, t))
+        bind(theme, container, bgcolor="surface")
+        if virtual["enabled"]:
+            container.height = CARD_HEIGHT
+            container.clip_behavior = ft.ClipBehavior.HARD_EDGE
+        return {"card": container, "checkbox": checkbox, "title": title, "focus": focus_label, "focus_btn": focus_btn,
+                "themed": themed, "sig": task_signature(task)}
+
+    def unbind_card(entry):
+        """Stop restyling a card that is no longer cached."""
+        unbind(theme, entry["card"], *entry["themed"])
+
+    def get_card(task, patched):
+        """Return the cached card for a task, patching it in place if the task changed."""
+        entry = card_cache.get(task["id"])
+        if entry is None:
+            entry = render_task_card(task)
+            card_cache[task["id"]] = entry
+            rendered["controls"] += 1
+            return entry["card"]
+        sig = task_signature(task)
+        if sig != entry["sig"]:
+            if sig[:-1] == entry["sig"][:-1]:
+                # Only the done flag changed: patch the checkbox and title color
+                entry["checkbox"].value = sig[-1]
+                entry["title"].color = theme["text_secondary"] if sig[-1] else theme["text_primary"]
+                entry["sig"] = sig
+            else:
+                # New content in the cached (still bound) container
+                fresh = render_task_card(task)
+                unbind(theme, fresh["card"], *entry["themed"])
+                entry["card"].content = fresh["card"].content
+                entry.update(checkbox=fresh["checkbox"], title=fresh["title"], focus=fresh["focus"], focus_btn=fresh["focus_btn"],
+                             themed=fresh["themed"], sig=sig)
+            patched.append(entry["card"])
+            rendered["controls"] += 1
+        return entry["card"]
+
+    def header_color(key, t):
+        """Color of the header for a (view, group) key in palette ``t``."""
+        view, value = key
+        if view == "deadline":
+            return t["primary"]
+        if value is None:
+            return t["text_primary"]
+        return SUBJECT_COLORS.get(value, t["primary"])
+
+    def get_header(key, label):
+        """Return the cached group header for a (view, group) key."""
+        header = header_cache.get(key)
+        if header is None:
+            header = bind(theme, ft.Text(label, size=14, weight="bold", color=header_color(key, theme)),
+                          color=lambda t: header_color(key, t))
+            if virtual["enabled"]:
+                header = ft.Container(content=header, height=HEADER_EXTENT, alignment=ft.alignment.center_left)
+            header_cache[key] = header
+            rendered["controls"] += 1
+        return header
+
+    def search_matches():
+        """Ids of tasks matching the search box (None when it is empty)."""
+        if search["index"] is None:
+            return None
+        return search["index"].search(search["query"])
+
+    def group_tasks():
+        """Groups for the current view as (header key, label, tasks), read from the indexes."""
+        matches = search_matches()
+        index = deadline_index if view_dropdown.value == "By Deadline" else subject_index
+        # A search groups only its hits (looked up by id), never scanning every task
+        pairs = index.groups() if matches is None else index.subset(tasks.select(matches))
+        if index is deadline_index:
+            return [(("deadline", d), f"📅 {d}", members) for d, members in pairs]
+        return [(("subject", s), "Uncategorized" if s is None else f"📚 {s}", members) for s, members in pairs]
+
+    def reconcile(column, controls):
+        """Replace column children if they differ by identity; return True if changed."""
+        current = column.controls
+        if len(current) == len(controls) and all(a is b for a, b in zip(current, controls)):
+            return False
+        # Flet diffs children by identity, so only inserted, removed or
+        # moved cards and headers are sent
+        column.controls = controls
+        return True
+
+    def prune_cards(live, headers):
+        """Drop cached cards (by task id) and headers (by key) that are no longer rendered."""
+        for key in [k for k in card_cache if k not in live]:
+            unbind_card(card_cache.pop(key))
+        for key in [k for k in header_cache if k not in headers]:
+            header = header_cache.pop(key)
+            unbind(theme, header.content if isinstance(header, ft.Container) else header)
+
+    def set_virtual(enabled):
+        """Switch between the full list and the virtualized window."""
+        if virtual["enabled"] == enabled:
+            return
+        virtual["enabled"] = enabled
+        # Cards and headers use fixed extents in virtual mode, so rebuild them
+        prune_cards(set(), set())
+        viewport.controls = []
+
+    def row_at(pixel):
+        """Index of the virtual row covering a scroll offset."""
+        groups, starts, tops = virtual["groups"], virtual["starts"], virtual["tops"]
+        g = min(max(bisect_right(tops, pixel) - 1, 0), len(groups) - 1)
+        y = pixel - tops[g]
+        j = 0 if y < HEADER_EXTENT else 1 + int((y - HEADER_EXTENT) // CARD_EXTENT)
+        return starts[g] + min(j, len(groups[g][2]))
+
+    def row_top(row):
+        """Scroll offset of a virtual row's top edge."""
+        starts, tops = virtual["starts"], virtual["tops"]
+        g = bisect_right(starts, row) - 1
+        j = row - starts[g]
+        return tops[g] + (0 if j == 0 else HEADER_EXTENT + (j - 1) * CARD_EXTENT)
+
+    def render_window():
+        """Reconcile the viewport with the rows inside the scroll window."""
+        groups, starts, tops = virtual["groups"], virtual["starts"], virtual["tops"]
+        changed = []
+        if not groups:
+            key, label = None, ""
+            controls = []
+            prune_cards(set(), set())
         else:
-            subjects_seen = {s: [] for s in SUBJECT_OPTIONS}
-            others = []
-            for idx, t in enumerate(tasks):
-                s = t.get("mata_kuliah", "")
-                if s in subjects_seen:
-                    subjects_seen[s].append((idx, t))
+            top = virtual["pixels"]
+            first = row_at(top)
+            start = max(first - OVERSCAN_ROWS, 0)
+            end = min(row_at(top + virtual["height"]) + 1 + OVERSCAN_ROWS, starts[-1])
+
+            patched = []
+            controls = [top_spacer]
+            live, headers = set(), set()
+            g = bisect_right(starts, start) - 1
+            for row in range(start, end):
+                while row >= starts[g + 1]:
+                    g += 1
+                key, label, members = groups[g]
+                j = row - starts[g]
+                if j == 0:
+                    controls.append(get_header(key, label))
+                    headers.add(key)
                 else:
-                    others.append((idx, t))
-
-            for s in SUBJECT_OPTIONS:
-                lst = subjects_seen.get(s, [])
-                if not lst:
-                    continue
-                accent = SUBJECT_COLORS.get(s, theme.get("primary"))
-                tasks_column.controls.append(ft.Text(f"📚 {s}", size=14, weight="bold", color=accent))
-                for idx, t in lst:
-                    tasks_column.controls.append(render_task_card(idx, t))
-
-            if others:
-                tasks_column.controls.append(ft.Text("Uncategorized", size=14, weight="bold", color=theme.get("text_primary")))
-                for idx, t in others:
-                    tasks_column.controls.append(render_task_card(idx, t))
-
+                    task = members[j - 1]
+                    controls.append(get_card(task, patched))
+                    live.add(task["id"])
+            controls.append(bottom_spacer)
+            prune_cards(live, headers)
+
+            top_spacer.height = row_top(start)
+            bottom_spacer.height = tops[-1] - (row_top(end) if end < starts[-1] else tops[-1])
+            # Sticky header: the group the first visible row belongs to
+            key, label, _ = groups[bisect_right(starts, first) - 1]
+            changed.extend(patched)
+
+        virtual["sticky"] = key
+        color = None if key is None else header_color(key, theme)
+        if sticky_header.value != label or sticky_header.color != color:
+            sticky_header.value = label
+            sticky_header.color = color
+            changed.append(sticky_header)
+        if reconcile(viewport, controls):
+            changed.append(viewport)
+        return changed
+
+    def counted(name, render):
+        """Run a render pass, recording how many cards and headers it built or patched."""
+        rendered["controls"] = 0
+        changed = render()
+        instrument.record_controls(name, rendered["controls"])
+        return changed
+
+    def on_list_scroll(e):
+        virtual["pixels"] = e.pixels or 0
+        virtual["height"] = e.viewport_dimension or VIEWPORT_HEIGHT
+        with render_lock:
+            changed = counted("tasks.scroll", render_window)
+        refresh(*changed)
+
+    @instrument.timed("tasks.build_task_ui")
+    def build_task_ui():
+        """Reconcile the task list with the tasks; return the controls that need sending."""
+        with render_lock:
+            return counted("tasks.build_task_ui", reconcile_task_list)
+
+    def reconcile_task_list():
+        """build_task_ui without taking render_lock (the caller holds it)."""
+        if not store.first_batch:
+            # The placeholder stays until there is something to show
+            return []
+        groups = group_tasks()
+
+        if len(tasks) > VIRTUALIZE_THRESHOLD:
+            set_virtual(True)
+            # Per-group row and pixel offsets: O(groups), not O(tasks)
+            starts, tops = [0], [0]
+            for _, _, members in groups:
+                starts.append(starts[-1] + 1 + len(members))
+                tops.append(tops[-1] + HEADER_EXTENT + len(members) * CARD_EXTENT)
+            virtual.update(groups=groups, starts=starts, tops=tops)
+            changed = render_window()
+            if reconcile(tasks_column, [sticky_header, viewport]):
+                return [tasks_column]
+            return changed
+
+        set_virtual(False)
+        virtual.update(groups=[], starts=[0], tops=[0])
+        patched = []
+        controls = []
+        live, headers = set(), set()
+        for key, label, group in groups:
+            controls.append(get_header(key, label))
+            headers.add(key)
+            for t in group:
+                controls.append(get_card(t, patched))
+                live.add(t["id"])
+        prune_cards(live, headers)
+
+        if reconcile(tasks_column, controls):
+            return [tasks_column]
+        return patched
+
+    def refresh(*controls):
+        """Send only the given controls to the client."""
+        controls = [c for c in controls if c is not None]
+        if controls:
+            page.update(*controls)
+
+    @instrument.timed("tasks.add_task")
     def add_task(e):
         nonlocal selected_deadline
         title = task_title.value.strip()
@@ -193,8 +571,7 @@ def build_task_section(page: ft.Page, theme: dict):
         desc = deskripsi.value.strip()
         if not title:
             return
-        tasks.append({"title": title, "done": False, "deadline": selected_deadline or "No deadline", "mata_kuliah": subject, "deskripsi": desc})
-        save_tasks(tasks)
+        store.add_task(title, mata_kuliah=subject, deadline=selected_deadline or "No deadline", deskripsi=desc, origin=page)
         task_title.value = ""
         mata_kuliah.value = SUBJECT_OPTIONS[0]
         deskripsi.value = ""
@@ -202,22 +579,106 @@ def build_task_section(page: ft.Page, theme: dict):
         deadline_display.value = "📅 No deadline"
         date_picker.value = None
         task_title.focus()
-        build_task_ui()
-        page.update()
-
-    def toggle_task(index):
-        if 0 <= index < len(tasks):
-            tasks[index]["done"] = not tasks[index]["done"]
-            save_tasks(tasks)
-            build_task_ui()
-            page.update()
-
-    def delete_task(index):
-        if 0 <= index < len(tasks):
-            del tasks[index]
-            save_tasks(tasks)
-            build_task_ui()
-            page.update()
+        refresh(task_title, mata_kuliah, deskripsi, deadline_display, *build_task_ui())
+
+    @instrument.timed("tasks.toggle_task")
+    def toggle_task(task_id):
+        if task_id in tasks:
+            store.toggle_task(task_id, origin=page)
+            refresh(*build_task_ui())
+
+    @instrument.timed("tasks.delete_task")
+    def delete_task(task_id):
+        if task_id in tasks:
+            stop_focus(task_id)
+            focus_done.discard(task_id)
+            store.delete_task(task_id, origin=page)
+            refresh(*build_task_ui())
+
+    def focus_text(task_id):
+        """Focus label for a task: countdown, completion note or nothing."""
+        left = focus_timers.remaining(task_id)
+        if left is not None:
+            mins, secs = divmod(int(left + 0.999), 60)
+            return f"⏱ Focus {mins:02d}:{secs:02d}"
+        return "✨ Focus complete" if task_id in focus_done else ""
+
+    def sync_focus(task_ids):
+        """Patch the focus label and button of the given tasks' rendered cards; return changed controls."""
+        changed = []
+        entries = card_cache.copy()  # may run on the scheduler thread
+        for task_id in task_ids:
+            entry = entries.get(task_id)
+            if entry is None:
+                continue
+            label, button = entry["focus"], entry["focus_btn"]
+            text = focus_text(task_id)
+            if label.value != text:
+                label.value = text
+                changed.append(label)
+            icon = ft.Icons.TIMER_OFF_OUTLINED if task_id in focus_timers else ft.Icons.TIMER_OUTLINED
+            if button.icon != icon:
+                button.icon = icon
+                changed.append(button)
+        return [c for c in changed if c.page is not None]
+
+    def log_focus(task_id, status, seconds):
+        """Record a per-task focus session under the task's subject."""
+        task = tasks.get(task_id) or {}
+        log_session("Focus", status, seconds / 60, mata_kuliah=task.get("mata_kuliah", ""), task_id=task_id)
+
+    def stop_focus(task_id):
+        """Cancel a running focus timer, logging the time spent; return False if none was running."""
+        left = focus_timers.remaining(task_id)
+        if not focus_timers.cancel(task_id):
+            return False
+        elapsed = FOCUS_MINUTES * 60 - (left or 0)
+        if elapsed >= 1:
+            log_focus(task_id, ABORTED, elapsed)
+        return True
+
+    def toggle_focus(task_id):
+        """Start a focus timer for a task, or cancel the one that is running."""
+        if not stop_focus(task_id):
+            focus_done.discard(task_id)
+            focus_timers.start(task_id, FOCUS_MINUTES * 60, on_focus_complete)
+        refresh(*sync_focus([task_id]))
+
+    @instrument.timed("tasks.focus_tick")
+    def on_focus_tick():
+        """Wheel tick (scheduler thread): update the countdowns of rendered cards only."""
+        refresh(*sync_focus(focus_timers.active()))
+
+    def on_focus_complete(task_id):
+        """A task's focus timer expired: log it and report it on that task's card."""
+        log_focus(task_id, COMPLETED, FOCUS_MINUTES * 60)
+        focus_done.add(task_id)
+        refresh(*sync_focus([task_id]))
+
+    def close_focus():
+        """Session closed: stop its timers (logged as aborted) so none fires into the dead page."""
+        focus_timers.on_tick = None
+        for task_id in focus_timers.active():
+            stop_focus(task_id)
+        focus_timers.cancel_all()
+
+    focus_timers.on_tick = on_focus_tick
+    on_session_close(page, close_focus)
+
+    async def on_search_change(e):
+        """Debounced search: only the last keystroke in a burst re-filters the list."""
+        search["generation"] += 1
+        generation = search["generation"]
+        await asyncio.sleep(SEARCH_DEBOUNCE)
+        if generation != search["generation"]:
+            return
+        query = search_field.value or ""
+        if query.strip() and search["index"] is None:
+            search["index"] = store.index("search", SearchIndex)
+        if query == search["query"]:
+            return
+        search["query"] = query
+        refresh(*build_task_ui())
 
     def on_date_selected(e):
         nonlocal selected_deadline
@@ -235,19 +696,47 @@ def build_task_section(page: ft.Page, theme: dict):
     add_button.on_click = add_task
     date_picker.on_change = on_date_selected
     task_title.on_submit = add_task
-    view_dropdown.on_change = lambda e: (build_task_ui(), page.update())
-
-    build_task_ui()
+    view_dropdown.on_change = lambda e: refresh(*build_task_ui())
+    search_field.on_change = on_search_change
+    viewport.on_scroll = on_list_scroll
+
+    def show_progress():
+        """Set the loading row from the store's load progress (or its error)."""
+        if store.error:
+            load_status.value = f"Could not load tasks ({store.error}). Reopen the app to try again."
+            load_progress.visible = False
+            loading_row.visible = True
+            return
+        load_progress.visible = True
+        load_progress.value = store.progress
+        load_status.value = f"Loading tasks… {len(tasks):,}"
+        # Shown only while loading when a batch did not hold everything (large stores)
+        loading_row.visible = not store.loaded.is_set() and store.progress < 1
+
+    def on_store_change(task_ids):
+        """Store broadcast: a load batch, another session's write or another process's change."""
+        with render_lock:
+            show_progress()
+            changed = build_task_ui()
+        refresh(loading_row, *changed)
+
+    def connect_store():
+        """Mount hook: subscribe to the shared store (the first session also starts loading it)."""
+        if not session["connected"]:
+            session["connected"] = True
+            store.connect(page, on_store_change)
+            # Catch up on batches that arrived before the subscription
+            on_store_change(None)
 
     input_container = ft.Container(
         content=ft.Column([
-            ft.Text("Add New Task", size=16, weight="bold", color=theme["text_primary"]),
+            bind(theme, ft.Text("Add New Task", size=16, weight="bold", color=theme["text_primary"]), color="text_primary"),
             # Title full width on its own row
             task_title,
             # Subject full width on its own row
             mata_kuliah,
             deskripsi,
-            ft.Row([ft.IconButton(icon=ft.Icons.CALENDAR_TODAY, icon_color=theme["primary"], on_click=open_date_picker), deadline_display, ft.Container(expand=True), add_button], alignment="spaceBetween", spacing=10, vertical_alignment="center"),
+            ft.Row([bind(theme, ft.IconButton(icon=ft.Icons.CALENDAR_TODAY, icon_color=theme["primary"], on_click=open_date_picker), icon_color="primary"), deadline_display, ft.Container(expand=True), add_button], alignment="spaceBetween", spacing=10, vertical_alignment="center"),
         ], spacing=12),
         padding=20,
         bgcolor=theme["surface"],
@@ -256,25 +745,34 @@ def build_task_section(page: ft.Page, theme: dict):
         border=ft.border.all(1, theme["border"]),
         shadow=ft.BoxShadow(spread_radius=0, blur_radius=4, color="rgba(0, 0, 0, 0.08)", offset=ft.Offset(0, 2)),
     )
+    bind(theme, input_container, bgcolor="surface", border=lambda t: ft.border.all(1, t["border"]))
 
     # Task list container: header (Your Tasks + view selector) then boxed list
     header_row = ft.Row(
         [
-            ft.Text("Your Tasks", size=16, weight="bold", color=theme["text_primary"]),
+            bind(theme, ft.Text("Your Tasks", size=16, weight="bold", color=theme["text_primary"]), color="text_primary"),
             ft.Container(expand=True),
+            search_field,
             view_dropdown,
         ],
         alignment="center",
     )
 
     task_list_container = ft.Container(
-        content=ft.Column([header_row, ft.Divider(height=1, color=theme["border"]), tasks_column]),
+        content=ft.Column([header_row, bind(theme, ft.Divider(height=1, color=theme["border"]), color="border"), loading_row, tasks_column]),
         padding=ft.padding.symmetric(horizontal=16, vertical=12),
         bgcolor=theme["surface_alt"],
         border_radius=BORDER_RADIUS,
         margin=ft.margin.only(left=16, right=16, bottom=16),
     )
+    bind(theme, task_list_container, bgcolor="surface_alt")
+    task_list_container.did_mount = connect_store
+    if store.first_batch:
+        # Joining a store that is already loaded (or loading): render from memory
+        show_progress()
+        build_task_ui()
 
-    handler_dict = {"add_task": add_task, "toggle_task": toggle_task, "delete_task": delete_task, "build_task_ui": build_task_ui, "tasks": tasks}
+    handler_dict = {"add_task": add_task, "toggle_task": toggle_task, "delete_task": delete_task, "build_task_ui": build_task_ui, "tasks": tasks,
+                    "render_task_card": render_task_card, "view_dropdown": view_dropdown, "loaded": store.loaded}
 
     return input_container, task_list_container, deadline_display, handler_dict
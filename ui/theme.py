@@ -74,3 +74,61 @@ def get_theme(theme_key: str) -> dict:
 def get_all_themes() -> dict:
     """Get all available themes."""
     return THEMES
+
+
+class LiveTheme(dict):
+    """
+    Theme palette that can be switched in place.
+
+    Builders read colors from it like a plain theme dict and register the
+    control properties that depend on it with ``bind``. ``switch`` swaps the
+    palette and restyles those controls, so the layout is never rebuilt.
+    Controls that are discarded (e.g. pruned task cards) are ``unbind``-ed.
+    """
+
+    def __init__(self, theme_key: str):
+        super().__init__(get_theme(theme_key))
+        self.key = theme_key
+        self._bindings = {}  # id(control) -> (control, attrs)
+        self._hooks = []
+
+    def switch(self, theme_key: str) -> None:
+        """Load another palette and restyle every bound control."""
+        self.key = theme_key
+        self.clear()
+        self.update(get_theme(theme_key))
+        for control, attrs in self._bindings.values():
+            for attr, value in attrs.items():
+                setattr(control, attr, value(self) if callable(value) else self[value])
+        for hook in self._hooks:
+            hook()
+
+
+def bind(theme: dict, control, **attrs):
+    """
+    Register control properties that follow the theme and return the control.
+
+    Each keyword maps a property name to a theme key (e.g. ``color="text_primary"``)
+    or to a callable taking the theme, for composite values like borders and
+    text styles. Plain theme dicts are accepted and ignored.
+    """
+    if isinstance(theme, LiveTheme):
+        bound = theme._bindings.get(id(control))
+        if bound is None:
+            theme._bindings[id(control)] = (control, attrs)
+        else:
+            bound[1].update(attrs)
+    return control
+
+
+def unbind(theme: dict, *controls) -> None:
+    """Stop restyling ``controls`` on theme switches (for controls that are discarded)."""
+    if isinstance(theme, LiveTheme):
+        for control in controls:
+            theme._bindings.pop(id(control), None)
+
+
+def on_theme_change(theme: dict, hook) -> None:
+    """Call ``hook()`` after each switch (for content rendered from the theme on demand)."""
+    if isinstance(theme, LiveTheme):
+        theme._hooks.append(hook)